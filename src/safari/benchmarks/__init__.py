@@ -0,0 +1,3 @@
+"""
+Safari Arcade Game - Soviet slot machine recreation
+"""
@@ -0,0 +1,279 @@
+"""
+Бенчмарк обновления кадра игрового цикла.
+
+Замеряет стадии GameView.on_update по отдельности и весь кадр целиком
+при заданном числе объектов на каждой дорожке:
+- spawners: обновление создателей животных и препятствий
+- hunter: Hunter.check_for_obstacles и Hunter.on_update
+- bullets: BulletManager.update
+- collisions: CollisionSystem.update (обычный и предсказывающий режимы)
+- indicators: полная пересинхронизация индикаторов выстрелов и убитых животных
+  (в игре индикаторы меняются только по событиям ShotFired и AnimalKilled)
+- frame: GameSession.update с индикаторами, подписанными на события (весь кадр без отрисовки)
+
+Результаты сохраняются в JSON и сравниваются с базовой линией:
+    uv run -m src.safari.benchmarks.frame_update              # замер и сравнение
+    uv run -m src.safari.benchmarks.frame_update --save       # обновить базовую линию
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+from ..constants import (
+    BENCHMARK_BASELINE_PATH,
+    BENCHMARK_TOLERANCE,
+    BULLET_SPEED_X,
+    BULLET_SPEED_Y,
+    BULLET_START_OFFSET_X,
+    BULLET_START_OFFSET_Y,
+)
+from ..events import AnimalKilled, ShotFired
+from ..resource_manager import setup_resources
+from ..simulation.game_session import GameSession
+from ..ui.animal_indicator_manager import AnimalIndicatorManager
+from ..ui.shot_indicator_manager import ShotIndicatorManager
+
+# Число объектов на дорожке и число пуль в полёте по умолчанию
+DEFAULT_COUNTS = (1, 10, 100)
+DEFAULT_FRAMES = 60
+DEFAULT_REPEATS = 5
+DELTA_TIME = 1 / 60
+BENCHMARK_SEED = 2024
+
+STAGES = ("spawners", "hunter", "bullets", "collisions", "collisions_predictive", "indicators", "frame")
+
+
+class FrameScenario:
+    """
+    Раунд с заданным числом объектов на каждой дорожке и пуль в полёте.
+
+    Создатели остановлены, чтобы число объектов не росло во время замера,
+    а раунд не завершается, даже если все цели поражены.
+    """
+
+    def __init__(self, count: int, predictive: bool = False):
+        """
+        Args:
+            count: Объектов на каждой дорожке и пуль в полёте
+            predictive: Предсказывающий режим системы столкновений
+        """
+        self.session = GameSession(seed=BENCHMARK_SEED, predictive_collisions=predictive, endless=True)
+        self.session.setup()
+        self.shot_indicators = ShotIndicatorManager()
+        self.shot_indicators.setup()
+        self.animal_indicators = AnimalIndicatorManager(self.session.lanes)
+        self.animal_indicators.setup()
+        self.session.events.subscribe(ShotFired, self.shot_indicators.on_shot_fired)
+        self.session.events.subscribe(AnimalKilled, self.animal_indicators.on_animal_killed)
+
+        self._populate(count)
+
+    def _populate(self, count: int):
+        """Расставляет объекты равномерно по дорожкам и пули вдоль траектории."""
+        session = self.session
+        session.populate_lanes(count)
+        for spawner in session.spawners:
+            spawner.stop_spawning()
+
+        # Пули вдоль диагонали выстрела, как будто стреляли каждые несколько кадров
+        bullet_manager = session.bullet_manager
+        hunter = session.hunter
+        for flight_time in np.linspace(0.0, 4.0, count).tolist():
+            bullet = bullet_manager.pool.acquire(hunter.center_x, hunter.center_y)
+            bullet.setup()
+            bullet.center_x = hunter.center_x + BULLET_START_OFFSET_X + BULLET_SPEED_X * flight_time
+            bullet.center_y = hunter.center_y + BULLET_START_OFFSET_Y + BULLET_SPEED_Y * flight_time
+            bullet_manager.sprite_list.append(bullet)
+
+    def stage(self, name: str) -> Callable[[], None]:
+        """
+        Возвращает функцию одного кадра стадии.
+
+        Args:
+            name: Имя стадии из STAGES
+        """
+        session = self.session
+
+        def spawners():
+            for spawner in session.spawners:
+                spawner.update(DELTA_TIME)
+
+        def hunter():
+            session.hunter.check_for_obstacles(session.layers["BarrierObstacles"])
+            session.hunter.on_update(DELTA_TIME)
+
+        def bullets():
+            session.bullet_manager.update(DELTA_TIME)
+
+        def collisions():
+            session.collision_system.update(DELTA_TIME)
+
+        def indicators():
+            score = session.score_manager
+            self.shot_indicators.update(session.bullet_manager.shots_fired)
+            self.animal_indicators.update(score.kills)
+
+        def frame():
+            session.update(DELTA_TIME)
+
+        stages = {
+            "spawners": spawners,
+            "hunter": hunter,
+            "bullets": bullets,
+            "collisions": collisions,
+            "collisions_predictive": collisions,
+            "indicators": indicators,
+            "frame": frame,
+        }
+        return stages[name]
+
+
+def time_stage(name: str, count: int, frames: int = DEFAULT_FRAMES, repeats: int = DEFAULT_REPEATS) -> dict:
+    """
+    Замеряет одну стадию.
+
+    Каждый повтор начинается с нового раунда, чтобы число объектов было одинаковым.
+
+    Args:
+        name: Имя стадии из STAGES
+        count: Объектов на каждой дорожке и пуль в полёте
+        frames: Кадров в одном повторе
+        repeats: Количество повторов
+
+    Returns:
+        Медиана, 95-й перцентиль и среднее время кадра стадии в микросекундах
+    """
+    samples = []
+    for _ in range(repeats):
+        scenario = FrameScenario(count, predictive=name == "collisions_predictive")
+        step = scenario.stage(name)
+        for _ in range(frames):
+            start = time.perf_counter()
+            step()
+            samples.append((time.perf_counter() - start) * 1_000_000)
+
+    samples.sort()
+    return {
+        "median_us": round(statistics.median(samples), 2),
+        "p95_us": round(samples[min(int(len(samples) * 0.95), len(samples) - 1)], 2),
+        "mean_us": round(statistics.fmean(samples), 2),
+    }
+
+
+def run_benchmarks(
+    counts=DEFAULT_COUNTS, frames: int = DEFAULT_FRAMES, repeats: int = DEFAULT_REPEATS, stages=STAGES
+) -> dict:
+    """
+    Прогоняет все стадии при всех числах объектов.
+
+    Returns:
+        Результаты в формате базовой линии
+    """
+    results = {}
+    # Сообщения загрузки ресурсов и индикаторов не должны попадать в вывод замера
+    with contextlib.redirect_stdout(io.StringIO()):
+        setup_resources(headless=True)
+        for count in counts:
+            results[str(count)] = {name: time_stage(name, count, frames, repeats) for name in stages}
+
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "frames": frames,
+        "repeats": repeats,
+        "results": results,
+    }
+
+
+def compare_with_baseline(current: dict, baseline: dict, tolerance: float = BENCHMARK_TOLERANCE) -> list[str]:
+    """
+    Находит регрессии относительно базовой линии (по медиане).
+
+    Args:
+        current: Результаты текущего прогона
+        baseline: Сохранённые результаты
+        tolerance: Допустимое относительное замедление (0.5 = на 50%)
+
+    Returns:
+        Список описаний регрессий (пустой, если регрессий нет)
+    """
+    regressions = []
+    for count, stages in current["results"].items():
+        for name, result in stages.items():
+            reference = baseline.get("results", {}).get(count, {}).get(name)
+            if not reference:
+                continue
+            limit = reference["median_us"] * (1 + tolerance)
+            if result["median_us"] > limit:
+                regressions.append(
+                    f"{name} x{count}: {result['median_us']:.1f} мкс > {reference['median_us']:.1f} мкс "
+                    f"(+{tolerance:.0%} допустимо)"
+                )
+    return regressions
+
+
+def format_results(report: dict) -> str:
+    """Таблица результатов для вывода в консоль."""
+    lines = [f"{'Стадия':<24} {'Объектов':>9} {'Медиана, мкс':>13} {'p95, мкс':>10}"]
+    for count, stages in report["results"].items():
+        for name, result in stages.items():
+            lines.append(f"{name:<24} {count:>9} {result['median_us']:>13.1f} {result['p95_us']:>10.1f}")
+    return "\n".join(lines)
+
+
+def dump_report(report: dict) -> str:
+    """JSON результатов в формате хука pretty-format-json (отступ 2, ключи по алфавиту, ASCII)."""
+    return json.dumps(report, indent=2, sort_keys=True) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Запуск бенчмарка из командной строки."""
+    parser = argparse.ArgumentParser(description="Бенчмарк обновления кадра игрового цикла")
+    parser.add_argument("--counts", default=",".join(map(str, DEFAULT_COUNTS)), help="числа объектов через запятую")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="кадров в одном повторе")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="количество повторов")
+    parser.add_argument("--baseline", type=Path, default=BENCHMARK_BASELINE_PATH, help="файл базовой линии")
+    parser.add_argument("--save", action="store_true", help="записать результаты как новую базовую линию")
+    parser.add_argument("--output", type=Path, help="записать результаты в отдельный JSON")
+    args = parser.parse_args(argv)
+
+    counts = [int(count) for count in args.counts.split(",")]
+    report = run_benchmarks(counts, args.frames, args.repeats)
+    print(format_results(report))
+
+    if args.output:
+        args.output.write_text(dump_report(report), encoding="utf-8")
+
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(dump_report(report), encoding="utf-8")
+        print(f"💾 Базовая линия сохранена: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"⚠️ Базовая линия не найдена: {args.baseline} (запустите с --save)")
+        return 0
+
+    regressions = compare_with_baseline(report, json.loads(args.baseline.read_text(encoding="utf-8")))
+    if regressions:
+        print("❌ Регрессии производительности:")
+        for regression in regressions:
+            print(f"   {regression}")
+        return 1
+
+    print("✅ Регрессий нет")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+Прогон сценария без окна с записью кривой времени кадра.
+
+Запускает GameSession со сценарием на заданное число кадров и пишет CSV:
+номер кадра, время обновления кадра и число объектов по дорожкам и пуль.
+По кривой видно, как время кадра растёт вместе с нагрузкой:
+    uv run -m src.safari.benchmarks.scenario_run --scenario stress --frames 600
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from ..resource_manager import setup_resources
+from ..simulation.game_session import GameSession
+from ..simulation.scenario import load_scenario
+
+DELTA_TIME = 1 / 60
+DEFAULT_FRAMES = 600
+DEFAULT_SEED = 2024
+
+CSV_COLUMNS = ("frame", "update_ms", "animals", "palms", "barriers", "bullets")
+
+
+def run_scenario(scenario, frames: int = DEFAULT_FRAMES, seed: int = DEFAULT_SEED) -> list[dict]:
+    """
+    Прогоняет сценарий и замеряет каждый кадр.
+
+    Прогон останавливается раньше, если раунд завершился.
+
+    Args:
+        scenario: Сценарий раунда
+        frames: Максимальное число кадров
+        seed: Зерно раунда
+
+    Returns:
+        Строки кривой по кадрам (ключи из CSV_COLUMNS)
+    """
+    rows = []
+    # Сообщения загрузки ресурсов и индикаторов не должны попадать в вывод замера
+    with contextlib.redirect_stdout(io.StringIO()):
+        setup_resources(headless=True)
+        session = GameSession(game_time=scenario.game_time, seed=seed, endless=scenario.endless, scenario=scenario)
+        session.setup()
+        session.start()
+
+        for frame in range(frames):
+            start = time.perf_counter()
+            session.update(DELTA_TIME)
+            elapsed = time.perf_counter() - start
+
+            rows.append(
+                {
+                    "frame": frame,
+                    "update_ms": round(elapsed * 1000, 3),
+                    "animals": sum(
+                        len(spawner.active_animals)
+                        for spawner in (session.rhino_spawner, session.bizon_spawner, session.gazelle_spawner)
+                    ),
+                    "palms": len(session.palm_spawner.active_palms),
+                    "barriers": len(session.barrier_spawner.active_barriers),
+                    "bullets": len(session.bullet_manager.active_bullets),
+                }
+            )
+            if session.is_over:
+                break
+
+    return rows
+
+
+def write_csv(rows: list[dict], path: Path):
+    """Записывает кривую времени кадра в CSV."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Запуск прогона сценария из командной строки."""
+    parser = argparse.ArgumentParser(description="Прогон сценария без окна с кривой времени кадра")
+    parser.add_argument("--scenario", default="stress", help="имя встроенного сценария или путь к JSON")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="число кадров")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="зерно раунда")
+    parser.add_argument("--output", type=Path, help="файл CSV (по умолчанию <сценарий>_frames.csv)")
+    args = parser.parse_args(argv)
+
+    scenario = load_scenario(args.scenario)
+    rows = run_scenario(scenario, args.frames, args.seed)
+    output = args.output or Path(f"{scenario.name}_frames.csv")
+    write_csv(rows, output)
+
+    times = sorted(row["update_ms"] for row in rows)
+    print(f"🧪 Сценарий: {scenario.name} — {len(rows)} кадров")
+    print(f"   Медиана: {statistics.median(times):.2f} мс, максимум: {times[-1]:.2f} мс")
+    print(f"💾 Кривая времени кадра: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,91 +1,297 @@
 """
 Упрощенная система столкновений.
 Проверяет столкновения пуль с различными целями.
+
+Два режима:
+- Обычный: каждую пулю на каждом кадре проверяем с дорожками, вертикальную
+  полосу которых пересекает её хитбокс (broadphase по дорожкам)
+- Предсказывающий: интервалы возможного попадания вычисляются аналитически
+  при выстреле или появлении новой цели, а на кадре точно проверяются только
+  пары "пуля-цель", чей интервал наступил. Расписание дополняется, а не
+  строится заново: выстрел добавляет интервалы новой пули, появление —
+  интервалы новой цели, а попадание пересчитывает только пули, летевшие
+  в исчезнувшую цель
 """
 
+import heapq
+import itertools
+import logging
+from collections.abc import Callable
+
 import arcade
 
-from ..entities.animals.bizon.bizon import Bizon
-from ..entities.animals.gazelle.gazelle import Gazelle
-from ..entities.animals.rhino.rhino import Rhino
+from ..events import AnimalKilled, EventBus
 from ..resource_manager import Textures
+from ..scheduler import Scheduler
+from .hit_prediction import lane_hit_windows
+
+logger = logging.getLogger(__name__)
+
+# Допуск по времени для границ интервалов попадания (секунды)
+WINDOW_EPSILON = 1e-6
 
 
 class CollisionSystem:
-    def __init__(self):
+    def __init__(
+        self,
+        predictive: bool = False,
+        broadphase: bool = True,
+        events: EventBus | None = None,
+        scheduler: Scheduler | None = None,
+    ):
+        """
+        Args:
+            predictive: Предсказывать попадания аналитически вместо проверки на каждом кадре
+            broadphase: В обычном режиме пропускать дорожки, полосу которых пуля не пересекает
+            events: Шина событий раунда (AnimalKilled после каждого попадания в животное)
+            scheduler: Планировщик раунда, по часам которого идут интервалы попадания
+                (None — свой, его часы двигает update)
+        """
+        self.events = events or EventBus()
+        self.owns_scheduler = scheduler is None
+        self.scheduler = scheduler or Scheduler()
+
         # Храним ссылки на менеджеры объектов напрямую
         self.bullet_manager = None
-        self.rhino_spawner = None
-        self.bizon_spawner = None
-        self.gazelle_spawner = None
-        self.palm_spawner = None
         self.score_manager = None
 
         # Список пар "пули-цели" для проверки
         self.collision_pairs = []
 
-    def setup(self, bullet_manager, rhino_spawner, bizon_spawner, gazelle_spawner, palm_spawner, score_manager):
+        # Хранилища дорожек по типу цели (для учёта попаданий)
+        self.lane_stores = {}
+
+        # Типы целей, которые исчезают после попадания (пальма остаётся и продолжает задерживать пули)
+        self.removed_on_hit: set[str] = set()
+
+        # Обработчики попаданий по типу цели (собираются из таблицы дорожек в setup)
+        self.hit_handlers: dict[str, Callable[[], None]] = {}
+
+        # Broadphase по дорожкам и его статистика (число проверок "пуля-цель")
+        self.broadphase = broadphase
+        self.pair_tests_last_frame = 0  # Выполнено проверок за последний кадр
+        self.pair_tests_saved_last_frame = 0  # Пропущено проверок за последний кадр
+        self.pair_tests_saved_total = 0  # Пропущено проверок за всё время
+
+        # Предсказывающий режим
+        self.predictive = predictive
+        # Интервал: (начало, порядок проверки, конец, версия пули, номер цели, пуля, цель, тип цели, хранилище);
+        # порядок проверки — (номер выстрела, номер дорожки, номер появления цели), как в обычном режиме
+        self.scheduled_hits = []  # Куча ещё не наступивших интервалов
+        self.active_windows = []  # Наступившие интервалы в порядке проверки
+        self._sequence = itertools.count()
+        self._bullet_serials: dict = {}  # Пуля -> номер выстрела
+        self._bullet_versions: dict = {}  # Пуля -> версия её интервалов (старые версии не проверяются)
+        self._lane_order: dict[str, int] = {}  # Тип цели -> номер дорожки в порядке проверки
+        self._seen_shots = 0  # Сколько выстрелов учтено в расписании
+        self._seen_spawns: dict[str, int] = {}  # Сколько появлений целей учтено по дорожкам
+
+    def setup(self, bullet_manager, lanes, spawners: dict, score_manager):
         """
-        Настройка системы столкновений.
+        Настройка системы столкновений по таблице дорожек.
 
         Args:
             bullet_manager: менеджер пуль
-            rhino_spawner: создатель носорогов
-            bizon_spawner: создатель бизонов
-            gazelle_spawner: создатель газелей
-            palm_spawner: создатель пальм
+            lanes: дорожки раунда (Lane) в порядке проверки
+            spawners: создатели по имени дорожки
             score_manager: менеджер счёта
         """
         self.bullet_manager = bullet_manager
-        self.rhino_spawner = rhino_spawner
-        self.bizon_spawner = bizon_spawner
-        self.gazelle_spawner = gazelle_spawner
-        self.palm_spawner = palm_spawner
         self.score_manager = score_manager
 
-        # Определяем какие типы объектов проверять на столкновения
-        self.collision_pairs = [
-            (rhino_spawner.active_animals, "rhino"),
-            (bizon_spawner.active_animals, "bizon"),
-            (gazelle_spawner.active_animals, "gazelle"),
-            (palm_spawner.active_palms, "palm"),
-        ]
+        # Определяем какие дорожки проверять на столкновения
+        colliding = [lane for lane in lanes if lane.collides]
+        self.collision_pairs = [(spawners[lane.name].sprite_list, lane.name) for lane in colliding]
+        self.lane_stores = {lane.name: spawners[lane.name].store for lane in colliding}
+        self._lane_order = {lane.name: index for index, lane in enumerate(colliding)}
+        self.removed_on_hit = {lane.name for lane in colliding if lane.removed_on_hit}
+        self.hit_handlers = {
+            lane.name: self._hit_handler(lane, spawners[lane.name]) for lane in colliding if lane.score_key
+        }
+
+    def _hit_handler(self, lane, spawner) -> Callable[[], None]:
+        """
+        Обработчик попадания в цель дорожки: счёт, звук и особые правила.
 
-    def update(self):
-        """Проверяет все возможные столкновения за кадр."""
+        Args:
+            lane: дорожка-цель (Lane со score_key)
+            spawner: создатель дорожки
+        """
+
+        def handle_hit():
+            self._register_kill(lane.score_key, lane.hit_sound)
+            if lane.single_kill:
+                # Особый случай (носорог): после попадания новые не появляются
+                spawner.stop_spawning()
+
+        return handle_hit
+
+    def update(self, delta_time: float = 1 / 60):
+        """
+        Проверяет все возможные столкновения за кадр.
+
+        Args:
+            delta_time: Время с предыдущего кадра в секундах (нужно предсказывающему режиму)
+        """
         if not self.bullet_manager:
             return
 
+        self.pair_tests_last_frame = 0
+        self.pair_tests_saved_last_frame = 0
+
+        if self.predictive:
+            self._update_predictive(delta_time)
+            return
+
         # Получаем спрайт-лист пуль (это SpriteList!)
         bullet_sprite_list = self.bullet_manager.sprite_list
 
         if not bullet_sprite_list or len(bullet_sprite_list) == 0:
             return
 
-        # Проверяем каждую пулю на столкновение с каждой целью
+        bands = self._lane_bands() if self.broadphase else {}
+
+        # Проверяем каждую пулю на столкновение с целями дорожек, которые она пересекает
         for bullet in bullet_sprite_list:
             if not bullet.is_active:
                 continue
 
-            for target_list, _target_type in self.collision_pairs:
+            for target_list, target_type in self.collision_pairs:
                 if not target_list or len(target_list) == 0:
                     continue
 
+                # Broadphase: хитбокс пули не пересекает полосу дорожки
+                band = bands.get(target_type)
+                if band and (bullet.top < band[0] or bullet.bottom > band[1]):
+                    self.pair_tests_saved_last_frame += len(target_list)
+                    continue
+
                 # Проверяем столкновения
+                self.pair_tests_last_frame += len(target_list)
                 collisions = arcade.check_for_collision_with_list(bullet, target_list)
 
                 if collisions:
                     # Обрабатываем первое попадание
-                    self._handle_hit(bullet, collisions[0])
+                    self._handle_hit(bullet, collisions[0], target_type)
                     break  # Пуля поразила цель, дальше не проверяем
 
-    def _handle_hit(self, bullet, target):
+        self.pair_tests_saved_total += self.pair_tests_saved_last_frame
+
+    def _lane_bands(self) -> dict[str, tuple[float, float]]:
+        """
+        Вертикальные полосы дорожек на текущем кадре.
+
+        Returns:
+            Словарь тип цели -> (нижняя граница, верхняя граница); пустые дорожки не попадают
+        """
+        bands = {}
+        for target_type, store in self.lane_stores.items():
+            band = store.band()
+            if band is not None:
+                bands[target_type] = band
+        return bands
+
+    def _update_predictive(self, delta_time: float):
+        """Точно проверяет только пары "пуля-цель", интервал попадания которых наступил."""
+        if self.owns_scheduler:
+            self.scheduler.advance(delta_time)
+        clock = self.scheduler.clock
+
+        # Дополняем расписание интервалами новых пуль и новых целей
+        self._schedule_new_entities()
+
+        # Переносим наступившие интервалы в активные
+        while self.scheduled_hits and self.scheduled_hits[0][0] <= clock + WINDOW_EPSILON:
+            self.active_windows.append(heapq.heappop(self.scheduled_hits))
+        self.active_windows.sort(key=lambda window: window[1])
+
+        # Отбрасываем закончившиеся и устаревшие интервалы
+        self.active_windows = [
+            window for window in self.active_windows if window[2] >= clock - WINDOW_EPSILON and self._is_current(window)
+        ]
+
+        removed_targets = []
+        for window in self.active_windows:
+            bullet, target, target_type = window[5], window[6], window[7]
+            if bullet.is_active and arcade.check_for_collision(bullet, target):
+                self._handle_hit(bullet, target, target_type)
+                if target_type in self.removed_on_hit:
+                    removed_targets.append(target)
+
+        # Цель исчезла — пули, летевшие в неё, летят дальше: пересчитываем только их
+        if removed_targets:
+            self._reschedule_bullets_aimed_at(removed_targets)
+
+    def _is_current(self, window) -> bool:
+        """Интервал актуален: пуля летит, он из последнего расчёта пули, а цель — та же, что при расчёте."""
+        _, _, _, version, serial, bullet, target, _, store = window
+        return bullet.is_active and self._bullet_versions.get(bullet) == version and store.serial_of(target) == serial
+
+    def _schedule_new_entities(self):
+        """Добавляет интервалы для пуль, выпущенных, и целей, появившихся с прошлого кадра."""
+        bullet_manager = self.bullet_manager
+        if bullet_manager is None:
+            return
+        bullets = bullet_manager.sprite_list
+        new_shots = min(bullet_manager.shots_fired - self._seen_shots, len(bullets))
+        self._seen_shots = bullet_manager.shots_fired
+        new_bullets = [bullets[i] for i in range(len(bullets) - new_shots, len(bullets))] if new_shots > 0 else []
+
+        # Новые цели: интервалы уже летящих пуль только с ними
+        for target_type, store in self.lane_stores.items():
+            new_targets = min(store.spawned - self._seen_spawns.get(target_type, 0), store.count)
+            self._seen_spawns[target_type] = store.spawned
+            if new_targets <= 0:
+                continue
+            for bullet in bullets:
+                if bullet.is_active and bullet in self._bullet_versions and bullet not in new_bullets:
+                    self._push_windows(bullet, target_type, store, store.count - new_targets)
+
+        # Новые пули: интервалы со всеми целями
+        for bullet in new_bullets:
+            self._bullet_serials[bullet] = next(self._sequence)
+            self._schedule_bullet(bullet)
+
+    def _schedule_bullet(self, bullet):
+        """Заново вычисляет интервалы пули со всеми дорожками (прежние интервалы пули устаревают)."""
+        self._bullet_versions[bullet] = next(self._sequence)
+        if not bullet.is_active:
+            return
+        for target_type, store in self.lane_stores.items():
+            self._push_windows(bullet, target_type, store)
+
+    def _push_windows(self, bullet, target_type: str, store, first_row: int = 0):
+        """Добавляет в кучу интервалы пули с целями дорожки начиная со строки first_row."""
+        clock = self.scheduler.clock
+        bullet_serial = self._bullet_serials[bullet]
+        version = self._bullet_versions[bullet]
+        lane_index = self._lane_order[target_type]
+        skip_dead = target_type in self.removed_on_hit
+        for start, end, row in lane_hit_windows(bullet, store, skip_dead=skip_dead, first_row=first_row):
+            serial = int(store.serial[row])
+            target = store.sprites[row]
+            order = (bullet_serial, lane_index, serial)
+            window = (clock + start, order, clock + end, version, serial, bullet, target, target_type, store)
+            heapq.heappush(self.scheduled_hits, window)
+
+    def _reschedule_bullets_aimed_at(self, targets: list):
+        """Пересчитывает интервалы только тех летящих пуль, у которых были интервалы с исчезнувшими целями."""
+        bullets = {
+            window[5]
+            for window in itertools.chain(self.scheduled_hits, self.active_windows)
+            if any(window[6] is target for target in targets) and self._is_current(window)
+        }
+        for bullet in sorted(bullets, key=self._bullet_serials.__getitem__):
+            self._schedule_bullet(bullet)
+
+    def _handle_hit(self, bullet, target, target_type: str):
         """
         Обрабатывает попадание пули в цель.
 
         Args:
             bullet: пуля, которая попала
             target: цель, в которую попали
+            target_type: тип цели (имя дорожки: хранилище и обработчик попадания)
         """
         # 1. Обрабатываем попадание для пули
         bullet.on_hit()
@@ -94,37 +300,28 @@ class CollisionSystem:
         if hasattr(target, "on_hit"):
             target.on_hit()
 
-        # 3. Наращиваем счет
-        match target:
-            case Rhino() if self.rhino_spawner:
-                # обработка для Rhino
-                self.score_manager.register_kill("rhino")
-                Textures.shot_sound.play()
-                # Особый случай: если это носорог, сообщаем spawner'у
-                self.rhino_spawner.mark_as_hit()
-            case Gazelle():
-                # обработка для Gazelle
-                self.score_manager.register_kill("gazelle")
-                Textures.shot_sound.play()
-            case Bizon():
-                # обработка для Bizon
-                self.score_manager.register_kill("bizon")
-                Textures.shot_sound.play()
-
-    def _play_shot_sound(self):
-        """Воспроизводит звук попадания."""
-        if Textures.shot_sound:
-            try:
-                Textures.shot_sound.play()
-            except Exception as e:
-                print(f"❌ Ошибка воспроизведения звука попадания: {e}")
+        # Помечаем цель как убитую в колонках дорожки
+        store = self.lane_stores.get(target_type)
+        if store is not None:
+            store.kill(target)
 
-    def add_collision_pair(self, target_list, target_type):
-        """
-        Добавляет новый тип целей для проверки столкновений.
+        # 3. Наращиваем счет (обработчик дорожки из таблицы, у препятствий его нет)
+        handler = self.hit_handlers.get(target_type)
+        if handler is not None:
+            handler()
 
-        Args:
-            target_list: SpriteList целей
-            target_type: тип цели (для отладки)
-        """
-        self.collision_pairs.append((target_list, target_type))
+    def _register_kill(self, score_key: str, hit_sound: str | None = None):
+        """Засчитывает убийство, играет звук попадания и публикует AnimalKilled."""
+        kills = self.score_manager.register_kill(score_key)
+        if hit_sound:
+            self._play_hit_sound(hit_sound)
+        self.events.publish(AnimalKilled(score_key, kills))
+
+    def _play_hit_sound(self, hit_sound: str):
+        """Воспроизводит звук попадания (атрибут Textures)."""
+        sound = getattr(Textures, hit_sound, None)
+        if sound:
+            try:
+                sound.play()
+            except Exception as e:
+                logger.error("❌ Ошибка воспроизведения звука попадания: %s", e)
@@ -0,0 +1,100 @@
+"""
+Аналитическое предсказание попаданий.
+
+Пуля летит с постоянной скоростью (45°), а все цели дорожки движутся влево
+с постоянной скоростью. Поэтому интервал времени, в течение которого
+ограничивающие прямоугольники хитбоксов пули и цели пересекаются, находится
+в замкнутом виде. Вне этого интервала точная проверка столкновения не нужна.
+"""
+
+import math
+
+import numpy as np
+
+from ..constants import BULLET_MAX_X, BULLET_MIN_Y
+from ..entities.lane_store import LaneStore
+
+
+def bullet_exit_time(bullet) -> float:
+    """
+    Время до выхода пули за правую или нижнюю границу.
+
+    Args:
+        bullet: Пуля (center_x, center_y, change_x, change_y)
+
+    Returns:
+        Время в секундах (inf, если пуля не покидает поле)
+    """
+    exit_time = math.inf
+    if bullet.change_x > 0:
+        exit_time = min(exit_time, (BULLET_MAX_X - bullet.center_x) / bullet.change_x)
+    if bullet.change_y < 0:
+        exit_time = min(exit_time, (BULLET_MIN_Y - bullet.center_y) / bullet.change_y)
+    return max(exit_time, 0.0)
+
+
+def lane_hit_windows(
+    bullet, store: LaneStore, skip_dead: bool = True, first_row: int = 0
+) -> list[tuple[float, float, int]]:
+    """
+    Находит интервалы времени, в которые пуля может задеть цели дорожки.
+
+    Args:
+        bullet: Пуля (позиция, скорость и границы хитбокса)
+        store: Хранилище дорожки с текущими позициями и скоростями целей
+        skip_dead: Не учитывать убитые цели (животные исчезают после попадания)
+        first_row: Проверять только цели со строки first_row (только что появившиеся)
+
+    Returns:
+        Список (начало, конец, номер строки цели) в секундах от текущего момента
+    """
+    n = store.count
+    if first_row >= n:
+        return []
+
+    rows_range = slice(first_row, n)
+    sprites = store.sprites[rows_range]
+    x = store.x[rows_range]
+    speed = store.speed[rows_range]
+
+    # Хитбоксы целей: смещения по X относительно центра и абсолютные границы по Y
+    left = np.array([sprite.left - sprite.center_x for sprite in sprites])
+    right = np.array([sprite.right - sprite.center_x for sprite in sprites])
+    bottom = store.bottom[rows_range]
+    top = store.top[rows_range]
+
+    bx = bullet.center_x
+    vx, vy = bullet.change_x, bullet.change_y
+    b_left, b_right = bullet.left - bx, bullet.right - bx
+    b_bottom, b_top = bullet.bottom, bullet.top
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # По X: пуля и цель сближаются с относительной скоростью vx + speed
+        closing = vx + speed
+        t_x0 = (x + left - (bx + b_right)) / closing
+        t_x1 = (x + right - (bx + b_left)) / closing
+
+        # Цель исчезает, дойдя до despawn_x
+        t_despawn = (x - store.despawn_x[rows_range]) / speed
+
+    # По Y: цели неподвижны, пуля движется со скоростью vy
+    if vy > 0:
+        t_y0 = (bottom - b_top) / vy
+        t_y1 = (top - b_bottom) / vy
+    elif vy < 0:
+        t_y0 = (top - b_bottom) / vy
+        t_y1 = (bottom - b_top) / vy
+    else:
+        overlap = (b_bottom <= top) & (bottom <= b_top)
+        t_y0 = np.where(overlap, -np.inf, np.inf)
+        t_y1 = np.where(overlap, np.inf, -np.inf)
+
+    t_start = np.maximum(np.maximum(t_x0, t_y0), 0.0)
+    t_end = np.minimum(np.minimum(t_x1, t_y1), np.minimum(t_despawn, bullet_exit_time(bullet)))
+
+    hits = t_start <= t_end
+    if skip_dead:
+        hits &= store.alive[rows_range]
+
+    rows = np.flatnonzero(hits)
+    return list(zip(t_start[rows].tolist(), t_end[rows].tolist(), (rows + first_row).tolist(), strict=True))
@@ -7,6 +7,7 @@
 - Пути к изображениям, звукам, шрифтам
 """
 
+import os
 from pathlib import Path
 
 # Определяем корень проекта: src/safari -> src -> project_root
@@ -18,6 +19,37 @@ RESOURCES_PREFIX = "slot_machine"
 SOUNDS_PATH = RESOURCES_PATH / "sounds"
 IMAGES_PATH = RESOURCES_PATH / "images"
 FONTS_PATH = RESOURCES_PATH / "fonts"
+ATLAS_PATH = RESOURCES_PATH / "atlas"
+
+# Атлас текстур (собирается командой make atlas)
+IMAGES_PREFIX = f":{RESOURCES_PREFIX}:/images/"  # Префикс путей к картинкам
+ATLAS_IMAGE_PATH = ATLAS_PATH / "atlas.png"
+ATLAS_MANIFEST_PATH = ATLAS_PATH / "atlas.json"
+ATLAS_WIDTH = 1024  # Ширина атласа в пикселях
+ATLAS_PADDING = 2  # Отступ между картинками в атласе
+ATLAS_MAX_SIDE = 600  # Полноэкранные слои крупнее этого остаются отдельными файлами
+ATLAS_EXCLUDED_IMAGES = {"safari-slot-demo.png"}  # Скриншот для README, в игре не используется
+
+# Бенчмарк обновления кадра (make bench)
+BENCHMARK_BASELINE_PATH = PROJECT_ROOT / "benchmarks" / "frame_update.json"
+BENCHMARK_TOLERANCE = 0.5  # Допустимое замедление медианы относительно базовой линии
+
+# Фоновая загрузка ресурсов
+RESOURCE_UPLOAD_BUDGET = 0.004  # Секунд кадра на выгрузку текстур в GPU
+
+# Записи ввода раундов для воспроизведения (uv run -m src.safari.simulation.replay);
+# по умолчанию выключены, включаются флагом safari --record-replays или SAFARI_RECORD_REPLAYS=1
+RECORD_REPLAYS = os.environ.get("SAFARI_RECORD_REPLAYS", "") not in ("", "0")
+REPLAYS_PATH = PROJECT_ROOT / "replays"
+REPLAY_ARCHIVE_PATH = REPLAYS_PATH / "archive"  # Архив всех раундов (archive.bin и archive.idx)
+
+# Статичные слои (фон, блик, рамка) рисуются один раз в текстуру и дальше берутся из неё
+STATIC_LAYER_CACHE = True
+
+# Профиль кадра по стадиям (F3 в игре)
+FRAME_PROFILE_WINDOW = 300  # Сколько последних кадров хранить для перцентилей
+FRAME_PROFILE_REFRESH = 0.5  # Как часто обновлять текст оверлея, секунд
+FRAME_PROFILE_POSITION = (20, 740)  # Левый верхний угол оверлея
 
 # Пути к конкретным файлам
 START_SOUND_PATH = SOUNDS_PATH / "start.ogg"
@@ -156,6 +188,9 @@ BULLET_MIN_Y = 85  # нижний край для удаления
 BULLET_START_OFFSET_X = 25  # смещение от позиции охотника по X
 BULLET_START_OFFSET_Y = 10  # смещение от позиции охотника по Y
 
+# Предсказывать попадания аналитически при выстреле (вместо проверки столкновений на каждом кадре)
+PREDICTIVE_COLLISIONS = True
+
 # Звуки
 FIRE_SOUND_PATH = SOUNDS_PATH / "fire.ogg"
 SHOT_SOUND_PATH = SOUNDS_PATH / "shot.ogg"
@@ -229,9 +264,7 @@ MAX_SHOTS_TOTAL = 16  # Максимум 16 выстрелов за игру
 #     "bizon": 1,  # Нужно убить 4 бизона
 #     "rhino": 1,  # Нужно убить 1 носорога
 # }
-# GAME_TIME_SECONDS = 20  # для отладки в 20 секунд
-# MIN_TIME_SINCE_LAST_SHOT = 0.1  # Для отладки: минимальная задержка между выстрелами
-# MAX_SHOTS_TOTAL = 160  # Для отладки: 160 выстрелов за игру
+# Короткий раунд и частая стрельба — сценарий debug (safari --scenario debug)
 
 GAZELLE_INDICATOR_POSITIONS = [
     (33, 62),  # 1
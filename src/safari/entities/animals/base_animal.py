@@ -43,6 +43,10 @@ class Animal(arcade.TextureAnimationSprite):
 
         super().__init__(center_x=x, center_y=y + y_offset, animation=animation)
 
+        # Точка появления (для повторного использования из пула)
+        self.spawn_x = x
+        self.spawn_y = y + y_offset
+
         # Параметры движения
         self.speed = speed
         self.despawn_x = despawn_x
@@ -50,6 +54,14 @@ class Animal(arcade.TextureAnimationSprite):
         # Состояние
         self.is_alive = True
 
+    def reset(self):
+        """Возвращает животное в точку появления с первым кадром анимации (при повторном использовании из пула)."""
+        self.center_x = self.spawn_x
+        self.center_y = self.spawn_y
+        self.time = 0.0
+        self.animation = self.animation  # Сбрасывает текстуру на первый кадр
+        self.is_alive = True
+
     def on_update(self, delta_time: float = 1 / 60):
         """
         Обновление состояния: движение справа налево и анимация.
@@ -1,16 +1,28 @@
+import logging
 import random
+from functools import partial
 
 import arcade
+import numpy as np
 
+from ...scheduler import Scheduler
+from ..entity_pool import EntityPool
+from ..lane_spawner import LaneSpawner
+from ..lane_store import LaneStore
 
-class AnimalSpawnerBase:
+# Появления и убийства выводит окно игры (main настраивает logging); GameSession.run без окна молчит
+logger = logging.getLogger(__name__)
+
+
+class AnimalSpawnerBase(LaneSpawner):
     """
     Базовый класс для создания животных с интервалами.
 
     Особенности:
     - Первое животное создаётся сразу при старте игры
-    - Интервал между появлениями случайный (в диапазоне)
+    - Расписание появлений и планировщик — общие для всех дорожек (LaneSpawner)
     - Управляет жизненным циклом животных
+    - Единственный владелец животных — sprite_list (он же слой отрисовки)
     """
 
     def __init__(
@@ -20,117 +32,107 @@ class AnimalSpawnerBase:
         min_interval_ms: int,
         max_interval_ms: int,
         animal_name: str = "animal",
+        rng: random.Random | None = None,
+        spawn_density: float = 1.0,
+        scheduler: Scheduler | None = None,
+        lane=None,
     ):
         """
         Args:
-            sprite_list: Основной список спрайтов для отрисовки
+            sprite_list: Список-владелец животных дорожки (он же слой отрисовки)
             animal_class: Класс создаваемого животного
             min_interval_ms: Минимальный интервал в миллисекундах
             max_interval_ms: Максимальный интервал в миллисекундах
             animal_name: Имя животного для логов
+            rng: Собственный генератор случайных чисел дорожки
+            spawn_density: Во сколько раз чаще создавать животных (интервалы делятся на это число)
+            scheduler: Планировщик раунда (None — свой, его часы двигает update)
+            lane: Запись таблицы дорожек (Lane): интервалы, скорость и дорожка вместо значений класса
         """
-        self.time_since_last_spawn = 0.0
-        self.min_interval_ms = min_interval_ms
-        self.max_interval_ms = max_interval_ms
-        self.spawn_interval = self._get_random_interval()
+        factory = animal_class
+        if lane is not None:
+            min_interval_ms, max_interval_ms = lane.spawn_interval_ms
+            factory = partial(animal_class, y=lane.track_y)
+            animal_name = lane.name
+
+        super().__init__(min_interval_ms, max_interval_ms, rng, spawn_density, scheduler)
 
-        self.active_animals = arcade.SpriteList()
+        self.store = LaneStore(animated=True)  # Колонки позиций, скоростей и флагов жизни
         self.sprite_list = sprite_list
         self.animal_class = animal_class
         self.animal_name = animal_name
+        self.speed = lane.speed if lane is not None else None  # None — скорость класса животного
+        self.pool = EntityPool(factory, name=animal_name)  # Переиспользуемые животные
 
         self.number = 0  # Счётчик созданных животных
-        self.is_active = True  # Можно ли создавать новых животных
         self.was_killed = False  # Было ли убито животное (для специфичной логики)
 
-    def _get_random_interval(self) -> float:
-        """Случайный интервал в секундах."""
-        return random.uniform(  # noqa: S311 # nosec
-            self.min_interval_ms / 1000,
-            self.max_interval_ms / 1000,
-        )
+    @property
+    def active_animals(self) -> arcade.SpriteList:
+        """Активные животные (тот же список, что и sprite_list, без копии)."""
+        return self.sprite_list
 
     def start(self):
         """Создаёт первое животное при старте игры."""
         if self.is_active:
-            self._spawn_animal()
-            self.time_since_last_spawn = 0.0
-            self.spawn_interval = self._get_random_interval()
-
-    def update(self, delta_time: float):
-        """Проверяет, нужно ли создать новое животное."""
-        if not self.is_active:
-            self._update_animals(delta_time)
-            return
+            self._spawn()
+            self._schedule_next_spawn()
 
-        self.time_since_last_spawn += delta_time
-
-        # Проверяем интервал
-        if self.time_since_last_spawn >= self.spawn_interval:
-            self._spawn_animal()
-            self.time_since_last_spawn = 0.0
-            self.spawn_interval = self._get_random_interval()
-
-        # Обновляем и удаляем старых животных
-        self._update_animals(delta_time)
-
-    def _spawn_animal(self):
+    def _spawn(self):
         """Создаёт новое животное."""
         if not self.is_active:
             return
 
-        animal = self.animal_class()
+        animal = self.pool.acquire()
+        if self.speed is not None:
+            animal.speed = self.speed
         self.number += 1
-        self.active_animals.append(animal)
         self.sprite_list.append(animal)
-        print(f"🦌 Создано {self.animal_name} #{self.number}")
+        self.store.add(animal, animal.speed, animal.despawn_x)
+        logger.info("🦌 Создано %s #%d", self.animal_name, self.number)
 
-    def _update_animals(self, delta_time: float):
-        """Обновляет всех активных животных и удаляет ненужные."""
-        animals_to_remove = []
+    def _update_lane(self, delta_time: float):
+        """Обновляет всех активных животных и удаляет ненужные (векторно по дорожке)."""
+        store = self.store
+        store.advance(delta_time)
 
-        for animal in self.active_animals:
-            animal.on_update(delta_time)
+        # Отслеживаем убийства (в животное попали — is_alive = False)
+        for animal in store.dead_sprites():
+            self._on_animal_killed(animal)
 
-            # Удаляем животное если:
-            # 1. Оно вышло за границу ИЛИ
-            # 2. В него попали (is_alive = False)
-            if animal.should_be_removed():
-                animals_to_remove.append(animal)
+        # Удаляем животное если:
+        # 1. Оно вышло за границу ИЛИ
+        # 2. В него попали
+        self._despawn(store.expired(remove_dead=True))
 
-                # Отслеживаем убийство (если нужно)
-                if not animal.is_alive:
-                    self._on_animal_killed(animal)
-
-        # Удаляем помеченных животных
-        for animal in animals_to_remove:
-            self.active_animals.remove(animal)
-            self.sprite_list.remove(animal)
+        # Переносим позиции и кадры анимации в спрайты
+        store.sync()
 
     def _on_animal_killed(self, animal):
         """Вызывается при убийстве животного (можно переопределить)."""
         # Базовый класс просто запоминает факт убийства
         self.was_killed = True
-        print(f"🎯 {self.animal_name.capitalize()} убит!")
+        logger.info("🎯 %s убит!", self.animal_name.capitalize())
 
     # Методы для управления состоянием
-    def stop_spawning(self):
-        """Останавливает создание новых животных."""
-        self.is_active = False
-
     def resume_spawning(self):
-        """Возобновляет создание животных."""
+        """Возобновляет создание животных (следующее — по расписанию, наступившее — сразу)."""
         self.is_active = True
+        if self.next_spawn is None:
+            self._schedule_next_spawn()
 
     def reset(self):
         """Сбрасывает состояние (для новой игры)."""
         self.was_killed = False
         self.is_active = True
         self.number = 0
-        self.time_since_last_spawn = 0.0
-        self.spawn_interval = self._get_random_interval()
-
-        # Очищаем списки
-        for animal in self.active_animals:
-            self.sprite_list.remove(animal)
-        self.active_animals.clear()
+        self.scheduler.cancel(self.next_spawn)
+        self.next_spawn = None
+        self.last_spawn_time = self.scheduler.clock
+        self.spawn_times = []
+        self.cursor = 0
+        self.planned_until = self.last_spawn_time
+        self.plan_until(self.last_spawn_time)
+
+        # Очищаем список и возвращаем животных в пул
+        self._despawn(np.ones(self.store.count, dtype=bool))
@@ -1,6 +1,9 @@
+import random
+
 import arcade
 
 from ....constants import BIZON_SPAWN_INTERVAL_MAX, BIZON_SPAWN_INTERVAL_MIN
+from ....scheduler import Scheduler
 from ..base_animal_spawner import AnimalSpawnerBase
 from .bizon import Bizon
 
@@ -14,11 +17,22 @@ class BizonSpawner(AnimalSpawnerBase):
     - Интервал между появлениями: 2–4 секунд
     """
 
-    def __init__(self, sprite_list: arcade.SpriteList):
+    def __init__(
+        self,
+        sprite_list: arcade.SpriteList,
+        rng: random.Random | None = None,
+        spawn_density: float = 1.0,
+        scheduler: Scheduler | None = None,
+        lane=None,
+    ):
         super().__init__(
             sprite_list=sprite_list,
             animal_class=Bizon,
             min_interval_ms=BIZON_SPAWN_INTERVAL_MIN,
             max_interval_ms=BIZON_SPAWN_INTERVAL_MAX,
             animal_name="bizon",
+            rng=rng,
+            spawn_density=spawn_density,
+            scheduler=scheduler,
+            lane=lane,
         )
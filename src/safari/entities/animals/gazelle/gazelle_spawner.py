@@ -1,6 +1,9 @@
+import random
+
 import arcade
 
 from ....constants import GAZELLE_SPAWN_INTERVAL_MAX, GAZELLE_SPAWN_INTERVAL_MIN
+from ....scheduler import Scheduler
 from ..base_animal_spawner import AnimalSpawnerBase
 from .gazelle import Gazelle
 
@@ -14,11 +17,22 @@ class GazelleSpawner(AnimalSpawnerBase):
     - Интервал между появлениями: 2–4 секунд
     """
 
-    def __init__(self, sprite_list: arcade.SpriteList):
+    def __init__(
+        self,
+        sprite_list: arcade.SpriteList,
+        rng: random.Random | None = None,
+        spawn_density: float = 1.0,
+        scheduler: Scheduler | None = None,
+        lane=None,
+    ):
         super().__init__(
             sprite_list=sprite_list,
             animal_class=Gazelle,
             min_interval_ms=GAZELLE_SPAWN_INTERVAL_MIN,
             max_interval_ms=GAZELLE_SPAWN_INTERVAL_MAX,
             animal_name="gazelle",
+            rng=rng,
+            spawn_density=spawn_density,
+            scheduler=scheduler,
+            lane=lane,
         )
@@ -34,7 +34,16 @@ class Bullet(arcade.Sprite):
             hunter_y: Y-координата охотника
         """
         super().__init__()
+        self.reset(hunter_x, hunter_y)
 
+    def reset(self, hunter_x: float, hunter_y: float):
+        """
+        Возвращает пулю в начальное состояние (при повторном использовании из пула).
+
+        Args:
+            hunter_x: X-координата охотника
+            hunter_y: Y-координата охотника
+        """
         # Начальная позиция относительно охотника
         self.center_x = hunter_x + BULLET_START_OFFSET_X
         self.center_y = hunter_y + BULLET_START_OFFSET_Y
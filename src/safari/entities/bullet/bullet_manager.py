@@ -4,6 +4,9 @@
 - Блокировка выстрела при определенных условиях
 """
 
+import logging
+import math
+
 import arcade
 
 from src.safari.constants import (
@@ -11,30 +14,54 @@ from src.safari.constants import (
     MIN_TIME_SINCE_LAST_SHOT,
 )
 from src.safari.entities.bullet.bullet import Bullet
+from src.safari.entities.entity_pool import EntityPool
+from src.safari.events import EventBus, ShotFired
 from src.safari.resource_manager import Textures
 
+# Сообщения о выстрелах выводит окно игры (main настраивает logging); GameSession.run без окна молчит
+logger = logging.getLogger(__name__)
+
 
 class BulletManager:
     """
     Менеджер пуль с ограничениями по количеству и состоянию.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_shots: int | None = MAX_SHOTS_TOTAL,
+        min_time_between_shots: float = MIN_TIME_SINCE_LAST_SHOT,
+        events: EventBus | None = None,
+    ):
+        """
+        Args:
+            max_shots: Максимум выстрелов за игру (None — без ограничения)
+            min_time_between_shots: Минимальная задержка между выстрелами в секундах
+            events: Шина событий раунда (ShotFired после каждого выстрела)
+        """
+        self.events = events or EventBus()
+
         # Ограничения
-        self.max_shots_total = MAX_SHOTS_TOTAL
-        self.time_since_last_shot = MIN_TIME_SINCE_LAST_SHOT  # Сколько времени прошло с последнего выстрела
+        self.max_shots_total = math.inf if max_shots is None else max_shots
+        self.min_time_between_shots = min_time_between_shots
+        self.time_since_last_shot = min_time_between_shots  # Сколько времени прошло с последнего выстрела
 
         # Состояние
         self.shots_fired = 0  # Количество сделанных выстрелов
         self.game_started = False  # Флаг начала игры
 
         # Пули
-        self.active_bullets = []  # Список активных пуль
-        self.sprite_list = arcade.SpriteList()  # Список для отрисовки
+        self.sprite_list = arcade.SpriteList()  # Единственный владелец пуль (он же слой отрисовки)
+        self.pool = EntityPool(Bullet, name="bullet")  # Переиспользуемые пули
 
         # Ссылка на охотника
         self.hunter = None
 
+    @property
+    def active_bullets(self) -> arcade.SpriteList:
+        """Активные пули (тот же список, что и sprite_list, без копии)."""
+        return self.sprite_list
+
     def setup(self, hunter):
         """
         Инициализация менеджера пуль.
@@ -55,12 +82,11 @@ class BulletManager:
         if not self._can_fire():
             return False
 
-        # Создаем новую пулю
-        bullet = Bullet(self.hunter.center_x, self.hunter.center_y)
+        # Берём пулю из пула
+        bullet = self.pool.acquire(self.hunter.center_x, self.hunter.center_y)
         bullet.setup()
 
-        # Добавляем пулю в списки
-        self.active_bullets.append(bullet)
+        # Добавляем пулю в список
         self.sprite_list.append(bullet)
 
         # Обновляем состояние
@@ -71,7 +97,8 @@ class BulletManager:
         # Воспроизводим звук выстрела
         self._play_fire_sound()
 
-        print(f"🔫 Выстрел #{self.shots_fired}/{self.max_shots_total}")
+        logger.info("🔫 Выстрел #%d/%s", self.shots_fired, self.max_shots_total)
+        self.events.publish(ShotFired(self.shots_fired))
         return True
 
     def _can_fire(self) -> bool:
@@ -82,27 +109,43 @@ class BulletManager:
             True если выстрел разрешен
         """
         # Блокировка: задержка
-        if self.time_since_last_shot < MIN_TIME_SINCE_LAST_SHOT:
-            print(f"⚠️  Не могу выстрелить: задержка {self.time_since_last_shot:.1f}/{MIN_TIME_SINCE_LAST_SHOT}s")
+        if self.time_since_last_shot < self.min_time_between_shots:
+            logger.info(
+                "⚠️  Не могу выстрелить: задержка %.1f/%ss", self.time_since_last_shot, self.min_time_between_shots
+            )
             return False
 
         # Блокировка: закончились патроны
         if self.shots_fired >= self.max_shots_total:
-            print("⚠️  Не могу выстрелить: закончились патроны")
+            logger.info("⚠️  Не могу выстрелить: закончились патроны")
             return False
 
         # Блокировка: игра не начата
         if not self.game_started:
-            print("⚠️  Не могу выстрелить: игра не начата")
+            logger.info("⚠️  Не могу выстрелить: игра не начата")
             return False
 
         # Блокировка: охотник в состоянии прыжка
         if self.hunter and hasattr(self.hunter, "is_jumping") and self.hunter.is_jumping:
-            print("⚠️  Не могу выстрелить: охотник прыгает")
+            logger.info("⚠️  Не могу выстрелить: охотник прыгает")
             return False
 
         return True
 
+    def is_ready(self) -> bool:
+        """
+        Проверяет без сообщений в лог, можно ли выстрелить (для автоматической стрельбы).
+
+        Returns:
+            True если выстрел разрешен
+        """
+        return (
+            self.game_started
+            and self.time_since_last_shot >= self.min_time_between_shots
+            and self.shots_fired < self.max_shots_total
+            and not (self.hunter and getattr(self.hunter, "is_jumping", False))
+        )
+
     def update(self, delta_time: float):
         """
         Обновляет все активные пули.
@@ -110,33 +153,30 @@ class BulletManager:
         Args:
             delta_time: Время с предыдущего кадра в секундах
         """
-        bullets_to_remove = []
         self.time_since_last_shot += delta_time
 
-        # Обновляем каждую пулю
-        for bullet in self.active_bullets:
+        # Обновляем каждую пулю и запоминаем номера тех, что нужно удалить
+        expired = []
+        for index, bullet in enumerate(self.sprite_list):
             bullet.on_update(delta_time)
-
-            # Проверяем, нужно ли удалить пулю
             if not bullet.is_active or bullet._should_be_removed():
-                bullets_to_remove.append(bullet)
+                expired.append(index)
 
-        # Удаляем неактивные пули
-        for bullet in bullets_to_remove:
-            self._remove_bullet(bullet)
+        self._remove_bullets(expired)
 
-    def _remove_bullet(self, bullet: Bullet):
+    def _remove_bullets(self, indices: list[int]):
         """
-        Удаляет пулю из всех списков.
+        Убирает пули из списка по номерам и возвращает их в пул.
+
+        Пули снимаются через pop с конца, без поиска пули в списке, как у SpriteList.remove.
 
         Args:
-            bullet: Пуля для удаления
+            indices: Номера пуль в sprite_list по возрастанию
         """
-        if bullet in self.active_bullets:
-            self.active_bullets.remove(bullet)
-
-        if bullet in self.sprite_list:
-            self.sprite_list.remove(bullet)
+        for index in indices:
+            self.pool.release(self.sprite_list[index])
+        for index in reversed(indices):
+            self.sprite_list.pop(index)
 
     def _play_fire_sound(self):
         """Воспроизводит звук выстрела."""
@@ -144,20 +184,19 @@ class BulletManager:
             try:
                 Textures.fire_sound.play()
             except Exception as e:
-                print(f"❌ Ошибка воспроизведения звука выстрела: {e}")
+                logger.error("❌ Ошибка воспроизведения звука выстрела: %s", e)
 
     def enable_shooting(self):
         """Активирует возможность стрельбы."""
         self.game_started = True
-        print("🎮 Игра начата - стрельба разрешена")
+        logger.info("🎮 Игра начата - стрельба разрешена")
 
     def reset(self):
         """Сбрасывает состояние менеджера пуль."""
         # Очищаем все пули
-        for bullet in self.active_bullets[:]:  # Копируем список для безопасного удаления
-            self._remove_bullet(bullet)
+        self._remove_bullets(list(range(len(self.sprite_list))))
 
         # Сбрасываем состояние
         self.shots_fired = 0
         self.game_started = False
-        print("🔄 Менеджер пуль сброшен")
+        logger.info("🔄 Менеджер пуль сброшен")
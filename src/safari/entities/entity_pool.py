@@ -0,0 +1,85 @@
+"""
+Пул переиспользуемых игровых объектов.
+
+Вместо создания нового спрайта при каждом появлении и его удаления при исчезновении
+объект возвращается в пул и при следующем появлении сбрасывается методом reset().
+Это убирает выделение памяти и паузы сборщика мусора во время раунда.
+"""
+
+from collections.abc import Callable
+
+
+class EntityPool:
+    """
+    Пул объектов одного типа.
+
+    Особенности:
+    - acquire(*args) берёт свободный объект и вызывает у него reset(*args),
+      а если свободных нет — создаёт новый через factory(*args)
+    - release(entity) возвращает объект в пул
+    - Статистика: попадания (hits), промахи (misses) и пик занятых объектов (high_water)
+    """
+
+    def __init__(self, factory: Callable, name: str = "entity"):
+        """
+        Args:
+            factory: Функция или класс, создающий новый объект
+            name: Имя типа объектов для статистики и логов
+        """
+        self.factory = factory
+        self.name = name
+        self.free: list = []  # Свободные объекты
+
+        # Статистика
+        self.hits = 0  # Объект взят из пула
+        self.misses = 0  # Пул пуст, объект создан заново
+        self.in_use = 0  # Сколько объектов сейчас выдано
+        self.high_water = 0  # Максимум одновременно выданных объектов
+
+    def acquire(self, *args):
+        """
+        Выдаёт объект из пула.
+
+        Args:
+            *args: Аргументы для reset() или factory()
+
+        Returns:
+            Готовый к использованию объект
+        """
+        if self.free:
+            entity = self.free.pop()
+            entity.reset(*args)
+            self.hits += 1
+        else:
+            entity = self.factory(*args)
+            self.misses += 1
+
+        self.in_use += 1
+        self.high_water = max(self.high_water, self.in_use)
+        return entity
+
+    def release(self, entity):
+        """
+        Возвращает объект в пул.
+
+        Args:
+            entity: Объект, выданный через acquire()
+        """
+        self.free.append(entity)
+        self.in_use -= 1
+
+    def get_stats(self) -> dict:
+        """
+        Возвращает статистику пула.
+
+        Returns:
+            Словарь с попаданиями, промахами, пиком и размерами пула
+        """
+        return {
+            "name": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "high_water": self.high_water,
+            "in_use": self.in_use,
+            "free": len(self.free),
+        }
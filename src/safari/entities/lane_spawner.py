@@ -0,0 +1,174 @@
+"""
+Общая часть создателей объектов дорожки: расписание появлений и планировщик.
+
+Создатели животных, пальм и барьеров отличаются только тем, что и как они
+создают и обновляют. Интервалы появления, расписание spawn_times с курсором
+и вызовы в планировщике раунда одинаковы и живут здесь.
+"""
+
+import random
+from abc import ABC, abstractmethod
+
+import arcade
+import numpy as np
+
+from ..scheduler import ScheduledCall, Scheduler
+from .entity_pool import EntityPool
+from .lane_store import LaneStore
+
+
+class LaneSpawner(ABC):
+    """
+    Базовый класс создателей объектов дорожки.
+
+    Особенности:
+    - Интервал между появлениями случайный (равномерно в диапазоне)
+    - Моменты появлений расписаны заранее (spawn_times) и проходятся курсором
+    - Следующее появление — вызов в планировщике раунда, а не таймер, проверяемый на каждом кадре
+    - Подклассы задают _spawn() (создать объект) и _update_lane() (обновить объекты дорожки),
+      а также store (LaneStore), sprite_list и pool; порядок спрайтов в sprite_list совпадает
+      с порядком строк store, поэтому исчезающие объекты убираются из слоя по индексу
+    """
+
+    # Задаются подклассами в __init__
+    store: LaneStore  # Колонки объектов дорожки
+    sprite_list: arcade.SpriteList  # Слой дорожки (спрайты в порядке строк store)
+    pool: EntityPool  # Переиспользуемые объекты дорожки
+
+    def __init__(
+        self,
+        min_interval_ms: float,
+        max_interval_ms: float,
+        rng: random.Random | None = None,
+        spawn_density: float = 1.0,
+        scheduler: Scheduler | None = None,
+    ):
+        """
+        Args:
+            min_interval_ms: Минимальный интервал в миллисекундах
+            max_interval_ms: Максимальный интервал в миллисекундах
+            rng: Собственный генератор случайных чисел дорожки
+            spawn_density: Во сколько раз чаще создавать объекты (интервалы делятся на это число)
+            scheduler: Планировщик раунда (None — свой, его часы двигает update)
+        """
+        self.rng = rng or random.Random()  # noqa: S311 # nosec
+        self.owns_scheduler = scheduler is None
+        self.scheduler = scheduler or Scheduler()
+        self.last_spawn_time = self.scheduler.clock  # Время последнего появления по часам планировщика
+        self.next_spawn: ScheduledCall | None = None  # Запланированное появление
+        self.spawn_times: list[float] = []  # Расписание появлений (по часам планировщика, по возрастанию)
+        self.cursor = 0  # Индекс следующего появления в spawn_times
+        self.planned_until = self.last_spawn_time  # До какого момента расписание составлено
+        self.spawn_density = spawn_density
+        self.min_interval_ms = min_interval_ms / spawn_density
+        self.max_interval_ms = max_interval_ms / spawn_density
+        self.is_active = True  # Можно ли создавать новые объекты
+
+        self.plan_until(self.last_spawn_time)  # Первое появление после стартового
+
+    def _get_random_interval(self) -> float:
+        """Случайный интервал в секундах."""
+        return self.rng.uniform(
+            self.min_interval_ms / 1000,
+            self.max_interval_ms / 1000,
+        )
+
+    @property
+    def spawn_interval(self) -> float:
+        """Интервал от последнего появления до следующего запланированного (секунды)."""
+        return self.spawn_times[self.cursor] - self.last_spawn_time
+
+    def plan_until(self, horizon: float) -> list[float]:
+        """
+        Дописывает расписание появлений до первого момента позже horizon.
+
+        Интервалы вытягиваются из генератора дорожки заранее, а не на кадре появления.
+        Время появления — предыдущее запланированное плюс интервал, поэтому
+        расписание не зависит от шага кадров.
+
+        Args:
+            horizon: Момент по часам планировщика (секунды)
+
+        Returns:
+            Расписание появлений spawn_times (тот же список)
+        """
+        self.planned_until = max(self.planned_until, horizon)
+        last = self.spawn_times[-1] if self.spawn_times else self.last_spawn_time
+        while last <= horizon:
+            last += self._get_random_interval()
+            self.spawn_times.append(last)
+        return self.spawn_times
+
+    def set_spawn_interval(self, min_interval_ms: float, max_interval_ms: float):
+        """
+        Задаёт диапазон интервалов появления и заново расписывает ещё не наступившие появления.
+
+        Диапазон, как и в конструкторе, делится на плотность появления spawn_density.
+
+        Args:
+            min_interval_ms: Минимальный интервал в миллисекундах
+            max_interval_ms: Максимальный интервал в миллисекундах
+        """
+        self.min_interval_ms = min_interval_ms / self.spawn_density
+        self.max_interval_ms = max_interval_ms / self.spawn_density
+
+        # Ещё не наступившие появления расписываются заново до того же горизонта
+        del self.spawn_times[self.cursor :]
+        self.plan_until(self.planned_until)
+        if self.next_spawn is not None:
+            self._schedule_next_spawn()
+
+    def _schedule_next_spawn(self):
+        """Ставит в планировщик следующее появление из расписания (дописывает его, если оно кончилось)."""
+        self.scheduler.cancel(self.next_spawn)
+        if self.cursor == len(self.spawn_times):
+            self.plan_until(self.spawn_times[-1] if self.spawn_times else self.last_spawn_time)
+        self.next_spawn = self.scheduler.schedule_at(self.spawn_times[self.cursor], self._on_spawn_due)
+
+    def _on_spawn_due(self):
+        """Наступило время появления: создаём объект и планируем следующий."""
+        self._spawn()
+        self.last_spawn_time = self.scheduler.clock
+        self.cursor += 1
+        self._schedule_next_spawn()
+
+    def update(self, delta_time: float):
+        """Обновляет объекты дорожки (новые создаются по расписанию планировщика)."""
+        if self.owns_scheduler:
+            self.scheduler.advance(delta_time)
+
+        self._update_lane(delta_time)
+
+    def spawn(self):
+        """Создаёт объект вне расписания (нагрузочные сценарии и бенчмарки)."""
+        self._spawn()
+
+    def _despawn(self, mask: np.ndarray):
+        """
+        Убирает объекты дорожки по маске из хранилища и слоя и возвращает их в пул.
+
+        Строки маски — это и индексы спрайтов в sprite_list, поэтому спрайты снимаются
+        через pop с конца, без поиска спрайта в списке, как у SpriteList.remove.
+
+        Args:
+            mask: Булев массив длины store.count (True — убрать)
+        """
+        rows = np.flatnonzero(mask).tolist()
+        for sprite in self.store.remove(mask):
+            self.pool.release(sprite)
+        for row in reversed(rows):
+            self.sprite_list.pop(row)
+
+    @abstractmethod
+    def _spawn(self):
+        """Создаёт новый объект дорожки."""
+
+    @abstractmethod
+    def _update_lane(self, delta_time: float):
+        """Двигает объекты дорожки и убирает ненужные."""
+
+    def stop_spawning(self):
+        """Останавливает создание новых объектов."""
+        self.is_active = False
+        self.scheduler.cancel(self.next_spawn)
+        self.next_spawn = None
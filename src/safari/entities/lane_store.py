@@ -0,0 +1,227 @@
+"""
+Колоночное хранилище объектов дорожки (structure of arrays).
+
+Позиции, скорости, флаги жизни и время анимации всех объектов дорожки
+хранятся в массивах NumPy. Движение, проверка выхода за границу и учёт
+убийств выполняются одной векторной операцией на дорожку, а спрайты
+только синхронизируются для отрисовки и проверки столкновений.
+"""
+
+import arcade
+import numpy as np
+
+# Имена колонок хранилища
+COLUMNS = ("x", "y", "bottom", "top", "speed", "despawn_x", "alive", "anim_time", "frame", "serial")
+
+
+class LaneStore:
+    """
+    Хранилище объектов одной дорожки.
+
+    Особенности:
+    - Строка i массивов соответствует спрайту sprites[i]
+    - Ёмкость массивов растёт удвоением
+    - Для анимированных объектов кадр вычисляется по общей анимации дорожки,
+      которая берётся у первого добавленного спрайта
+    """
+
+    def __init__(self, animated: bool = False, capacity: int = 16):
+        """
+        Args:
+            animated: Объекты дорожки — TextureAnimationSprite с общей анимацией
+            capacity: Начальная ёмкость массивов
+        """
+        self.count = 0
+        self.spawned = 0  # Сколько объектов добавлено за всё время (для отслеживания изменений)
+        self.sprites: list[arcade.Sprite] = []
+        self._rows: dict[arcade.Sprite, int] = {}  # Спрайт -> номер строки
+
+        # Колонки
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.bottom = np.zeros(capacity)  # Нижняя граница хитбокса
+        self.top = np.zeros(capacity)  # Верхняя граница хитбокса
+        self.speed = np.zeros(capacity)
+        self.despawn_x = np.zeros(capacity)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.anim_time = np.zeros(capacity)
+        self.frame = np.zeros(capacity, dtype=np.intp)
+        self.serial = np.zeros(capacity, dtype=np.int64)  # Порядковый номер появления (растёт с каждым add)
+
+        # Временная шкала анимации в миллисекундах (как в arcade.TextureAnimation)
+        self.animated = animated
+        self.animation: arcade.TextureAnimation | None = None
+        self._textures: list[arcade.Texture] = []
+        self._timeline_ms = np.zeros(0, dtype=np.int64)
+        self._duration_ms = 0
+
+    def _bind_animation(self, animation: arcade.TextureAnimation):
+        """Запоминает общую анимацию дорожки и строит её временную шкалу."""
+        durations = [keyframe.duration for keyframe in animation.keyframes]
+        self.animation = animation
+        self._textures = [keyframe.texture for keyframe in animation.keyframes]
+        self._timeline_ms = np.cumsum([0, *durations[:-1]], dtype=np.int64)
+        self._duration_ms = animation.duration_ms
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _grow(self):
+        """Удваивает ёмкость всех колонок."""
+        capacity = max(len(self.x) * 2, 1)
+        for name in COLUMNS:
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[: self.count] = column[: self.count]
+            setattr(self, name, grown)
+
+    def add(self, sprite: arcade.Sprite, speed: float, despawn_x: float):
+        """
+        Добавляет объект на дорожку.
+
+        Args:
+            sprite: Спрайт объекта (начальная позиция берётся из него)
+            speed: Скорость движения справа налево (пикселей в секунду)
+            despawn_x: X-координата, при которой объект удаляется
+        """
+        if self.count == len(self.x):
+            self._grow()
+        if self.animated and self.animation is None and isinstance(sprite, arcade.TextureAnimationSprite):
+            self._bind_animation(sprite.animation)
+
+        row = self.count
+        self.x[row] = sprite.center_x
+        self.y[row] = sprite.center_y
+        self.bottom[row] = sprite.bottom
+        self.top[row] = sprite.top
+        self.speed[row] = speed
+        self.despawn_x[row] = despawn_x
+        self.alive[row] = True
+        self.anim_time[row] = 0.0
+        self.frame[row] = 0
+        self.serial[row] = self.spawned
+
+        self.sprites.append(sprite)
+        self._rows[sprite] = row
+        self.count += 1
+        self.spawned += 1
+
+    def kill(self, sprite: arcade.Sprite):
+        """Помечает объект как убитый (флаг alive) и обновляет его вертикальные границы."""
+        row = self._rows.get(sprite)
+        if row is not None:
+            self.alive[row] = False
+            self.y[row] = sprite.center_y
+            self.bottom[row] = sprite.bottom
+            self.top[row] = sprite.top
+
+    def serial_of(self, sprite: arcade.Sprite) -> int | None:
+        """Порядковый номер появления объекта (None, если объекта уже нет на дорожке)."""
+        row = self._rows.get(sprite)
+        return None if row is None else int(self.serial[row])
+
+    def band(self) -> tuple[float, float] | None:
+        """
+        Вертикальная полоса, занятая объектами дорожки.
+
+        Returns:
+            (нижняя граница, верхняя граница) или None, если дорожка пуста
+        """
+        n = self.count
+        if n == 0:
+            return None
+        return float(self.bottom[:n].min()), float(self.top[:n].max())
+
+    def advance(self, delta_time: float):
+        """
+        Двигает все объекты дорожки и продвигает их анимацию.
+
+        Args:
+            delta_time: Время с последнего обновления в секундах
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        self.x[:n] -= self.speed[:n] * delta_time
+
+        if self.animation:
+            self.anim_time[:n] += delta_time
+            time_ms = (self.anim_time[:n] * 1000).astype(np.int64) % self._duration_ms
+            self.frame[:n] = np.searchsorted(self._timeline_ms, time_ms, side="right") - 1
+
+    def expired(self, remove_dead: bool = False) -> np.ndarray:
+        """
+        Маска объектов, которые нужно удалить.
+
+        Args:
+            remove_dead: Удалять также убитые объекты
+
+        Returns:
+            Булев массив длины count
+        """
+        mask = self.x[: self.count] <= self.despawn_x[: self.count]
+        if remove_dead:
+            mask |= ~self.alive[: self.count]
+        return mask
+
+    def remove(self, mask: np.ndarray) -> list[arcade.Sprite]:
+        """
+        Удаляет объекты по маске и уплотняет колонки.
+
+        Args:
+            mask: Булев массив длины count (True — удалить)
+
+        Returns:
+            Список удалённых спрайтов
+        """
+        if not mask.any():
+            return []
+
+        n = self.count
+        keep = ~mask
+        removed = [sprite for sprite, drop in zip(self.sprites, mask.tolist(), strict=True) if drop]
+        kept = [sprite for sprite, drop in zip(self.sprites, mask.tolist(), strict=True) if not drop]
+
+        for name in COLUMNS:
+            column = getattr(self, name)
+            remaining = column[:n][keep]
+            column[: len(remaining)] = remaining
+
+        self.count = len(kept)
+        self.sprites = kept
+        self._rows = {sprite: row for row, sprite in enumerate(kept)}
+        return removed
+
+    def dead_sprites(self) -> list[arcade.Sprite]:
+        """Спрайты, помеченные как убитые."""
+        alive = self.alive[: self.count]
+        if alive.all():
+            return []
+        return [sprite for sprite, is_alive in zip(self.sprites, alive.tolist(), strict=True) if not is_alive]
+
+    def sync(self):
+        """Переносит позиции и кадры анимации из колонок в спрайты."""
+        n = self.count
+        xs = self.x[:n].tolist()
+
+        if not self.animation:
+            for sprite, x in zip(self.sprites, xs, strict=True):
+                sprite.center_x = x
+            return
+
+        textures = self._textures
+        for row, (sprite, x, frame) in enumerate(zip(self.sprites, xs, self.frame[:n].tolist(), strict=True)):
+            sprite.center_x = x
+            texture = textures[frame]
+            if sprite.texture is not texture:
+                sprite.texture = texture
+                # Хитбокс кадра может отличаться по высоте
+                self.bottom[row] = sprite.bottom
+                self.top[row] = sprite.top
+
+    def clear(self):
+        """Удаляет все объекты."""
+        self.count = 0
+        self.sprites = []
+        self._rows = {}
@@ -25,6 +25,10 @@ class Barrier(arcade.Sprite):
         self.center_x = x
         self.center_y = y + BARRIER_Y_OFFSET
 
+        # Точка появления (для повторного использования из пула)
+        self.spawn_x = x
+        self.spawn_y = y + BARRIER_Y_OFFSET
+
         # Инициализация текстуры
         self.barrier_texture = None
 
@@ -54,6 +58,11 @@ class Barrier(arcade.Sprite):
         self.width = self.texture.width
         self.height = self.texture.height
 
+    def reset(self):
+        """Возвращает барьер в точку появления (при повторном использовании из пула)."""
+        self.center_x = self.spawn_x
+        self.center_y = self.spawn_y
+
     def on_update(self, delta_time: float = 1 / 60):
         """Обновление состояния: движение справа налево."""
         # Проверяем, что текстуры загружены
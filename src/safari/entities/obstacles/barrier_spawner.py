@@ -1,74 +1,77 @@
 import random
+from functools import partial
 
 import arcade
 
-from src.safari.constants import BARRIER_SPAWN_INTERVAL_MAX, BARRIER_SPAWN_INTERVAL_MIN
+from src.safari.constants import BARRIER_DESPAWN_X, BARRIER_SPAWN_INTERVAL_MAX, BARRIER_SPAWN_INTERVAL_MIN
+from src.safari.entities.entity_pool import EntityPool
+from src.safari.entities.lane_spawner import LaneSpawner
+from src.safari.entities.lane_store import LaneStore
 from src.safari.entities.obstacles.barrier import Barrier
+from src.safari.scheduler import Scheduler
 
 
-class BarrierSpawner:
+class BarrierSpawner(LaneSpawner):
     """
     Управляет появлением барьеров на дорожке.
     Производит случайные интервалы 2-3 секунды.
     """
 
-    def __init__(self, sprite_list: arcade.SpriteList):
-        self.time_since_last_spawn = 0.0
-        self.spawn_interval = self._get_random_interval()
-        self.active_barriers: list[Barrier] = []
+    def __init__(
+        self,
+        sprite_list: arcade.SpriteList,
+        rng: random.Random | None = None,
+        spawn_density: float = 1.0,
+        scheduler: Scheduler | None = None,
+        lane=None,
+    ):
+        """
+        Args:
+            sprite_list: Список-владелец объектов дорожки (он же слой отрисовки)
+            rng: Собственный генератор случайных чисел дорожки
+            spawn_density: Во сколько раз чаще создавать объекты (интервалы делятся на это число)
+            scheduler: Планировщик раунда (None — свой, его часы двигает update)
+            lane: Запись таблицы дорожек (Lane): интервалы, скорость и дорожка вместо констант
+        """
+        min_interval_ms, max_interval_ms = (
+            lane.spawn_interval_ms if lane else (BARRIER_SPAWN_INTERVAL_MIN, BARRIER_SPAWN_INTERVAL_MAX)
+        )
+        super().__init__(min_interval_ms, max_interval_ms, rng, spawn_density, scheduler)
         self.sprite_list = sprite_list
+        self.store = LaneStore()  # Колонки позиций и скоростей
+        self.speed = lane.speed if lane else None  # None — скорость класса объекта
+        factory = partial(Barrier, y=lane.track_y) if lane else Barrier
+        self.pool = EntityPool(factory, name=lane.name if lane else "barrier")  # Переиспользуемые барьеры
 
         # Сразу создаем первый барьер при инициализации
-        self.is_active = True  # Можно ли создавать новые препятствия
-        self._spawn_barrier()
-        self.time_since_last_spawn = 0.0  # Сбрасываем таймер
-        self.spawn_interval = self._get_random_interval()  # Генерируем новый интервал
-
-    def _get_random_interval(self) -> float:
-        """Случайный интервал от 2 до 3 секунд."""
-        interval = random.uniform(  # noqa: S311 # nosec
-            BARRIER_SPAWN_INTERVAL_MIN / 1000,  # Конвертируем в секунды
-            BARRIER_SPAWN_INTERVAL_MAX / 1000,
-        )
-        return interval
+        self._spawn()
+        self._schedule_next_spawn()
 
-    def update(self, delta_time: float):
-        """Проверяет, нужно ли создать новый барьер."""
-        self.time_since_last_spawn += delta_time
+    @property
+    def active_barriers(self) -> arcade.SpriteList:
+        """Активные барьеры (тот же список, что и sprite_list, без копии)."""
+        return self.sprite_list
 
-        # Проверяем интервал
-        if self.time_since_last_spawn >= self.spawn_interval:
-            self._spawn_barrier()
-            self.time_since_last_spawn = 0.0
-            self.spawn_interval = self._get_random_interval()
+    def start(self):
+        """Старт раунда: создаёт ещё один барьер поверх созданного при инициализации."""
+        self._spawn()
 
-        # Обновляем и удаляем старые барьеры
-        self._update_barriers(delta_time)
-
-    def _spawn_barrier(self):
+    def _spawn(self):
         """Создаёт новый барьер."""
-        barrier = Barrier()
-        barrier.setup()  # ← Явно вызываем setup для загрузки текстур
+        barrier = self.pool.acquire()
+        if self.speed is not None:
+            barrier.speed = self.speed
+        barrier.setup()  # ← Явно вызываем setup для загрузки текстур (повторно не загружает)
 
-        self.active_barriers.append(barrier)
         self.sprite_list.append(barrier)
+        self.store.add(barrier, barrier.speed, BARRIER_DESPAWN_X)
 
-    def _update_barriers(self, delta_time: float):
-        """Обновляет все активные барьеры и удаляет не нужные."""
-        barriers_to_remove = []
-
-        for barrier in self.active_barriers:
-            barrier.on_update(delta_time)
-
-            if barrier.should_be_removed():
-                barriers_to_remove.append(barrier)
+    def _update_lane(self, delta_time: float):
+        """Обновляет все активные барьеры и удаляет не нужные (векторно по дорожке)."""
+        self.store.advance(delta_time)
 
-        # Удаляем помеченные барьеры
-        for barrier in barriers_to_remove:
-            self.active_barriers.remove(barrier)
-            self.sprite_list.remove(barrier)
+        # Удаляем барьер, если он вышел за левую границу
+        self._despawn(self.store.expired())
 
-    # Методы для управления состоянием
-    def stop_spawning(self):
-        """Останавливает создание новых препятствий."""
-        self.is_active = False
+        # Переносим позиции в спрайты
+        self.store.sync()
@@ -28,6 +28,11 @@ class Palm(arcade.Sprite):
         self.center_x = x
         self.center_y = y + PALM_Y_OFFSET
 
+        # Точка появления и дорожка (для повторного использования из пула и сбитой пальмы)
+        self.spawn_x = x
+        self.spawn_y = y + PALM_Y_OFFSET
+        self.track_y = y
+
         # Инициализация текстур
         self.alive_texture = None
         self.dead_texture = None
@@ -64,6 +69,14 @@ class Palm(arcade.Sprite):
         self.width = self.texture.width
         self.height = self.texture.height
 
+    def reset(self):
+        """Возвращает живую пальму в точку появления (при повторном использовании из пула)."""
+        self.center_x = self.spawn_x
+        self.center_y = self.spawn_y
+        self.is_alive = True
+        if self.alive_texture is not None:
+            self.texture = self.alive_texture
+
     def on_update(self, delta_time: float = 1 / 60):
         """Обновление состояния: движение справа налево."""
         # Проверяем, что текстуры загружены
@@ -79,7 +92,7 @@ class Palm(arcade.Sprite):
             return
 
         self.texture = self.dead_texture
-        self.center_y = TRACK_Y_PALM + PALMDEAD_Y_OFFSET
+        self.center_y = self.track_y + PALMDEAD_Y_OFFSET
         self.is_alive = False
 
     def should_be_removed(self) -> bool:
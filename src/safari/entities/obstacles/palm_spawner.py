@@ -1,75 +1,76 @@
 import random
+from functools import partial
 
 import arcade
 
-from src.safari.constants import PALM_SPAWN_INTERVAL_MAX, PALM_SPAWN_INTERVAL_MIN
+from src.safari.constants import PALM_DESPAWN_X, PALM_SPAWN_INTERVAL_MAX, PALM_SPAWN_INTERVAL_MIN
+from src.safari.entities.entity_pool import EntityPool
+from src.safari.entities.lane_spawner import LaneSpawner
+from src.safari.entities.lane_store import LaneStore
 from src.safari.entities.obstacles.palm import Palm
+from src.safari.scheduler import Scheduler
 
 
-class PalmSpawner:
+class PalmSpawner(LaneSpawner):
     """
     Управляет появлением пальм на дорожке.
     Производит случайные интервалы 4-6 секунд.
     """
 
-    def __init__(self, sprite_list: arcade.SpriteList):
-        self.time_since_last_spawn = 0.0
-        self.spawn_interval = self._get_random_interval()
-        self.active_palms = arcade.SpriteList()
+    def __init__(
+        self,
+        sprite_list: arcade.SpriteList,
+        rng: random.Random | None = None,
+        spawn_density: float = 1.0,
+        scheduler: Scheduler | None = None,
+        lane=None,
+    ):
+        """
+        Args:
+            sprite_list: Список-владелец объектов дорожки (он же слой отрисовки)
+            rng: Собственный генератор случайных чисел дорожки
+            spawn_density: Во сколько раз чаще создавать объекты (интервалы делятся на это число)
+            scheduler: Планировщик раунда (None — свой, его часы двигает update)
+            lane: Запись таблицы дорожек (Lane): интервалы, скорость и дорожка вместо констант
+        """
+        min_interval_ms, max_interval_ms = (
+            lane.spawn_interval_ms if lane else (PALM_SPAWN_INTERVAL_MIN, PALM_SPAWN_INTERVAL_MAX)
+        )
+        super().__init__(min_interval_ms, max_interval_ms, rng, spawn_density, scheduler)
         self.sprite_list = sprite_list
+        self.store = LaneStore()  # Колонки позиций и скоростей
+        self.speed = lane.speed if lane else None  # None — скорость класса объекта
+        factory = partial(Palm, y=lane.track_y) if lane else Palm
+        self.pool = EntityPool(factory, name=lane.name if lane else "palm")  # Переиспользуемые пальмы
 
         # Сразу создаем первую пальму при инициализации
-        self.is_active = True  # Можно ли создавать новые пальмы
-        self._spawn_palm()
-        self.time_since_last_spawn = 0.0  # Сбрасываем таймер
-        self.spawn_interval = self._get_random_interval()  # Генерируем новый интервал
-
-    def _get_random_interval(self) -> float:
-        """Случайный интервал от 4 до 6 секунд."""
-        interval = random.uniform(  # noqa: S311 # nosec
-            PALM_SPAWN_INTERVAL_MIN / 1000,  # Конвертируем в секунды
-            PALM_SPAWN_INTERVAL_MAX / 1000,
-        )
-        return interval
+        self._spawn()
+        self._schedule_next_spawn()
 
-    def update(self, delta_time: float):
-        """Проверяет, нужно ли создать новую пальму."""
-        self.time_since_last_spawn += delta_time
+    @property
+    def active_palms(self) -> arcade.SpriteList:
+        """Активные пальмы (тот же список, что и sprite_list, без копии)."""
+        return self.sprite_list
 
-        # Проверяем интервал
-        if self.time_since_last_spawn >= self.spawn_interval:
-            self._spawn_palm()
-            self.time_since_last_spawn = 0.0
-            self.spawn_interval = self._get_random_interval()
+    def start(self):
+        """Старт раунда: первая пальма уже создана при инициализации."""
 
-        # Обновляем и удаляем старые пальмы
-        self._update_palms(delta_time)
-
-    def _spawn_palm(self):
+    def _spawn(self):
         """Создаёт новую пальму."""
-        palm = Palm()
-        palm.setup()  # Явно вызываем setup для загрузки текстур
+        palm = self.pool.acquire()
+        if self.speed is not None:
+            palm.speed = self.speed
+        palm.setup()  # Явно вызываем setup для загрузки текстур (повторно не загружает)
 
-        self.active_palms.append(palm)
         self.sprite_list.append(palm)
+        self.store.add(palm, palm.speed, PALM_DESPAWN_X)
 
-    def _update_palms(self, delta_time: float):
-        """Обновляет все активные пальмы и удаляет не нужные."""
-        palms_to_remove = []
-
-        for palm in self.active_palms:
-            palm.on_update(delta_time)
-
-            # Удаляем пальму, только если она вышла за левую границу
-            if palm.should_be_removed():
-                palms_to_remove.append(palm)
+    def _update_lane(self, delta_time: float):
+        """Обновляет все активные пальмы и удаляет не нужные (векторно по дорожке)."""
+        self.store.advance(delta_time)
 
-        # Удаляем помеченные пальмы
-        for palm in palms_to_remove:
-            self.active_palms.remove(palm)
-            self.sprite_list.remove(palm)
+        # Удаляем пальму, только если она вышла за левую границу
+        self._despawn(self.store.expired())
 
-    # Методы для управления состоянием
-    def stop_spawning(self):
-        """Останавливает создание новых пальм."""
-        self.is_active = False
+        # Переносим позиции в спрайты
+        self.store.sync()
@@ -1,6 +1,7 @@
 import arcade
 
 from ..constants import TRACK_ANIMATION_AMPLITUDE, TRACK_ANIMATION_SPEED, TRACK_WIDTH
+from ..resource_manager import get_texture
 
 
 class Track(arcade.Sprite):
@@ -19,7 +20,7 @@ class Track(arcade.Sprite):
         self.center_y = y
 
         # Единая текстура для дорожки
-        self.texture = arcade.load_texture(f":slot_machine:/images/tracks/track_{track_index}.png")
+        self.texture = get_texture(f":slot_machine:/images/tracks/track_{track_index}.png")
 
         self.offset = 0
         self.direction = 1
@@ -0,0 +1,81 @@
+"""
+События раунда и шина публикации/подписки.
+
+Вместо опроса счёта и патронов на каждом кадре игровые объекты публикуют
+события, когда состояние действительно меняется, а индикаторы и сцена
+подписываются на нужные им события:
+- ShotFired — BulletManager после выстрела
+- AnimalKilled — CollisionSystem после попадания в животное
+- Victory — ScoreManager, когда набраны все цели
+- TimeUp — GameSession, когда вышло время раунда
+
+Обработчики вызываются сразу при публикации, в порядке подписки.
+"""
+
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ShotFired:
+    """Произведён выстрел."""
+
+    shots_fired: int  # Выстрелов за раунд, включая этот
+
+
+@dataclass(frozen=True)
+class AnimalKilled:
+    """Пуля попала в животное."""
+
+    animal_type: str  # "rhino", "bizon" или "gazelle"
+    kills: int  # Убито животных этого типа за раунд, включая это
+
+
+@dataclass(frozen=True)
+class Victory:
+    """Все цели поражены."""
+
+    score: dict  # ScoreManager.get_score_data() в момент победы
+
+
+@dataclass(frozen=True)
+class TimeUp:
+    """Время раунда вышло."""
+
+    elapsed_time: float
+
+
+class EventBus:
+    """
+    Шина событий одного раунда.
+
+    Особенности:
+    - Подписка по типу события: subscribe(ShotFired, handler)
+    - publish(event) синхронно вызывает обработчики типа события
+    - Событие без подписчиков ничего не стоит, кроме поиска в словаре
+    """
+
+    def __init__(self):
+        self.handlers: dict[type, list[Callable]] = defaultdict(list)
+
+    def subscribe(self, event_type: type, handler: Callable):
+        """
+        Подписывает обработчик на события типа.
+
+        Args:
+            event_type: Класс события
+            handler: Функция, принимающая событие
+        """
+        self.handlers[event_type].append(handler)
+
+    def unsubscribe(self, event_type: type, handler: Callable):
+        """Отписывает обработчик (если он был подписан)."""
+        handlers = self.handlers.get(event_type)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+
+    def publish(self, event):
+        """Передаёт событие всем подписчикам его типа."""
+        for handler in self.handlers.get(type(event), ()):
+            handler(event)
@@ -0,0 +1,149 @@
+"""
+Профилирование кадра по стадиям (F3 в игре или safari --frame-profile).
+
+Каждая стадия GameView.on_update и on_draw замеряется на каждом кадре,
+последние FRAME_PROFILE_WINDOW замеров хранятся в кольцевом буфере,
+по которому считаются p50/p95/p99. Выключенный профиль ничего не замеряет:
+begin() и lap() сразу возвращаются после проверки флага.
+Модуль не импортирует arcade, чтобы его можно было использовать без окна.
+"""
+
+import time
+
+import numpy as np
+
+from .constants import FRAME_PROFILE_WINDOW
+
+
+class FrameTimeRing:
+    """
+    Кольцевой буфер времён стадии фиксированного размера.
+
+    Особенности:
+    - Запись на каждом кадре без выделения памяти
+    - Перцентили считаются только по заполненной части буфера
+    """
+
+    def __init__(self, size: int = FRAME_PROFILE_WINDOW):
+        """
+        Args:
+            size: Сколько последних замеров хранить
+        """
+        self.samples = np.zeros(size, dtype=np.float64)
+        self.index = 0  # Куда запишется следующий замер
+        self.count = 0  # Сколько замеров записано (не больше size)
+
+    def push(self, seconds: float):
+        """Записывает замер, вытесняя самый старый."""
+        self.samples[self.index] = seconds
+        self.index = (self.index + 1) % len(self.samples)
+        if self.count < len(self.samples):
+            self.count += 1
+
+    def percentiles(self, quantiles=(50, 95, 99)) -> tuple[float, ...]:
+        """
+        Перцентили времени стадии в миллисекундах.
+
+        Args:
+            quantiles: Какие перцентили посчитать
+
+        Returns:
+            Значения в том же порядке (нули, если замеров ещё нет)
+        """
+        if not self.count:
+            return tuple(0.0 for _ in quantiles)
+        values = np.percentile(self.samples[: self.count], quantiles) * 1000
+        return tuple(float(value) for value in values)
+
+
+class FrameProfiler:
+    """
+    Замеры стадий кадра.
+
+    Особенности:
+    - begin() отмечает начало цепочки стадий (обновление или отрисовка)
+    - lap(name) записывает время с предыдущей отметки как стадию name
+    - total(name) записывает время всей цепочки с момента begin()
+    - Стадии сохраняют порядок первого появления (для таблицы и оверлея)
+    """
+
+    def __init__(self, window: int = FRAME_PROFILE_WINDOW):
+        """
+        Args:
+            window: Размер кольцевого буфера каждой стадии
+        """
+        self.enabled = False
+        self.window = window
+        self.stages: dict[str, FrameTimeRing] = {}
+        self._begin: float | None = None
+        self._last: float | None = None
+
+    def enable(self, enabled: bool = True):
+        """Включает или выключает замеры; при включении буферы очищаются."""
+        if enabled and not self.enabled:
+            self.stages.clear()
+        self.enabled = enabled
+        self._begin = self._last = None
+
+    def toggle(self) -> bool:
+        """Переключает замеры и возвращает новое состояние."""
+        self.enable(not self.enabled)
+        return self.enabled
+
+    def begin(self):
+        """Начинает цепочку стадий."""
+        if not self.enabled:
+            return
+        self._begin = self._last = time.perf_counter()
+
+    def lap(self, name: str):
+        """
+        Записывает стадию, закончившуюся сейчас.
+
+        Args:
+            name: Название стадии
+        """
+        if not self.enabled or self._last is None:
+            return
+        now = time.perf_counter()
+        self._record(name, now - self._last)
+        self._last = now
+
+    def total(self, name: str):
+        """
+        Записывает время всей цепочки с момента begin().
+
+        Args:
+            name: Название итоговой стадии
+        """
+        if not self.enabled or self._begin is None:
+            return
+        now = time.perf_counter()
+        self._record(name, now - self._begin)
+        self._last = now
+
+    def _record(self, name: str, seconds: float):
+        ring = self.stages.get(name)
+        if ring is None:
+            ring = self.stages[name] = FrameTimeRing(self.window)
+        ring.push(seconds)
+
+    def summary(self) -> dict[str, tuple[float, ...]]:
+        """
+        Перцентили всех стадий.
+
+        Returns:
+            {стадия: (p50, p95, p99)} в миллисекундах
+        """
+        return {name: ring.percentiles() for name, ring in self.stages.items()}
+
+    def report(self) -> str:
+        """Таблица перцентилей стадий для вывода в консоль."""
+        lines = [f"{'Стадия':<24} {'p50, мс':>8} {'p95, мс':>8} {'p99, мс':>8}"]
+        for name, (p50, p95, p99) in self.summary().items():
+            lines.append(f"{name:<24} {p50:>8.2f} {p95:>8.2f} {p99:>8.2f}")
+        return "\n".join(lines)
+
+
+# Общий профиль кадра игры
+frame_profiler = FrameProfiler()
@@ -0,0 +1,42 @@
+"""
+Основное окно игры.
+"""
+
+import arcade
+
+from .constants import RECORD_REPLAYS, SCREEN_HEIGHT, SCREEN_TITLE, SCREEN_WIDTH
+from .resource_loader import ResourceLoader
+from .scheduler import Scheduler
+from .simulation.scenario import DEFAULT_SCENARIO, Scenario
+from .ui.cabinet import Cabinet
+from .views.rules_view import RulesView
+
+
+class SafariGame(arcade.Window):
+    """Основное окно игры."""
+
+    def __init__(
+        self,
+        loader: ResourceLoader | None = None,
+        scenario: Scenario = DEFAULT_SCENARIO,
+        record_replays: bool = RECORD_REPLAYS,
+    ):
+        """
+        Args:
+            loader: Фоновая загрузка ресурсов (None — ресурсы уже загружены)
+            scenario: Сценарий, с которым запускается каждый раунд
+            record_replays: Записывать ввод раундов в архив
+        """
+        super().__init__(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
+        self.scenario = scenario
+        self.record_replays = record_replays
+        # Часы приложения: отложенные действия сцен вне раунда (разрешение ввода после игры).
+        # Раунд идёт по своему планировщику GameSession.scheduler
+        self.scheduler = Scheduler()
+        # Корпус автомата создаётся один раз и рисуется всеми сценами
+        self.cabinet = Cabinet()
+        self.show_view(RulesView(loader))
+
+    def on_update(self, delta_time: float):
+        """Сдвигает часы приложения (вызывается после on_update текущей сцены)."""
+        self.scheduler.advance(delta_time)
@@ -1,28 +1,83 @@
 """
 Точка входа в игру.
 Запускает окно и отображает первую сцену — RulesView.
+Ресурсы игры загружаются в фоне, пока на экране появляются правила.
+
+Тяжёлые модули (arcade, окно, сцены) импортируются внутри main(), чтобы
+режим --startup-profile мог замерить и их импорт. Игровая сцена, создатели
+и система столкновений импортируются только при переходе в игру.
 """
 
-import arcade
+import argparse
+import logging
 
-from src.safari.resource_manager import setup_resources
+from .startup_profile import startup_profile
 
-from .constants import SCREEN_HEIGHT, SCREEN_TITLE, SCREEN_WIDTH
-from .views.rules_view import RulesView
 
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Разбирает аргументы командной строки."""
+    parser = argparse.ArgumentParser(prog="safari", description="САФАРИ - игра из советских игровых автоматов")
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="вывести время каждой фазы запуска",
+    )
+    parser.add_argument(
+        "--frame-profile",
+        action="store_true",
+        help="замерять стадии кадра с первого раунда (профиль виден сразу, как после F3)",
+    )
+    parser.add_argument(
+        "--record-replays",
+        action="store_true",
+        help="записывать ввод каждого раунда в архив replays/ (или SAFARI_RECORD_REPLAYS=1)",
+    )
+    parser.add_argument(
+        "--scenario",
+        default="default",
+        help="сценарий раунда: default, debug, dense, unlimited_ammo, stress или путь к JSON",
+    )
+    return parser.parse_args(argv)
 
-class SafariGame(arcade.Window):
-    """Основное окно игры."""
 
-    def __init__(self):
-        super().__init__(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
-        self.show_view(RulesView())
+def main(argv: list[str] | None = None):
+    """Запуск приложения."""
+    args = parse_args(argv)
+    # Сообщения раунда (выстрелы, появления, попадания) — в консоль, как и остальной вывод игры
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.startup_profile:
+        startup_profile.enable()
 
+    with startup_profile.phase("Импорт arcade"):
+        import arcade
+
+    with startup_profile.phase("Импорт constants"):
+        from . import constants
+
+    if args.frame_profile:
+        from .frame_profiler import frame_profiler
+
+        frame_profiler.enable()
+
+    with startup_profile.phase("Импорт окна и RulesView"):
+        from .game_window import SafariGame
+        from .resource_loader import ResourceLoader
+        from .resource_manager import load_fonts, register_resources
+        from .simulation.scenario import load_scenario
+
+    scenario = load_scenario(args.scenario)
+
+    # Для первого кадра нужны только шрифты правил, остальное грузится в фоне
+    register_resources()
+    with startup_profile.phase("load_fonts"):
+        load_fonts()
+
+    loader = ResourceLoader()
+    loader.start()
+
+    with startup_profile.phase("Создание окна"):
+        SafariGame(loader, scenario, record_replays=args.record_replays or constants.RECORD_REPLAYS)
 
-def main():
-    """Запуск приложения."""
-    setup_resources()
-    SafariGame()
     arcade.run()
 
 
@@ -0,0 +1,143 @@
+"""
+Фоновая загрузка ресурсов игры.
+
+Окно и экран правил появляются сразу, а ресурсы грузятся параллельно:
+- Чтение файлов и декодирование картинок и звуков — в рабочем потоке
+- Загрузка текстур в GPU-атлас — в главном потоке, понемногу за кадр,
+  чтобы не затормозить анимацию появления окна правил
+- Модули игровой сцены импортируются в рабочем потоке заранее, чтобы
+  переход в игру не ждал их импорта
+"""
+
+import importlib
+import threading
+import time
+from collections import deque
+
+import arcade
+
+from .constants import RESOURCE_UPLOAD_BUDGET
+from .resource_manager import load_game_resources, loaded_textures
+from .startup_profile import startup_profile
+
+# Модули, которые не нужны экрану правил и импортируются в фоне
+DEFERRED_MODULES = ("src.safari.views.game_view",)
+
+
+class ResourceLoader:
+    """
+    Конвейер фоновой загрузки ресурсов.
+
+    Особенности:
+    - start() запускает декодирование в рабочем потоке
+    - update() вызывается на каждом кадре из главного потока и выгружает
+      готовые текстуры в GPU, пока не истечёт бюджет времени кадра
+    - is_done становится True, когда все текстуры выгружены
+    - Ошибка рабочего потока запоминается и пробрасывается из wait() и update(),
+      а is_done остаётся False — игра не начнётся без ресурсов
+    """
+
+    def __init__(self, upload_budget: float = RESOURCE_UPLOAD_BUDGET, preload_modules: bool = True):
+        """
+        Args:
+            upload_budget: Сколько секунд кадра можно тратить на выгрузку текстур
+            preload_modules: Импортировать модули игровой сцены в рабочем потоке
+        """
+        self.upload_budget = upload_budget
+        self.preload_modules = preload_modules
+        self.is_done = False
+        self.uploaded = 0  # Сколько текстур выгружено в GPU
+        self.error: Exception | None = None  # Ошибка декодирования в рабочем потоке
+
+        self._thread: threading.Thread | None = None
+        self._decoded = threading.Event()
+        self._pending: deque[arcade.Texture] | None = None  # Текстуры, ожидающие выгрузки
+        self._started_at = 0.0
+
+    @property
+    def is_decoded(self) -> bool:
+        """Декодирование в рабочем потоке завершено."""
+        return self._decoded.is_set()
+
+    def start(self):
+        """Запускает декодирование ресурсов в рабочем потоке."""
+        if self._thread:
+            return
+
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._decode, name="resource-loader", daemon=True)
+        self._thread.start()
+
+    def _decode(self):
+        """Рабочий поток: читает и декодирует текстуры, звуки и анимации."""
+        try:
+            load_game_resources()
+            if self.preload_modules:
+                with startup_profile.phase("Импорт игровой сцены"):
+                    for module in DEFERRED_MODULES:
+                        importlib.import_module(module)
+        except Exception as e:
+            self.error = e  # Пробрасывается в главный поток из wait() и update()
+        finally:
+            self._decoded.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Ждёт окончания декодирования.
+
+        Args:
+            timeout: Максимальное время ожидания в секундах (None — без ограничения)
+
+        Returns:
+            True если декодирование завершено
+
+        Raises:
+            Exception: Ошибка, с которой завершилось декодирование
+        """
+        decoded = self._decoded.wait(timeout)
+        self._raise_error()
+        return decoded
+
+    def _raise_error(self):
+        """Пробрасывает ошибку рабочего потока, если декодирование не удалось."""
+        if self.error is not None:
+            raise self.error
+
+    def update(self, atlas=None) -> bool:
+        """
+        Выгружает часть декодированных текстур в GPU (вызывать из главного потока).
+
+        Args:
+            atlas: Атлас текстур arcade (по умолчанию — атлас окна)
+
+        Returns:
+            True если все ресурсы загружены
+
+        Raises:
+            Exception: Ошибка, с которой завершилось декодирование
+        """
+        if self.is_done or not self.is_decoded:
+            return self.is_done
+        self._raise_error()
+
+        if self._pending is None:
+            self._pending = deque(loaded_textures())
+
+        if atlas is None:
+            atlas = arcade.get_window().ctx.default_atlas
+
+        # Выгружаем текстуры, пока не истёк бюджет кадра (хотя бы одну за кадр)
+        deadline = time.perf_counter() + self.upload_budget
+        while self._pending:
+            atlas.add(self._pending.popleft())
+            self.uploaded += 1
+            if time.perf_counter() >= deadline:
+                break
+
+        if not self._pending:
+            self.is_done = True
+            print(f"📦 Ресурсы загружены за {time.perf_counter() - self._started_at:.2f} с")
+            startup_profile.mark("Ресурсы загружены")
+            startup_profile.print_report()
+
+        return self.is_done
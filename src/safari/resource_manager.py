@@ -25,6 +25,7 @@ from .constants import (
     HUNTER_3_SPRITE,
     HUNTER_JUMP_DURATION,
     HUNTER_JUMP_SPRITE,
+    IMAGES_PREFIX,
     PALM_ALIVE_SPRITE,
     PALM_DEAD_SPRITE,
     RESOURCES_PATH,
@@ -37,6 +38,9 @@ from .constants import (
     SHOT_INDICATOR_PATHS,
     SHOT_SOUND_PATH,
 )
+from .sound_cache import sound_cache
+from .startup_profile import startup_profile
+from .texture_atlas import TextureAtlas
 
 
 # Простой DateTransferObject для текстур
@@ -44,6 +48,9 @@ from .constants import (
 class Textures:
     """Простой контейнер для всех загруженных текстур, анимаций и звуков."""
 
+    # Атлас, из которого вырезаются все текстуры (None — грузим отдельные PNG)
+    atlas: TextureAtlas | None = None
+
     # Анимации животных
     rhino_animation: arcade.TextureAnimation | None = None
     bizon_animation: arcade.TextureAnimation | None = None
@@ -96,106 +103,106 @@ def load_fonts():
         print(f"❌ Ошибка загрузки шрифта: {e}")
 
 
+# Текстуры, загруженные из отдельных файлов (путь -> текстура)
+_file_textures: dict[str, arcade.Texture] = {}
+
+
+def load_atlas():
+    """
+    Загружает собранный атлас текстур (одно чтение и декодирование файла).
+
+    Raises:
+        Exception: Атлас собран, но повреждён (файл не читается или не декодируется)
+    """
+    Textures.atlas = TextureAtlas.load()
+
+    if Textures.atlas:
+        print(f"✅ Загружен атлас текстур (картинок: {len(Textures.atlas.regions)})")
+    else:
+        print("⚠️ Атлас текстур не собран (make atlas) - загружаем отдельные картинки")
+
+
+def get_texture(path: str) -> arcade.Texture:
+    """
+    Возвращает текстуру по пути ресурса.
+
+    Картинки из resources/images берутся из атласа, остальные грузятся с диска один раз.
+
+    Args:
+        path: Путь вида ":slot_machine:/images/..."
+
+    Returns:
+        Текстура
+    """
+    name = path.removeprefix(IMAGES_PREFIX)
+    if Textures.atlas and name in Textures.atlas:
+        return Textures.atlas.get_texture(name)
+
+    # Картинки вне атласа (полноэкранные слои) загружаются один раз на все view
+    texture = _file_textures.get(path)
+    if texture is None:
+        texture = arcade.load_texture(path)
+        _file_textures[path] = texture
+    return texture
+
+
 def load_textures():
-    """Загрузка всех текстур в Textures."""
+    """
+    Загрузка всех текстур в Textures.
+
+    Raises:
+        Exception: Текстура не найдена или не декодируется — игра без неё не запускается
+    """
     print("🎨 Загрузка текстур...")
 
     # Загружаем текстуры пальмы
-    try:
-        Textures.palm_alive = arcade.load_texture(PALM_ALIVE_SPRITE)
-        Textures.palm_dead = arcade.load_texture(PALM_DEAD_SPRITE)
-        print("✅ Загружены текстуры пальмы")
-    except Exception as e:
-        print(f"❌ Ошибка загрузки текстур пальмы: {e}")
+    Textures.palm_alive = get_texture(PALM_ALIVE_SPRITE)
+    Textures.palm_dead = get_texture(PALM_DEAD_SPRITE)
+    print("✅ Загружены текстуры пальмы")
 
     # Загружаем текстуру барьера
-    try:
-        if BARRIER_SPRITE is not None:
-            Textures.barrier = arcade.load_texture(BARRIER_SPRITE)
-            print("✅ Загружена текстура барьера")
-        else:
-            print("⚠️ BARRIER_SPRITE не определен")
-    except Exception as e:
-        print(f"❌ Ошибка загрузки текстуры барьера: {e}")
+    if BARRIER_SPRITE is not None:
+        Textures.barrier = get_texture(BARRIER_SPRITE)
+        print("✅ Загружена текстура барьера")
+    else:
+        print("⚠️ BARRIER_SPRITE не определен")
 
     # Загружаем текстуру пули
-    try:
-        Textures.bullet = arcade.load_texture(BULLET_SPRITE_PATH)
-        print("✅ Загружена текстура пули")
-    except Exception as e:
-        print(f"❌ Ошибка загрузки текстуры пули: {e}")
+    Textures.bullet = get_texture(BULLET_SPRITE_PATH)
+    print("✅ Загружена текстура пули")
 
     # Загружаем текстуры индикаторов выстрелов
-    try:
-        Textures.shot_indicators = []
-        for _i, path in enumerate(SHOT_INDICATOR_PATHS):
-            texture = arcade.load_texture(path)
-            Textures.shot_indicators.append(texture)
-        print(f"✅ Загружены {len(Textures.shot_indicators)} текстур индикаторов выстрелов")
-    except Exception as e:
-        print(f"❌ Ошибка загрузки текстур индикаторов: {e}")
-        Textures.shot_indicators = []
+    Textures.shot_indicators = [get_texture(path) for path in SHOT_INDICATOR_PATHS]
+    print(f"✅ Загружены {len(Textures.shot_indicators)} текстур индикаторов выстрелов")
 
-    # Загружаем текстуры индикаторов животных
-    try:
-        # Газели (8 лампочек)
-        Textures.gazelle_indicators = []
-        for i, path in enumerate(GAZELLE_INDICATOR_PATHS):
-            try:
-                texture = arcade.load_texture(path)
-                Textures.gazelle_indicators.append(texture)
-            except Exception as e:
-                print(f"❌ Ошибка загрузки индикатора газели #{i + 1}: {e}")
-        print(f"✅ Загружены {len(Textures.gazelle_indicators)} текстур индикаторов газелей")
-
-        # Бизоны (4 лампочки)
-        Textures.bizon_indicators = []
-        for i, path in enumerate(BIZON_INDICATOR_PATHS):
-            try:
-                texture = arcade.load_texture(path)
-                Textures.bizon_indicators.append(texture)
-            except Exception as e:
-                print(f"❌ Ошибка загрузки индикатора бизона #{i + 1}: {e}")
-        print(f"✅ Загружены {len(Textures.bizon_indicators)} текстур индикаторов бизонов")
-
-        # Носороги (1 лампочка)
-        Textures.rhino_indicators = []
-        for i, path in enumerate(RHINO_INDICATOR_PATHS):
-            try:
-                texture = arcade.load_texture(path)
-                Textures.rhino_indicators.append(texture)
-            except Exception as e:
-                print(f"❌ Ошибка загрузки индикатора носорога #{i + 1}: {e}")
-        print(f"✅ Загружены {len(Textures.rhino_indicators)} текстур индикаторов носорогов")
-
-    except Exception as e:
-        print(f"❌ Общая ошибка загрузки текстур индикаторов: {e}")
+    # Загружаем текстуры индикаторов животных: газели (8 лампочек), бизоны (4), носорог (1)
+    Textures.gazelle_indicators = [get_texture(path) for path in GAZELLE_INDICATOR_PATHS]
+    Textures.bizon_indicators = [get_texture(path) for path in BIZON_INDICATOR_PATHS]
+    Textures.rhino_indicators = [get_texture(path) for path in RHINO_INDICATOR_PATHS]
+    print(f"✅ Загружены {len(Textures.gazelle_indicators)} текстур индикаторов газелей")
+    print(f"✅ Загружены {len(Textures.bizon_indicators)} текстур индикаторов бизонов")
+    print(f"✅ Загружены {len(Textures.rhino_indicators)} текстур индикаторов носорогов")
 
     # Загружаем текстуру нажатой кнопки
-    try:
-        Textures.button_pressed = arcade.load_texture(BUTTON_PRESSED_SPRITE)
-        print("✅ Загружена текстура нажатой кнопки")
-    except Exception as e:
-        print(f"❌ Ошибка загрузки текстуры кнопки: {e}")
+    Textures.button_pressed = get_texture(BUTTON_PRESSED_SPRITE)
+    print("✅ Загружена текстура нажатой кнопки")
 
     print("🎨 Загрузка текстур завершена")
 
 
 def load_sounds():
-    # Загружаем звуки для стрельбы
-    try:
-        if FIRE_SOUND_PATH.exists():
-            Textures.fire_sound = arcade.load_sound(FIRE_SOUND_PATH)
+    # Загружаем звуки для стрельбы (декодируются один раз за процесс)
+    if FIRE_SOUND_PATH.exists():
+        fire_sound = sound_cache.effect(FIRE_SOUND_PATH)
+        if fire_sound:
+            Textures.fire_sound = fire_sound
             print("✅ Загружен звук выстрела")
-    except Exception as e:
-        print(f"❌ Ошибка загрузки звука выстрела: {e}")
 
-    try:
-        if SHOT_SOUND_PATH.exists():
-            Textures.shot_sound = arcade.load_sound(SHOT_SOUND_PATH)
+    if SHOT_SOUND_PATH.exists():
+        shot_sound = sound_cache.effect(SHOT_SOUND_PATH)
+        if shot_sound:
+            Textures.shot_sound = shot_sound
             print("✅ Загружен звук попадания")
-    except Exception as e:
-        print(f"❌ Ошибка загрузки звука попадания: {e}")
 
 
 def create_animations():
@@ -205,9 +212,9 @@ def create_animations():
     # Носорог (прямая загрузка текстур в keyframes)
     try:
         keyframes = [
-            arcade.TextureKeyframe(arcade.load_texture(RHINO_1_SPRITE), 120),
-            arcade.TextureKeyframe(arcade.load_texture(RHINO_2_SPRITE), 80),
-            arcade.TextureKeyframe(arcade.load_texture(RHINO_3_SPRITE), 120),
+            arcade.TextureKeyframe(get_texture(RHINO_1_SPRITE), 120),
+            arcade.TextureKeyframe(get_texture(RHINO_2_SPRITE), 80),
+            arcade.TextureKeyframe(get_texture(RHINO_3_SPRITE), 120),
         ]
         Textures.rhino_animation = arcade.TextureAnimation(keyframes)
         print("✅ Создана анимация носорога")
@@ -218,9 +225,9 @@ def create_animations():
     # Бизон (прямая загрузка текстур в keyframes)
     try:
         keyframes = [
-            arcade.TextureKeyframe(arcade.load_texture(BIZON_1_SPRITE), 100),
-            arcade.TextureKeyframe(arcade.load_texture(BIZON_2_SPRITE), 100),
-            arcade.TextureKeyframe(arcade.load_texture(BIZON_3_SPRITE), 100),
+            arcade.TextureKeyframe(get_texture(BIZON_1_SPRITE), 100),
+            arcade.TextureKeyframe(get_texture(BIZON_2_SPRITE), 100),
+            arcade.TextureKeyframe(get_texture(BIZON_3_SPRITE), 100),
         ]
         Textures.bizon_animation = arcade.TextureAnimation(keyframes)
         print("✅ Создана анимация бизона")
@@ -231,9 +238,9 @@ def create_animations():
     # Газель (прямая загрузка текстур в keyframes)
     try:
         keyframes = [
-            arcade.TextureKeyframe(arcade.load_texture(GAZELLE_1_SPRITE), 100),
-            arcade.TextureKeyframe(arcade.load_texture(GAZELLE_2_SPRITE), 100),
-            arcade.TextureKeyframe(arcade.load_texture(GAZELLE_3_SPRITE), 100),
+            arcade.TextureKeyframe(get_texture(GAZELLE_1_SPRITE), 100),
+            arcade.TextureKeyframe(get_texture(GAZELLE_2_SPRITE), 100),
+            arcade.TextureKeyframe(get_texture(GAZELLE_3_SPRITE), 100),
         ]
         Textures.gazelle_animation = arcade.TextureAnimation(keyframes)
         print("✅ Создана анимация газели")
@@ -244,16 +251,16 @@ def create_animations():
     try:
         # Анимация бега охотника
         hunter_run_keyframes = [
-            arcade.TextureKeyframe(arcade.load_texture(HUNTER_1_SPRITE)),
-            arcade.TextureKeyframe(arcade.load_texture(HUNTER_2_SPRITE)),
-            arcade.TextureKeyframe(arcade.load_texture(HUNTER_3_SPRITE)),
+            arcade.TextureKeyframe(get_texture(HUNTER_1_SPRITE)),
+            arcade.TextureKeyframe(get_texture(HUNTER_2_SPRITE)),
+            arcade.TextureKeyframe(get_texture(HUNTER_3_SPRITE)),
         ]
         Textures.hunter_run_animation = arcade.TextureAnimation(hunter_run_keyframes)
         print("✅ Создана анимация бега охотника")
 
         # Анимация прыжка охотника (можно сделать из одного кадра)
         hunter_jump_keyframes = [
-            arcade.TextureKeyframe(arcade.load_texture(HUNTER_JUMP_SPRITE), HUNTER_JUMP_DURATION),
+            arcade.TextureKeyframe(get_texture(HUNTER_JUMP_SPRITE), HUNTER_JUMP_DURATION),
         ]
         Textures.hunter_jump_animation = arcade.TextureAnimation(hunter_jump_keyframes)
         print("✅ Создана анимация прыжка охотника")
@@ -266,24 +273,84 @@ def create_animations():
     print("🎬 Анимации созданы")
 
 
-def setup_resources():
+def register_resources():
+    """Регистрирует префикс ресурсов ":slot_machine:"."""
     # Проверяем, что папка существует (для отладки)
     if not RESOURCES_PATH.exists():
         raise FileNotFoundError(f"Папка ресурсов не найдена: {RESOURCES_PATH.resolve()}")
 
-    # 1. Регистрируем собственный префикс для ресурсов
     # Теперь можно использовать пути вида ":slot_machine:/images/..."
     # Это позволяет легко ссылаться на ресурсы без полных путей
     arcade.resources.add_resource_handle(RESOURCES_PREFIX, RESOURCES_PATH)
 
-    # 2. Загружаем шрифты
-    load_fonts()
 
-    # 3. Загружаем текстуры
-    load_textures()
+def load_game_resources(headless: bool = False):
+    """
+    Загружает текстуры, звуки и анимации (без обращения к GPU, можно вызывать из фонового потока).
+
+    Args:
+        headless: Режим без окна — без звуков
+    """
+    # Загружаем атлас и текстуры
+    with startup_profile.phase("load_atlas"):
+        load_atlas()
+    with startup_profile.phase("load_textures"):
+        load_textures()
+
+    # Загружаем звуки
+    if not headless:
+        with startup_profile.phase("load_sounds"):
+            load_sounds()
+
+    # Создаем анимации
+    with startup_profile.phase("create_animations"):
+        create_animations()
+
+
+def loaded_textures() -> list[arcade.Texture]:
+    """
+    Все загруженные текстуры из Textures (включая кадры анимаций).
+
+    Returns:
+        Список текстур без повторов
+    """
+    textures = [
+        Textures.palm_alive,
+        Textures.palm_dead,
+        Textures.barrier,
+        Textures.bullet,
+        Textures.button_pressed,
+        *Textures.shot_indicators,
+        *Textures.gazelle_indicators,
+        *Textures.bizon_indicators,
+        *Textures.rhino_indicators,
+    ]
+    for animation in (
+        Textures.rhino_animation,
+        Textures.bizon_animation,
+        Textures.gazelle_animation,
+        Textures.hunter_run_animation,
+        Textures.hunter_jump_animation,
+    ):
+        if animation:
+            textures.extend(keyframe.texture for keyframe in animation.keyframes)
+
+    return list(dict.fromkeys(texture for texture in textures if texture))
+
+
+def setup_resources(headless: bool = False):
+    """
+    Загружает все ресурсы игры.
+
+    Args:
+        headless: Режим без окна — загружаются только текстуры и анимации (без шрифтов и звуков)
+    """
+    # 1. Регистрируем собственный префикс для ресурсов
+    register_resources()
 
-    # 4. Загружаем звуки
-    load_sounds()
+    # 2. Загружаем шрифты
+    if not headless:
+        load_fonts()
 
-    # 4. Создаем анимации
-    create_animations()
+    # 3. Загружаем текстуры, звуки и анимации
+    load_game_resources(headless=headless)
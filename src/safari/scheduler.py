@@ -0,0 +1,94 @@
+"""
+Планировщик игровых событий на одних часах.
+
+Вместо таймеров, которые каждый объект наращивает и сравнивает на каждом
+кадре, отложенные действия (появление животных и препятствий, конец раунда,
+отпускание кнопки, разрешение ввода) кладутся в кучу по времени срабатывания.
+На кадре часы сдвигаются на delta_time и вызываются только наступившие
+действия — остальные не трогаются.
+"""
+
+import heapq
+import itertools
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+
+@dataclass(order=True)
+class ScheduledCall:
+    """Отложенный вызов (сравнивается по времени, затем по порядку планирования)."""
+
+    time: float
+    sequence: int
+    callback: Callable = field(compare=False)
+    args: tuple = field(default=(), compare=False)
+    cancelled: bool = field(default=False, compare=False)
+
+
+class Scheduler:
+    """
+    Очередь отложенных вызовов по игровому времени.
+
+    Особенности:
+    - clock — игровое время в секундах (сумма delta_time всех advance)
+    - Вызовы с одинаковым временем срабатывают в порядке планирования
+    - Отмена помечает вызов, а из кучи он уходит, когда наступит его время
+    - Вызов, запланированный внутри advance на уже наступившее время, срабатывает в том же advance
+    """
+
+    def __init__(self):
+        self.clock = 0.0
+        self._queue: list[ScheduledCall] = []
+        self._sequence = itertools.count()
+
+    @property
+    def pending(self) -> int:
+        """Число запланированных (и ещё не отменённых) вызовов."""
+        return sum(1 for call in self._queue if not call.cancelled)
+
+    def schedule(self, delay: float, callback: Callable, *args) -> ScheduledCall:
+        """
+        Планирует вызов через delay секунд игрового времени.
+
+        Returns:
+            Запланированный вызов (для cancel)
+        """
+        return self.schedule_at(self.clock + delay, callback, *args)
+
+    def schedule_at(self, time: float, callback: Callable, *args) -> ScheduledCall:
+        """
+        Планирует вызов на момент time игрового времени.
+
+        Returns:
+            Запланированный вызов (для cancel)
+        """
+        call = ScheduledCall(time, next(self._sequence), callback, args)
+        heapq.heappush(self._queue, call)
+        return call
+
+    def cancel(self, call: ScheduledCall | None):
+        """Отменяет запланированный вызов (None и уже выполненные вызовы игнорируются)."""
+        if call is not None:
+            call.cancelled = True
+
+    def advance(self, delta_time: float) -> int:
+        """
+        Сдвигает часы и выполняет наступившие вызовы.
+
+        Args:
+            delta_time: Время с предыдущего кадра в секундах
+
+        Returns:
+            Число выполненных вызовов
+        """
+        self.clock += delta_time
+        queue = self._queue
+        fired = 0
+        while queue and queue[0].time <= self.clock:
+            call = heapq.heappop(queue)
+            if call.cancelled:
+                continue
+            call.cancelled = True  # Выполненный вызов нельзя выполнить или отменить повторно
+            call.callback(*call.args)
+            fired += 1
+        return fired
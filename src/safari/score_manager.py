@@ -1,59 +1,59 @@
 from .constants import (
     VICTORY_REQUIREMENTS,
 )
+from .events import EventBus, Victory
+
+# Счётчики убийств по умолчанию (ключи score_key дорожек-целей)
+SCORE_KEYS = ("rhino", "bizon", "gazelle")
 
 
 class ScoreManager:
     """
     Простой менеджер очков - только счётчики убийств.
+    Публикует Victory один раз — когда убийство завершает набор целей.
     """
 
-    def __init__(self):
-        # Счётчики убитых животных
-        self.gazelle_kills = 0
-        self.bizon_kills = 0
-        self.rhino_kills = 0
+    def __init__(self, events: EventBus | None = None, score_keys: tuple[str, ...] = SCORE_KEYS):
+        """
+        Args:
+            events: Шина событий раунда
+            score_keys: Счётчики убийств (score_key дорожек-целей)
+        """
+        self.events = events or EventBus()
+
+        # Счётчики убитых животных по ключу дорожки
+        self.kills: dict[str, int] = dict.fromkeys(score_keys, 0)
+        self.victory_announced = False
 
     def setup(self):
         pass
 
-    def register_kill(self, animal_type: str) -> bool:
-        """Добавляет убитое животное и включает индикатор."""
-        if animal_type == "gazelle":
-            self.gazelle_kills += 1
-            return True
-
-        elif animal_type == "bizon":
-            self.bizon_kills += 1
-            return True
+    def register_kill(self, score_key: str) -> int:
+        """
+        Добавляет убитое животное и объявляет победу, если цели набраны.
 
-        elif animal_type == "rhino":
-            self.rhino_kills += 1
-            return True
+        Returns:
+            Убито животных этого типа за раунд, включая это
+        """
+        kills = self.kills[score_key] = self.kills.get(score_key, 0) + 1
 
-        return False
+        if not self.victory_announced and self.is_victory():
+            self.victory_announced = True
+            self.events.publish(Victory(self.get_score_data()))
+        return kills
 
     def is_victory(self) -> bool:
         """Проверяет, достигнута ли победа."""
-        return (
-            self.gazelle_kills >= VICTORY_REQUIREMENTS["gazelle"]
-            and self.bizon_kills >= VICTORY_REQUIREMENTS["bizon"]
-            and self.rhino_kills >= VICTORY_REQUIREMENTS["rhino"]
-        )
+        return all(self.kills.get(key, 0) >= required for key, required in VICTORY_REQUIREMENTS.items())
 
     def reset(self):
         """Сбрасывает всё."""
-        self.gazelle_kills = 0
-        self.bizon_kills = 0
-        self.rhino_kills = 0
+        self.kills = dict.fromkeys(self.kills, 0)
+        self.victory_announced = False
 
     def get_score_data(self) -> dict:
         """
         Возвращает словарь с текущими данными счёта.
         Используется для передачи статистики во view.
         """
-        return {
-            "rhino_kills": self.rhino_kills,
-            "bizon_kills": self.bizon_kills,
-            "gazelle_kills": self.gazelle_kills,
-        }
+        return {f"{key}_kills": kills for key, kills in self.kills.items()}
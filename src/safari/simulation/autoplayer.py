@@ -0,0 +1,294 @@
+"""
+Автоигрок и пакетная оценка настроек сложности.
+
+Бот играет раунды без окна: на каждом кадре политика решает, стрелять ли.
+Пакетный прогон раскидывает тысячи раундов по пулу процессов и считает
+долю побед, расход патронов и распределение времени до победы:
+    uv run -m src.safari.simulation.autoplayer --policy aiming --rounds 1000
+"""
+
+import argparse
+import contextlib
+import io
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+
+from arcade.geometry import are_polygons_intersecting
+
+from ..collision.hit_prediction import lane_hit_windows
+from ..constants import VICTORY_REQUIREMENTS
+from ..entities.bullet.bullet import Bullet
+from ..resource_manager import setup_resources
+from .game_session import GameSession
+from .scenario import DEFAULT_SCENARIO, Scenario
+
+DELTA_TIME = 1 / 60
+
+
+class BotPolicy(ABC):
+    """
+    Базовая политика автоигрока.
+
+    Политика вызывается на каждом кадре перед GameSession.update и решает,
+    нажимать ли ПРОБЕЛ. Выстрел всё равно проходит проверки BulletManager.
+    """
+
+    name = "base"
+
+    def reset(self, session: GameSession):  # noqa: B027 — необязательный хук, по умолчанию ничего не делает
+        """Готовит политику к новому раунду."""
+
+    @abstractmethod
+    def should_fire(self, session: GameSession) -> bool:
+        """
+        Решает, стрелять ли на этом кадре.
+
+        Args:
+            session: Текущий раунд
+        """
+
+
+class EagerPolicy(BotPolicy):
+    """Стреляет, как только позволяют задержка, патроны и прыжок охотника."""
+
+    name = "eager"
+
+    def should_fire(self, session: GameSession) -> bool:
+        return session.bullet_manager.is_ready()
+
+
+class AimingPolicy(BotPolicy):
+    """
+    Стреляет, только если пуля, выпущенная сейчас, первой заденет нужное животное.
+
+    Особенности:
+    - Траектория пробной пули и движение целей считаются аналитически
+      (lane_hit_windows по скоростям дорожек и скорости пули)
+    - Пальма на пути пули перехватывает выстрел — такой выстрел пропускается
+    - Животные, которых уже хватает для победы, не считаются целями
+    - Цель, в которую уже летит пуля, не выбирается повторно
+    """
+
+    name = "aiming"
+    CONTACT_SAMPLES = 4  # Проверок подряд (по полкадра), чтобы касание считалось надёжным
+
+    def __init__(self):
+        self.probe: Bullet | None = None  # Пробная пуля (не добавляется ни в один список)
+        self.claims: list[tuple[float, object, str]] = []  # (время попадания, цель, тип цели)
+
+    def reset(self, session: GameSession):
+        self.claims = []
+
+    def should_fire(self, session: GameSession) -> bool:
+        if not session.bullet_manager.is_ready():
+            return False
+
+        if self.probe is None:
+            self.probe = Bullet(0, 0)
+            self.probe.setup()
+        probe = self.probe
+        hunter = session.hunter
+        probe.reset(hunter.center_x, hunter.center_y)
+
+        # Пули уже долетели до своих целей — цели снова свободны
+        now = session.elapsed_time
+        self.claims = [claim for claim in self.claims if claim[0] >= now]
+
+        # Первая цель на пути пробной пули
+        first = None
+        for target_type, store in session.collision_system.lane_stores.items():
+            for start, end, row in lane_hit_windows(probe, store):
+                if first is not None and start >= first[0]:
+                    continue
+                hit_time = self._first_contact(probe, store.sprites[row], store.speed[row], start, end)
+                if hit_time is not None and (first is None or hit_time < first[0]):
+                    first = (hit_time, store.sprites[row], target_type)
+
+        if first is None:
+            return False
+        hit_time, target, target_type = first
+        if target_type not in VICTORY_REQUIREMENTS:
+            return False
+        if any(claimed is target for _, claimed, _ in self.claims):
+            return False
+
+        score = session.score_manager.get_score_data()
+        pending = sum(1 for _, _, claimed_type in self.claims if claimed_type == target_type)
+        if score[f"{target_type}_kills"] + pending >= VICTORY_REQUIREMENTS[target_type]:
+            return False
+
+        self.claims.append((now + hit_time, target, target_type))
+        return True
+
+    def _first_contact(self, probe: Bullet, target, speed: float, start: float, end: float) -> float | None:
+        """
+        Уточняет интервал пересечения прямоугольников по настоящим хитбоксам.
+
+        Хитбоксы пробной пули и цели сдвигаются на их смещение к моменту t
+        и проверяются на пересечение с шагом в полкадра. Хитбокс животного
+        меняется вместе с кадром анимации, поэтому касание засчитывается,
+        только если пересечение держится CONTACT_SAMPLES проверок подряд.
+
+        Returns:
+            Время первого касания или None, если надёжного касания нет
+        """
+        probe_points = probe.hit_box.get_adjusted_points()
+        target_points = target.hit_box.get_adjusted_points()
+        vx, vy = probe.change_x, probe.change_y
+
+        t = start
+        contact_start = None
+        samples = 0
+        while t <= end:
+            moved_probe = [(x + vx * t, y + vy * t) for x, y in probe_points]
+            moved_target = [(x - speed * t, y) for x, y in target_points]
+            if are_polygons_intersecting(moved_probe, moved_target):
+                if samples == 0:
+                    contact_start = t
+                samples += 1
+                if samples >= self.CONTACT_SAMPLES:
+                    return contact_start
+            else:
+                samples = 0
+            t += DELTA_TIME / 2
+        return None
+
+
+POLICIES = {policy.name: policy for policy in (EagerPolicy, AimingPolicy)}
+
+
+def play_round(policy: BotPolicy, seed: int, scenario: Scenario = DEFAULT_SCENARIO) -> dict:
+    """
+    Играет один раунд без окна.
+
+    Args:
+        policy: Политика автоигрока
+        seed: Зерно раунда
+        scenario: Сценарий раунда
+
+    Returns:
+        Итог раунда (см. GameSession.get_result)
+    """
+    session = GameSession(game_time=scenario.game_time, seed=seed, scenario=scenario)
+    session.setup()
+    session.start()
+    policy.reset(session)
+
+    while not session.is_over:
+        if policy.should_fire(session):
+            session.fire()
+        session.update(DELTA_TIME)
+
+    return session.get_result()
+
+
+def init_worker():
+    """Рабочий процесс: ресурсы без окна и без сообщений загрузки."""
+    sys.stdout = io.StringIO()
+    setup_resources(headless=True)
+
+
+def play_seeds(policy_name: str, seeds: list[int], scenario: Scenario) -> list[dict]:
+    """Играет пачку раундов одной политикой (выполняется в рабочем процессе)."""
+    policy = POLICIES[policy_name]()
+    return [play_round(policy, seed, scenario) for seed in seeds]
+
+
+def run_batch(
+    policy_name: str,
+    rounds: int,
+    first_seed: int = 0,
+    workers: int | None = None,
+    scenario: Scenario = DEFAULT_SCENARIO,
+) -> list[dict]:
+    """
+    Играет раунды с зёрнами first_seed .. first_seed + rounds - 1 в пуле процессов.
+
+    Args:
+        policy_name: Имя политики из POLICIES
+        rounds: Количество раундов
+        first_seed: Зерно первого раунда
+        workers: Число процессов (None — по числу ядер, 1 — в текущем процессе)
+        scenario: Сценарий раундов
+
+    Returns:
+        Итоги раундов в порядке зёрен
+    """
+    seeds = list(range(first_seed, first_seed + rounds))
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        with contextlib.redirect_stdout(io.StringIO()):
+            setup_resources(headless=True)
+        return play_seeds(policy_name, seeds, scenario)
+
+    # Пачки по несколько раундов: процессу не нужно получать каждый раунд отдельно
+    chunk = max(1, min(32, rounds // (workers * 4)))
+    chunks = [seeds[i : i + chunk] for i in range(0, rounds, chunk)]
+    results = []
+    # spawn: игра использует потоки (загрузка ресурсов, звук), fork с ними небезопасен
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=init_worker) as executor:
+        futures = [executor.submit(play_seeds, policy_name, seeds_chunk, scenario) for seeds_chunk in chunks]
+        for future in futures:
+            results.extend(future.result())
+    return results
+
+
+def summarize(results: list[dict]) -> dict:
+    """
+    Сводка по итогам раундов.
+
+    Returns:
+        Доля побед, расход патронов и перцентили времени до победы
+    """
+    victories = sorted(result["elapsed_time"] for result in results if result["victory"])
+    shots = [result["shots_fired"] for result in results]
+
+    def percentile(values: list[float], q: float) -> float | None:
+        return values[min(int(len(values) * q), len(values) - 1)] if values else None
+
+    return {
+        "rounds": len(results),
+        "win_rate": len(victories) / len(results) if results else 0.0,
+        "shots_mean": statistics.fmean(shots) if shots else 0.0,
+        "shots_median": statistics.median(shots) if shots else 0.0,
+        "victory_time_p10": percentile(victories, 0.10),
+        "victory_time_p50": percentile(victories, 0.50),
+        "victory_time_p90": percentile(victories, 0.90),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Пакетная оценка из командной строки."""
+    parser = argparse.ArgumentParser(description="Автоигрок: доля побед при текущих настройках")
+    parser.add_argument("--policy", choices=POLICIES, default="aiming", help="политика автоигрока")
+    parser.add_argument("--rounds", type=int, default=1000, help="количество раундов")
+    parser.add_argument("--first-seed", type=int, default=0, help="зерно первого раунда")
+    parser.add_argument("--workers", type=int, help="число процессов (по умолчанию — по числу ядер)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = run_batch(args.policy, args.rounds, args.first_seed, args.workers)
+    summary = summarize(results)
+
+    def seconds(value: float | None) -> str:
+        return "—" if value is None else f"{value:.1f} с"
+
+    print(f"🤖 Политика {args.policy}: {summary['rounds']} раундов за {time.perf_counter() - start:.1f} с")
+    print(f"   Доля побед: {summary['win_rate']:.1%}")
+    print(f"   Выстрелов: в среднем {summary['shots_mean']:.1f}, медиана {summary['shots_median']:.0f}")
+    print(
+        f"   Время до победы: p10 {seconds(summary['victory_time_p10'])}, "
+        f"p50 {seconds(summary['victory_time_p50'])}, p90 {seconds(summary['victory_time_p90'])}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
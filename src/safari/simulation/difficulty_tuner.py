@@ -0,0 +1,185 @@
+"""
+Подбор сложности методом Монте-Карло.
+
+Перебирает сетку множителей интервалов появления по дорожкам
+(RHINO_SPAWN_INTERVAL_*, BIZON_*, GAZELLE_*, PALM_*), в каждой точке играет
+раунды автоигроком на всех ядрах и записывает поверхность вероятности победы
+в CSV. По ней оператор выбирает настройки под нужную долю выигрышей:
+    uv run -m src.safari.simulation.difficulty_tuner --grid rhino=0.75,1,1.25 --grid palm=0.5,1,2 --target 0.1
+
+Во всех точках сетки играются одни и те же зёрна, поэтому разница между
+точками не тонет в случайном разбросе графиков появления.
+"""
+
+import argparse
+import csv
+import itertools
+import math
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+
+from .autoplayer import POLICIES, init_worker, play_seeds, summarize
+from .lanes import LANES
+from .scenario import DEFAULT_SCENARIO, Scenario
+
+# Настраиваемые дорожки (те, с которыми сталкиваются пули) и их интервалы появления по умолчанию (мс)
+SPAWN_INTERVALS = {lane.name: lane.spawn_interval_ms for lane in LANES if lane.collides}
+
+DEFAULT_GRID: dict[str, tuple[float, ...]] = dict.fromkeys(SPAWN_INTERVALS, (0.75, 1.0, 1.25))
+DEFAULT_ROUNDS = 100
+WILSON_Z = 1.96  # 95% доверительный интервал
+
+
+def grid_points(grid: dict[str, tuple[float, ...]]) -> list[dict[str, float]]:
+    """
+    Все сочетания множителей сетки.
+
+    Args:
+        grid: {дорожка: множители интервала появления}
+
+    Returns:
+        Список точек {дорожка: множитель}
+    """
+    lanes = list(grid)
+    return [dict(zip(lanes, scales, strict=True)) for scales in itertools.product(*grid.values())]
+
+
+def point_scenario(point: dict[str, float], base: Scenario = DEFAULT_SCENARIO) -> Scenario:
+    """Сценарий с интервалами появления, умноженными на множители точки сетки."""
+    intervals = {
+        lane: (SPAWN_INTERVALS[lane][0] * scale, SPAWN_INTERVALS[lane][1] * scale) for lane, scale in point.items()
+    }
+    name = ",".join(f"{lane}={scale:g}" for lane, scale in point.items())
+    return replace(base, name=name, spawn_intervals=intervals)
+
+
+def wilson_interval(wins: int, rounds: int, z: float = WILSON_Z) -> tuple[float, float]:
+    """
+    Доверительный интервал Уилсона для доли побед.
+
+    Returns:
+        (нижняя граница, верхняя граница)
+    """
+    if rounds == 0:
+        return 0.0, 1.0
+    p = wins / rounds
+    denominator = 1 + z * z / rounds
+    center = (p + z * z / (2 * rounds)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / rounds + z * z / (4 * rounds * rounds)) / denominator
+    return max(center - margin, 0.0), min(center + margin, 1.0)
+
+
+def sweep(
+    grid: dict[str, tuple[float, ...]],
+    rounds: int = DEFAULT_ROUNDS,
+    policy_name: str = "aiming",
+    workers: int | None = None,
+    first_seed: int = 0,
+) -> list[dict]:
+    """
+    Оценивает вероятность победы в каждой точке сетки.
+
+    Все раунды всех точек идут через один пул процессов.
+
+    Args:
+        grid: {дорожка: множители интервала появления}
+        rounds: Раундов на точку сетки
+        policy_name: Политика автоигрока
+        workers: Число процессов (None — по числу ядер)
+        first_seed: Зерно первого раунда (одинаковые зёрна во всех точках)
+
+    Returns:
+        Строки поверхности: множители, доля побед с интервалом и сводка autoplayer.summarize
+    """
+    points = grid_points(grid)
+    seeds = list(range(first_seed, first_seed + rounds))
+    workers = workers or os.cpu_count() or 1
+    chunk = max(1, min(32, rounds * len(points) // (workers * 4)))
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=init_worker) as executor:
+        futures = [
+            [
+                executor.submit(play_seeds, policy_name, seeds[i : i + chunk], point_scenario(point))
+                for i in range(0, rounds, chunk)
+            ]
+            for point in points
+        ]
+
+        surface = []
+        for point, point_futures in zip(points, futures, strict=True):
+            results = [result for future in point_futures for result in future.result()]
+            summary = summarize(results)
+            wins = sum(result["victory"] for result in results)
+            low, high = wilson_interval(wins, len(results))
+            surface.append({**point, **summary, "win_low": low, "win_high": high})
+    return surface
+
+
+def write_surface(surface: list[dict], path: Path):
+    """Записывает поверхность вероятности победы в CSV."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=list(surface[0]))
+        writer.writeheader()
+        writer.writerows(surface)
+
+
+def closest_to_target(surface: list[dict], target: float, count: int = 5) -> list[dict]:
+    """Точки сетки с долей побед, ближайшей к целевой."""
+    return sorted(surface, key=lambda row: abs(row["win_rate"] - target))[:count]
+
+
+def parse_grid(values: list[str] | None) -> dict[str, tuple[float, ...]]:
+    """
+    Разбирает --grid lane=0.5,1,1.5 (дорожки без --grid не меняются).
+
+    Returns:
+        {дорожка: множители}; без аргументов — DEFAULT_GRID
+    """
+    if not values:
+        return DEFAULT_GRID
+    grid = {}
+    for value in values:
+        lane, _, scales = value.partition("=")
+        if lane not in SPAWN_INTERVALS:
+            raise ValueError(f"Неизвестная дорожка '{lane}' (доступны: {', '.join(SPAWN_INTERVALS)})")
+        grid[lane] = tuple(float(scale) for scale in scales.split(","))
+    return grid
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Подбор сложности из командной строки."""
+    parser = argparse.ArgumentParser(description="Поверхность вероятности победы по интервалам появления")
+    parser.add_argument("--grid", action="append", help="дорожка=множители через запятую (можно несколько раз)")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="раундов на точку сетки")
+    parser.add_argument("--policy", choices=POLICIES, default="aiming", help="политика автоигрока")
+    parser.add_argument("--workers", type=int, help="число процессов (по умолчанию — по числу ядер)")
+    parser.add_argument("--target", type=float, help="целевая доля побед (0.1 = 10%%)")
+    parser.add_argument("--output", type=Path, default=Path("win_surface.csv"), help="файл CSV поверхности")
+    args = parser.parse_args(argv)
+
+    grid = parse_grid(args.grid)
+    start = time.perf_counter()
+    surface = sweep(grid, args.rounds, args.policy, args.workers)
+    write_surface(surface, args.output)
+
+    total = len(surface) * args.rounds
+    print(f"🎰 {len(surface)} точек сетки, {total} раундов за {time.perf_counter() - start:.1f} с")
+    print(f"💾 Поверхность вероятности победы: {args.output}")
+
+    if args.target is not None:
+        print(f"🎯 Ближайшие к доле побед {args.target:.1%}:")
+        for row in closest_to_target(surface, args.target):
+            scales = ", ".join(f"{lane}×{row[lane]:g}" for lane in grid)
+            print(f"   {scales}: {row['win_rate']:.1%} ({row['win_low']:.1%}–{row['win_high']:.1%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
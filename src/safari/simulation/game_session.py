@@ -0,0 +1,314 @@
+"""
+Ядро симуляции раунда без окна arcade.
+
+GameSession владеет всей игровой логикой раунда: создателями животных и препятствий,
+охотником, пулями, системой столкновений и счётом. Не использует arcade.Window,
+arcade.View, arcade.Scene и arcade.Sound, поэтому раунд можно прогнать без GL-контекста
+и быстрее реального времени. GameView только отрисовывает её состояние.
+"""
+
+import arcade
+import numpy as np
+
+from ..collision.collision_system import CollisionSystem
+from ..constants import GAME_FIELD_LEFT, GAME_FIELD_RIGHT, GAME_TIME_SECONDS, PREDICTIVE_COLLISIONS
+from ..entities.bullet.bullet_manager import BulletManager
+from ..entities.hunter.hunter import Hunter
+from ..events import EventBus, TimeUp, Victory
+from ..frame_profiler import frame_profiler
+from ..scheduler import Scheduler
+from ..score_manager import ScoreManager
+from .lanes import LANES, Lane, score_lanes
+from .rng import lane_rng, new_seed
+from .scenario import DEFAULT_SCENARIO, Scenario
+from .spawn_timeline import SpawnTimeline
+
+
+class GameSession:
+    """
+    Состояние и логика одного раунда.
+
+    Особенности:
+    - Время раунда — часы планировщика scheduler (сумма delta_time, а не часы arcade)
+    - Появления объектов и конец времени раунда — вызовы в планировщике, а не таймеры
+    - Моменты появлений на весь раунд расписываются на старте (spawn_timeline)
+    - Раунд завершается победой или по истечении game_time
+    - Слои спрайтов доступны через layers для отрисовки во view; каждый объект
+      принадлежит ровно одному слою, а списки active_* создателей — виды на него
+    - Дорожки (слои, создатели, столкновения, счёт) строятся по таблице lanes
+    - Каждая дорожка получает свой поток случайных чисел из зерна seed
+    - Сценарий задаёт плотность появления, боезапас, автострельбу и начальную нагрузку
+    - События раунда (выстрелы, убийства, победа, конец времени) публикуются в events
+    """
+
+    # Создаются в setup()
+    hunter: Hunter
+    bullet_manager: BulletManager
+    score_manager: ScoreManager
+
+    def __init__(
+        self,
+        game_time: float = GAME_TIME_SECONDS,
+        seed: int | None = None,
+        predictive_collisions: bool = PREDICTIVE_COLLISIONS,
+        endless: bool = False,
+        scenario: Scenario = DEFAULT_SCENARIO,
+        lanes: tuple[Lane, ...] = LANES,
+    ):
+        """
+        Args:
+            game_time: Длительность раунда в секундах
+            seed: Зерно случайных чисел (None — случайное)
+            predictive_collisions: Предсказывать попадания при выстреле вместо проверки на каждом кадре
+            endless: Раунд не завершается ни победой, ни по времени (для бенчмарков)
+            scenario: Сценарий (плотность появления, стрельба, начальная нагрузка)
+            lanes: Таблица дорожек в порядке отрисовки слоёв (дополнительные дорожки — для нагрузки)
+        """
+        self.seed = new_seed() if seed is None else seed
+        self.game_time = game_time
+        self.endless = endless
+        self.scenario = scenario
+        self.lanes = lanes
+
+        # Единые часы раунда: все отложенные события раунда идут через них
+        self.scheduler = Scheduler()
+
+        # Состояние раунда
+        self.is_over = False
+        self.victory = False
+        self.victory_reached = False  # Победа объявлена и завершит раунд в конце кадра
+        self.time_up = False  # Время вышло и завершит раунд в конце кадра
+        if not endless:
+            self.scheduler.schedule_at(game_time, self._on_time_up)
+
+        # События раунда: на них подписываются индикаторы и сцена
+        self.events = EventBus()
+        self.events.subscribe(Victory, self._on_victory)
+
+        # Слои спрайтов (заполняются в setup)
+        self.layers: dict[str, arcade.SpriteList] = {}
+
+        # Игровые объекты
+        self.lane_spawners: dict = {}  # Создатели по имени дорожки
+        self.spawn_timeline: SpawnTimeline | None = None  # Расписание появлений (строится в start)
+        self.collision_system = CollisionSystem(
+            predictive=predictive_collisions, events=self.events, scheduler=self.scheduler
+        )
+
+    @property
+    def spawners(self) -> list:
+        """Все создатели: сначала дорожек-целей, затем препятствий."""
+        targets = [self.lane_spawners[lane.name] for lane in self.lanes if lane.score_key]
+        obstacles = [self.lane_spawners[lane.name] for lane in self.lanes if not lane.score_key]
+        return targets + obstacles
+
+    @property
+    def rhino_spawner(self):
+        """Создатель носорогов (None, если такой дорожки нет в таблице)."""
+        return self.lane_spawners.get("rhino")
+
+    @property
+    def bizon_spawner(self):
+        """Создатель бизонов (None, если такой дорожки нет в таблице)."""
+        return self.lane_spawners.get("bizon")
+
+    @property
+    def gazelle_spawner(self):
+        """Создатель газелей (None, если такой дорожки нет в таблице)."""
+        return self.lane_spawners.get("gazelle")
+
+    @property
+    def palm_spawner(self):
+        """Создатель пальм (None, если такой дорожки нет в таблице)."""
+        return self.lane_spawners.get("palm")
+
+    @property
+    def barrier_spawner(self):
+        """Создатель барьеров (None, если такой дорожки нет в таблице)."""
+        return self.lane_spawners.get("barrier")
+
+    @property
+    def elapsed_time(self) -> float:
+        """Прошедшее время раунда в секундах."""
+        return self.scheduler.clock
+
+    @property
+    def time_left(self) -> float:
+        """Оставшееся время раунда в секундах."""
+        return max(self.game_time - self.elapsed_time, 0.0)
+
+    def setup(self):
+        """Создаёт слои и все игровые объекты раунда."""
+        # Слои в порядке отрисовки (снизу вверх): дорожки, охотник, пули.
+        # Слой пуль принадлежит BulletManager и добавляется ниже
+        for lane in self.lanes:
+            self.layers.setdefault(lane.layer, arcade.SpriteList())
+        self.layers["Hunter"] = arcade.SpriteList()
+
+        # Создатели по таблице дорожек
+        density = self.scenario.spawn_density
+        self.lane_spawners = {
+            lane.name: lane.build_spawner(
+                self.layers[lane.layer], lane_rng(self.seed, lane.name), density, self.scheduler
+            )
+            for lane in self.lanes
+        }
+        # Диапазоны интервалов появления из сценария (подбор сложности)
+        for lane, (min_interval_ms, max_interval_ms) in self.scenario.spawn_intervals.items():
+            self.lane_spawners[lane].set_spawn_interval(min_interval_ms, max_interval_ms)
+
+        # Охотник
+        self.hunter = Hunter()
+        self.layers["Hunter"].append(self.hunter)
+
+        # Пули
+        self.bullet_manager = BulletManager(
+            max_shots=self.scenario.max_shots,
+            min_time_between_shots=self.scenario.min_time_between_shots,
+            events=self.events,
+        )
+        self.bullet_manager.setup(self.hunter)
+        self.layers["Bullets"] = self.bullet_manager.sprite_list
+        self.bullet_manager.enable_shooting()
+
+        # Счёт и столкновения
+        self.score_manager = ScoreManager(self.events, tuple(score_lanes(self.lanes)))
+        self.collision_system.setup(
+            bullet_manager=self.bullet_manager,
+            lanes=self.lanes,
+            spawners=self.lane_spawners,
+            score_manager=self.score_manager,
+        )
+
+    def start(self):
+        """Расписывает появления на весь раунд и запускает создателей (первые животные и барьер)."""
+        self.spawn_timeline = SpawnTimeline.plan(self.lane_spawners, self.game_time)
+        for spawner in self.lane_spawners.values():
+            spawner.start()
+
+        if self.scenario.initial_per_lane:
+            self.populate_lanes(self.scenario.initial_per_lane)
+
+    def populate_lanes(self, count: int):
+        """
+        Расставляет объекты равномерно по всем дорожкам (для нагрузочных сценариев и бенчмарков).
+
+        Args:
+            count: Сколько объектов должно быть на каждой дорожке
+        """
+        for spawner in self.spawners:
+            store = spawner.store
+            while store.count < count:
+                spawner.spawn()
+            store.x[: store.count] = np.linspace(GAME_FIELD_LEFT + 40, GAME_FIELD_RIGHT, store.count)
+            store.sync()
+
+    def update(self, delta_time: float):
+        """
+        Продвигает раунд на один кадр.
+
+        Args:
+            delta_time: Время с предыдущего кадра в секундах
+        """
+        if self.is_over:
+            return
+
+        # 1. Сдвигаем часы раунда (наступившие появления объектов) и обновляем создателей
+        self.scheduler.advance(delta_time)
+        for spawner in self.lane_spawners.values():
+            spawner.update(delta_time)
+        frame_profiler.lap("spawners")
+
+        # 2. Обновляем охотника
+        self.hunter.check_for_obstacles(self.layers["BarrierObstacles"])
+        self.hunter.on_update(delta_time)
+        frame_profiler.lap("hunter")
+
+        # 3. Автоматическая стрельба (по сценарию) и обновление пуль
+        if self.scenario.auto_fire and self.bullet_manager.is_ready():
+            self.fire()
+        self.bullet_manager.update(delta_time)
+        frame_profiler.lap("bullets")
+
+        # 4. Проверяем столкновения пуль с объектами
+        self.collision_system.update(delta_time)
+        frame_profiler.lap("collisions")
+
+        # 5. Завершаем раунд победой (объявлена ScoreManager на этом кадре) или по времени
+        if self.endless:
+            return
+        if self.victory_reached:
+            self.finish(victory=True)
+        elif self.time_up:
+            self.events.publish(TimeUp(self.elapsed_time))
+            self.finish(victory=False)
+
+    def _on_victory(self, event: Victory):
+        """Победа объявлена: раунд завершится после обработки всех попаданий кадра."""
+        self.victory_reached = True
+
+    def _on_time_up(self):
+        """Время раунда вышло: раунд завершится в конце кадра, если на нём нет победы."""
+        self.time_up = True
+
+    def fire(self) -> bool:
+        """
+        Выстрел охотника.
+
+        Returns:
+            True если выстрел произведен
+        """
+        if self.is_over:
+            return False
+        return self.bullet_manager.fire()
+
+    def finish(self, victory: bool):
+        """Завершает раунд и останавливает всех создателей."""
+        if self.is_over:
+            return
+
+        self.is_over = True
+        self.victory = victory
+
+        for spawner in self.spawners:
+            if spawner:
+                spawner.stop_spawning()
+
+    def get_result(self) -> dict:
+        """
+        Возвращает итог раунда.
+
+        Returns:
+            Словарь со счётом, количеством выстрелов, исходом и временем
+        """
+        return {
+            **self.score_manager.get_score_data(),
+            "shots_fired": self.bullet_manager.shots_fired,
+            "victory": self.victory,
+            "elapsed_time": self.elapsed_time,
+            "seed": self.seed,
+        }
+
+    def get_pool_stats(self) -> list[dict]:
+        """
+        Возвращает статистику пулов объектов по типам.
+
+        Returns:
+            Список словарей (см. EntityPool.get_stats)
+        """
+        pools = [spawner.pool for spawner in self.spawners] + [self.bullet_manager.pool]
+        return [pool.get_stats() for pool in pools]
+
+    def run(self, delta_time: float = 1 / 60) -> dict:
+        """
+        Прогоняет раунд до конца с фиксированным шагом.
+
+        Args:
+            delta_time: Шаг симуляции в секундах
+
+        Returns:
+            Итог раунда (см. get_result)
+        """
+        while not self.is_over:
+            self.update(delta_time)
+        return self.get_result()
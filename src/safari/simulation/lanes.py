@@ -0,0 +1,185 @@
+"""
+Таблица дорожек раунда.
+
+Каждая дорожка описана одной записью Lane: слой, создатель объектов, дорожка
+на экране, скорость, интервалы появления, счётчик очков, звук попадания,
+особые правила (носорог — одно убийство за раунд), подпись и лампочки счётчика.
+GameSession строит по таблице слои и создателей, CollisionSystem — пары для
+проверки столкновений и таблицу обработчиков попаданий, ScoreManager — счётчики
+убийств, панель и итоги раунда — лампочки и подписи счётчиков.
+Дорожка для нагрузочного прогона добавляется одной записью:
+    GameSession(lanes=(*LANES, replace(GAZELLE_LANE, name="gazelle_2", track_index=3)))
+"""
+
+import random
+from dataclasses import dataclass
+
+import arcade
+
+from ..constants import (
+    BARRIER_SPAWN_INTERVAL_MAX,
+    BARRIER_SPAWN_INTERVAL_MIN,
+    BARRIER_SPEED,
+    BIZON_INDICATOR_POSITIONS,
+    BIZON_SPAWN_INTERVAL_MAX,
+    BIZON_SPAWN_INTERVAL_MIN,
+    BIZON_SPEED,
+    GAZELLE_INDICATOR_POSITIONS,
+    GAZELLE_SPAWN_INTERVAL_MAX,
+    GAZELLE_SPAWN_INTERVAL_MIN,
+    GAZELLE_SPEED,
+    HUNTER_TRACK_INDEX,
+    PALM_SPAWN_INTERVAL_MAX,
+    PALM_SPAWN_INTERVAL_MIN,
+    PALM_SPEED,
+    RHINO_INDICATOR_POSITIONS,
+    RHINO_SPAWN_INTERVAL_MAX,
+    RHINO_SPAWN_INTERVAL_MIN,
+    RHINO_SPEED,
+    TRACK_INDEX_BIZON,
+    TRACK_INDEX_GAZELLE,
+    TRACK_INDEX_PALM,
+    TRACK_INDEX_RHINO,
+    TRACK_POSITIONS,
+)
+from ..entities.animals.bizon.bizon_spawner import BizonSpawner
+from ..entities.animals.gazelle.gazelle_spawner import GazelleSpawner
+from ..entities.animals.rhino.rhino_spawner import RhinoSpawner
+from ..entities.obstacles.barrier_spawner import BarrierSpawner
+from ..entities.obstacles.palm_spawner import PalmSpawner
+from ..scheduler import Scheduler
+
+
+@dataclass(frozen=True)
+class Lane:
+    """Описание одной дорожки раунда."""
+
+    name: str  # Имя дорожки: поток случайных чисел, сценарий, тип цели в столкновениях
+    layer: str  # Слой отрисовки в GameSession.layers
+    spawner: type  # Класс создателя (он же задаёт вид объектов дорожки)
+    track_index: int  # Дорожка на экране (индекс в TRACK_POSITIONS)
+    speed: float  # Скорость объектов (пикселей в секунду)
+    spawn_interval_ms: tuple[float, float]  # Интервал появления равномерно в диапазоне (мс)
+    collides: bool = False  # Пули сталкиваются с объектами дорожки
+    score_key: str | None = None  # Счётчик ScoreManager, который растёт при попадании
+    hit_sound: str | None = None  # Атрибут Textures со звуком попадания
+    removed_on_hit: bool = False  # Объект исчезает после попадания (пальма остаётся и задерживает пули)
+    single_kill: bool = False  # После первого попадания дорожка больше не создаёт объекты
+    label: str | None = None  # Подпись счётчика в итогах раунда ("Газелей")
+    indicator_textures: str | None = None  # Атрибут Textures с лампочками счётчика на панели
+    indicator_positions: tuple[tuple[int, int], ...] = ()  # Позиции лампочек на панели
+
+    @property
+    def track_y(self) -> float:
+        """Y-координата дорожки на экране (без сдвига объекта)."""
+        return TRACK_POSITIONS[self.track_index][1]
+
+    def build_spawner(
+        self,
+        sprite_list: arcade.SpriteList,
+        rng: random.Random,
+        spawn_density: float,
+        scheduler: Scheduler,
+    ):
+        """
+        Создаёт создателя объектов дорожки.
+
+        Args:
+            sprite_list: Слой дорожки
+            rng: Поток случайных чисел дорожки
+            spawn_density: Во сколько раз чаще создавать объекты
+            scheduler: Планировщик раунда
+
+        Returns:
+            Создатель, настроенный по записи дорожки
+        """
+        return self.spawner(sprite_list, rng, spawn_density, scheduler, lane=self)
+
+
+BARRIER_LANE = Lane(
+    name="barrier",
+    layer="BarrierObstacles",
+    spawner=BarrierSpawner,
+    track_index=HUNTER_TRACK_INDEX,
+    speed=BARRIER_SPEED,
+    spawn_interval_ms=(BARRIER_SPAWN_INTERVAL_MIN, BARRIER_SPAWN_INTERVAL_MAX),
+)
+RHINO_LANE = Lane(
+    name="rhino",
+    layer="RhinoAnimals",
+    spawner=RhinoSpawner,
+    track_index=TRACK_INDEX_RHINO,
+    speed=RHINO_SPEED,
+    spawn_interval_ms=(RHINO_SPAWN_INTERVAL_MIN, RHINO_SPAWN_INTERVAL_MAX),
+    collides=True,
+    score_key="rhino",
+    hit_sound="shot_sound",
+    removed_on_hit=True,
+    single_kill=True,
+    label="Носорогов",
+    indicator_textures="rhino_indicators",
+    indicator_positions=tuple(RHINO_INDICATOR_POSITIONS),
+)
+BIZON_LANE = Lane(
+    name="bizon",
+    layer="BizonAnimals",
+    spawner=BizonSpawner,
+    track_index=TRACK_INDEX_BIZON,
+    speed=BIZON_SPEED,
+    spawn_interval_ms=(BIZON_SPAWN_INTERVAL_MIN, BIZON_SPAWN_INTERVAL_MAX),
+    collides=True,
+    score_key="bizon",
+    hit_sound="shot_sound",
+    removed_on_hit=True,
+    label="Бизонов",
+    indicator_textures="bizon_indicators",
+    indicator_positions=tuple(BIZON_INDICATOR_POSITIONS),
+)
+GAZELLE_LANE = Lane(
+    name="gazelle",
+    layer="GazelleAnimals",
+    spawner=GazelleSpawner,
+    track_index=TRACK_INDEX_GAZELLE,
+    speed=GAZELLE_SPEED,
+    spawn_interval_ms=(GAZELLE_SPAWN_INTERVAL_MIN, GAZELLE_SPAWN_INTERVAL_MAX),
+    collides=True,
+    score_key="gazelle",
+    hit_sound="shot_sound",
+    removed_on_hit=True,
+    label="Газелей",
+    indicator_textures="gazelle_indicators",
+    indicator_positions=tuple(GAZELLE_INDICATOR_POSITIONS),
+)
+PALM_LANE = Lane(
+    name="palm",
+    layer="PalmObstacles",
+    spawner=PalmSpawner,
+    track_index=TRACK_INDEX_PALM,
+    speed=PALM_SPEED,
+    spawn_interval_ms=(PALM_SPAWN_INTERVAL_MIN, PALM_SPAWN_INTERVAL_MAX),
+    collides=True,
+)
+
+# Дорожки раунда в порядке отрисовки слоёв (снизу вверх) и создания создателей;
+# пули проверяются с дорожками collides в этом же порядке
+LANES = (BARRIER_LANE, RHINO_LANE, BIZON_LANE, GAZELLE_LANE, PALM_LANE)
+
+
+def score_lanes(lanes: tuple[Lane, ...] = LANES) -> dict[str, Lane]:
+    """
+    Дорожки-цели по счётчикам очков.
+
+    Несколько дорожек с одним score_key (нагрузочный прогон) делят счётчик;
+    подпись и лампочки счётчика берутся из первой такой дорожки.
+
+    Args:
+        lanes: Таблица дорожек
+
+    Returns:
+        score_key -> первая дорожка с этим счётчиком, в порядке таблицы
+    """
+    result: dict[str, Lane] = {}
+    for lane in lanes:
+        if lane.score_key:
+            result.setdefault(lane.score_key, lane)
+    return result
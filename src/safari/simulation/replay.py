@@ -0,0 +1,184 @@
+"""
+Запись ввода раунда и детерминированное воспроизведение без окна.
+
+GameView записывает для каждого раунда зерно, сценарий, последовательность
+delta_time по кадрам и номера кадров, перед которыми нажат ПРОБЕЛ, и дописывает
+запись в архив раундов (replay_archive.ReplayArchive).
+Раунд зависит только от зерна и ввода, поэтому воспроизведение через
+GameSession повторяет его кадр в кадр — с тем же счётом и теми же попаданиями,
+но так быстро, как позволяет процессор. Раунд извлекается из архива по номеру
+и сверяется с записанным итогом:
+    uv run -m src.safari.simulation.replay_archive extract 42 --output round.json.gz
+    uv run -m src.safari.simulation.replay round.json.gz --verify
+"""
+
+import argparse
+import contextlib
+import gzip
+import io
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from ..constants import PREDICTIVE_COLLISIONS, REPLAYS_PATH
+from ..resource_manager import setup_resources
+from .game_session import GameSession
+from .scenario import DEFAULT_SCENARIO, Scenario
+
+REPLAY_FORMAT_VERSION = 1
+
+
+@dataclass
+class RoundRecording:
+    """
+    Запись ввода одного раунда.
+
+    Особенности:
+    - delta_times[i] — шаг i-го вызова GameView.on_update
+    - presses — номера кадров: нажатие с номером t произошло после t обновлений
+    - result — итог раунда (GameSession.get_result), если раунд завершён
+    """
+
+    seed: int
+    scenario: dict = field(default_factory=DEFAULT_SCENARIO.to_dict)
+    predictive_collisions: bool = PREDICTIVE_COLLISIONS
+    delta_times: list[float] = field(default_factory=list)
+    presses: list[int] = field(default_factory=list)
+    result: dict | None = None
+    version: int = REPLAY_FORMAT_VERSION
+
+    @property
+    def ticks(self) -> int:
+        """Количество записанных кадров."""
+        return len(self.delta_times)
+
+    def add_frame(self, delta_time: float):
+        """Записывает шаг очередного кадра."""
+        self.delta_times.append(delta_time)
+
+    def add_press(self):
+        """Записывает нажатие ПРОБЕЛА перед следующим кадром."""
+        self.presses.append(self.ticks)
+
+    def save(self, path: Path | None = None) -> Path:
+        """
+        Сохраняет запись в сжатый JSON.
+
+        Args:
+            path: Файл записи (по умолчанию — новый файл в REPLAYS_PATH)
+
+        Returns:
+            Путь к сохранённому файлу
+        """
+        if path is None:
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = REPLAYS_PATH / f"round_{stamp}_{self.seed}.json.gz"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            json.dump(asdict(self), file, ensure_ascii=False, separators=(",", ":"))
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "RoundRecording":
+        """Загружает запись, сохранённую методом save."""
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            data = json.load(file)
+        if data.get("version") != REPLAY_FORMAT_VERSION:
+            raise ValueError(f"Неподдерживаемая версия записи {path}: {data.get('version')}")
+        return cls(**data)
+
+
+def build_session(recording: RoundRecording) -> GameSession:
+    """Создаёт и запускает раунд с зерном и сценарием записи."""
+    scenario = Scenario(**recording.scenario)
+    session = GameSession(
+        game_time=scenario.game_time,
+        seed=recording.seed,
+        predictive_collisions=recording.predictive_collisions,
+        endless=scenario.endless,
+        scenario=scenario,
+    )
+    session.setup()
+    session.start()
+    return session
+
+
+def replay(recording: RoundRecording, on_frame=None) -> dict:
+    """
+    Воспроизводит запись без окна.
+
+    Args:
+        recording: Запись раунда
+        on_frame: Необязательный вызов после каждого кадра — on_frame(tick, session)
+
+    Returns:
+        Итог воспроизведённого раунда (см. GameSession.get_result)
+    """
+    session = build_session(recording)
+    presses = recording.presses
+    press_index = 0
+
+    for tick, delta_time in enumerate(recording.delta_times):
+        # Нажатия, сделанные перед этим кадром (как GameView.on_key_press между on_update)
+        while press_index < len(presses) and presses[press_index] <= tick:
+            session.fire()
+            press_index += 1
+
+        session.update(delta_time)
+        if on_frame:
+            on_frame(tick, session)
+
+    return session.get_result()
+
+
+def verify(recording: RoundRecording, result: dict) -> list[str]:
+    """
+    Сравнивает итог воспроизведения с записанным.
+
+    Returns:
+        Список расхождений (пустой, если итог совпал или не записан)
+    """
+    if recording.result is None:
+        return []
+    return [
+        f"{key}: записано {recording.result.get(key)}, воспроизведено {value}"
+        for key, value in result.items()
+        if recording.result.get(key) != value
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Воспроизведение записей из командной строки."""
+    parser = argparse.ArgumentParser(description="Детерминированное воспроизведение записанных раундов")
+    parser.add_argument("paths", nargs="+", type=Path, help="файлы записей (.json.gz)")
+    parser.add_argument("--verify", action="store_true", help="сверить итог с записанным")
+    args = parser.parse_args(argv)
+
+    failed = 0
+    # Сообщения загрузки ресурсов не нужны (сам раунд без окна ничего не выводит)
+    with contextlib.redirect_stdout(io.StringIO()):
+        setup_resources(headless=True)
+
+    for path in args.paths:
+        recording = RoundRecording.load(path)
+        start = time.perf_counter()
+        result = replay(recording)
+        elapsed = time.perf_counter() - start
+
+        speed = recording.ticks / elapsed if elapsed else 0.0
+        print(f"▶️ {path.name}: {recording.ticks} кадров за {elapsed:.2f} с ({speed:.0f} кадров/с), итог {result}")
+
+        if args.verify:
+            mismatches = verify(recording, result)
+            for mismatch in mismatches:
+                print(f"   ❌ {mismatch}")
+            failed += bool(mismatches)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+"""
+Архив записей раундов: файл данных с записями фиксированной ширины и индекс.
+
+Раунды только дописываются в конец, поэтому архив можно пополнять прямо
+во время работы автомата. Файлы читаются через отображение в память (mmap):
+инструменты анализа переходят к любому раунду или кадру без разбора файла.
+
+Файл данных (.bin):
+    [сценарий раунда в JSON][кадр 0][кадр 1]...[сценарий следующего раунда]...
+    Кадр — TICK_DTYPE: delta_time и число нажатий ПРОБЕЛА перед кадром.
+    Нажатия после последнего кадра не сохраняются: они бывают только у раунда,
+    прерванного ESC до следующего обновления, итог такого раунда не записан,
+    и на воспроизведённые кадры они не влияют.
+
+Файл индекса (.idx) — массив INDEX_DTYPE, по записи на раунд: смещения
+в файле данных, зерно и итог раунда (ScoreManager.get_score_data()).
+Индекс дописывается после данных, поэтому оборванная запись раунда
+не попадает в индекс.
+
+    uv run -m src.safari.simulation.replay_archive pack replays/*.json.gz
+    uv run -m src.safari.simulation.replay_archive list
+    uv run -m src.safari.simulation.replay_archive extract 42 --output round.json.gz
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from ..constants import REPLAY_ARCHIVE_PATH
+from .lanes import score_lanes
+from .replay import RoundRecording
+
+# Кадр: шаг delta_time и сколько раз нажат ПРОБЕЛ перед этим кадром
+TICK_DTYPE = np.dtype([("delta_time", "<f8"), ("presses", "<u2")])
+
+# Счётчики убийств в итогах раунда — по дорожкам-целям таблицы LANES
+KILL_COLUMNS = tuple(f"{key}_kills" for key in score_lanes())
+
+# Запись индекса: где лежит раунд и чем он закончился
+INDEX_DTYPE = np.dtype(
+    [
+        ("scenario_offset", "<u8"),  # Смещение JSON сценария в файле данных
+        ("scenario_length", "<u4"),
+        ("ticks_offset", "<u8"),  # Смещение первого кадра в файле данных
+        ("ticks", "<u4"),
+        ("seed", "<i8"),  # new_seed() даёт 32 бита, но GameSession принимает любое целое зерно
+        ("predictive", "u1"),
+        ("finished", "u1"),  # 0 — раунд прерван, итог не записан
+        ("victory", "u1"),
+        *((column, "<u2") for column in KILL_COLUMNS),
+        ("shots_fired", "<u4"),
+        ("elapsed_time", "<f8"),
+    ]
+)
+
+
+class ReplayArchive:
+    """
+    Архив записей раундов с индексом.
+
+    Особенности:
+    - append() дописывает раунд в конец файла данных, затем в индекс
+    - index — весь индекс как массив numpy поверх mmap (без чтения файла целиком)
+    - ticks(n) — кадры раунда n как срез отображённого в память файла
+    """
+
+    def __init__(self, path: Path = REPLAY_ARCHIVE_PATH):
+        """
+        Args:
+            path: Путь к архиву без расширения (рядом лежат .bin и .idx)
+        """
+        self.data_path = path.with_suffix(".bin")
+        self.index_path = path.with_suffix(".idx")
+        self._index: np.ndarray | None = None
+        self._data: np.memmap | None = None
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def index(self) -> np.ndarray:
+        """Индекс всех раундов (массив INDEX_DTYPE, отображённый в память)."""
+        if self._index is None:
+            size = self.index_path.stat().st_size if self.index_path.exists() else 0
+            count = size // INDEX_DTYPE.itemsize
+            if count:
+                self._index = np.memmap(self.index_path, dtype=INDEX_DTYPE, mode="r", shape=(count,))
+            else:
+                self._index = np.zeros(0, dtype=INDEX_DTYPE)
+        return self._index
+
+    @property
+    def data(self) -> np.memmap:
+        """Файл данных, отображённый в память побайтно."""
+        if self._data is None:
+            self._data = np.memmap(self.data_path, dtype=np.uint8, mode="r")
+        return self._data
+
+    def _invalidate(self):
+        """Сбрасывает отображения, чтобы увидеть дописанные раунды."""
+        self._index = None
+        self._data = None
+
+    def append(self, recording: RoundRecording) -> int:
+        """
+        Дописывает раунд в архив.
+
+        Нажатия после последнего кадра отбрасываются (см. описание модуля).
+
+        Args:
+            recording: Запись раунда
+
+        Returns:
+            Номер раунда в архиве
+
+        Raises:
+            ValueError: Зерно не помещается в поле seed индекса
+        """
+        seed_range = np.iinfo(INDEX_DTYPE["seed"])
+        if not seed_range.min <= recording.seed <= seed_range.max:
+            raise ValueError(f"Зерно {recording.seed} вне диапазона архива [{seed_range.min}, {seed_range.max}]")
+
+        ticks = np.zeros(recording.ticks, dtype=TICK_DTYPE)
+        ticks["delta_time"] = recording.delta_times
+        # Нажатия после последнего кадра (раунд прерван) на воспроизведение не влияют
+        presses = [tick for tick in recording.presses if tick < recording.ticks]
+        ticks["presses"] = np.bincount(presses, minlength=recording.ticks) if presses else 0
+
+        scenario = json.dumps(recording.scenario, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        entry = np.zeros(1, dtype=INDEX_DTYPE)
+        entry["seed"] = recording.seed
+        entry["predictive"] = recording.predictive_collisions
+        entry["ticks"] = recording.ticks
+        entry["scenario_length"] = len(scenario)
+        if recording.result is not None:
+            entry["finished"] = 1
+            for key in ("victory", *KILL_COLUMNS, "shots_fired", "elapsed_time"):
+                entry[key] = recording.result[key]
+
+        self.data_path.parent.mkdir(parents=True, exist_ok=True)
+        self._invalidate()
+
+        # Сначала данные, потом индекс: оборванная запись не попадёт в индекс
+        with self.data_path.open("ab") as data:
+            entry["scenario_offset"] = data.tell()
+            data.write(scenario)
+            entry["ticks_offset"] = data.tell()
+            data.write(ticks.tobytes())
+        with self.index_path.open("ab") as index:
+            number = index.tell() // INDEX_DTYPE.itemsize
+            index.write(entry.tobytes())
+
+        return number
+
+    def ticks(self, number: int) -> np.ndarray:
+        """
+        Кадры раунда без копирования.
+
+        Args:
+            number: Номер раунда в архиве
+
+        Returns:
+            Массив TICK_DTYPE поверх отображённого в память файла данных
+        """
+        entry = self.index[number]
+        start = int(entry["ticks_offset"])
+        end = start + int(entry["ticks"]) * TICK_DTYPE.itemsize
+        return self.data[start:end].view(TICK_DTYPE)
+
+    def scenario(self, number: int) -> dict:
+        """Поля сценария раунда."""
+        entry = self.index[number]
+        start = int(entry["scenario_offset"])
+        return json.loads(self.data[start : start + int(entry["scenario_length"])].tobytes())
+
+    def result(self, number: int) -> dict | None:
+        """Итог раунда в формате GameSession.get_result (None — раунд прерван)."""
+        entry = self.index[number]
+        if not entry["finished"]:
+            return None
+        return {
+            **{column: int(entry[column]) for column in KILL_COLUMNS},
+            "shots_fired": int(entry["shots_fired"]),
+            "victory": bool(entry["victory"]),
+            "elapsed_time": float(entry["elapsed_time"]),
+            "seed": int(entry["seed"]),
+        }
+
+    def recording(self, number: int) -> RoundRecording:
+        """Восстанавливает запись раунда для воспроизведения."""
+        entry = self.index[number]
+        ticks = self.ticks(number)
+        presses = np.repeat(np.arange(len(ticks)), ticks["presses"])
+        return RoundRecording(
+            seed=int(entry["seed"]),
+            scenario=self.scenario(number),
+            predictive_collisions=bool(entry["predictive"]),
+            delta_times=ticks["delta_time"].tolist(),
+            presses=presses.tolist(),
+            result=self.result(number),
+        )
+
+    def summary(self) -> dict:
+        """Сводка по всем завершённым раундам (считается по индексу, без чтения кадров)."""
+        finished = self.index[self.index["finished"] == 1]
+        return {
+            "rounds": len(self.index),
+            "finished": len(finished),
+            "victories": int(finished["victory"].sum()),
+            "win_rate": float(finished["victory"].mean()) if len(finished) else 0.0,
+            "mean_shots": float(finished["shots_fired"].mean()) if len(finished) else 0.0,
+            "total_ticks": int(self.index["ticks"].sum()),
+        }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Работа с архивом из командной строки."""
+    parser = argparse.ArgumentParser(description="Архив записей раундов")
+    parser.add_argument("--archive", type=Path, default=REPLAY_ARCHIVE_PATH, help="путь к архиву без расширения")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    pack = commands.add_parser("pack", help="дописать записи .json.gz в архив")
+    pack.add_argument("paths", nargs="+", type=Path)
+
+    commands.add_parser("list", help="показать индекс и сводку")
+
+    extract = commands.add_parser("extract", help="выгрузить раунд в .json.gz для воспроизведения")
+    extract.add_argument("number", type=int)
+    extract.add_argument("--output", type=Path, required=True)
+
+    args = parser.parse_args(argv)
+    archive = ReplayArchive(args.archive)
+
+    if args.command == "pack":
+        for path in args.paths:
+            number = archive.append(RoundRecording.load(path))
+            print(f"📥 {path.name} → раунд #{number}")
+    elif args.command == "list":
+        for number, entry in enumerate(archive.index):
+            outcome = ("🏆" if entry["victory"] else "⏰") if entry["finished"] else "⏹️"
+            print(
+                f"#{number:<6} зерно {entry['seed']:<10} кадров {entry['ticks']:<7} {outcome} {archive.result(number)}"
+            )
+        print(f"📊 {archive.summary()}")
+    elif args.command == "extract":
+        path = archive.recording(args.number).save(args.output)
+        print(f"💾 Раунд #{args.number} → {path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
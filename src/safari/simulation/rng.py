@@ -0,0 +1,29 @@
+"""
+Воспроизводимые генераторы случайных чисел для дорожек.
+
+Каждая дорожка получает собственный независимый поток random.Random,
+выведенный из общего зерна сессии и имени дорожки. Одно и то же зерно
+всегда даёт одинаковый график появления объектов.
+"""
+
+import random
+import secrets
+
+
+def new_seed() -> int:
+    """Новое случайное зерно сессии (32 бита)."""
+    return secrets.randbits(32)
+
+
+def lane_rng(seed: int, lane_name: str) -> random.Random:
+    """
+    Создаёт независимый генератор для дорожки.
+
+    Args:
+        seed: Зерно сессии
+        lane_name: Имя дорожки (например, "rhino" или "palm")
+
+    Returns:
+        Генератор, детерминированно зависящий от пары (seed, lane_name)
+    """
+    return random.Random(f"{seed}:{lane_name}")  # noqa: S311 # nosec
@@ -0,0 +1,108 @@
+"""
+Сценарии запуска: именованные профили плотности появления, боезапаса и нагрузки.
+
+Сценарий выбирается при запуске (safari --scenario dense) и позволяет
+нагрузить создателей и систему столкновений без правки constants.py.
+Кроме встроенных профилей можно передать путь к JSON-файлу с полями Scenario.
+"""
+
+import json
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+
+from ..constants import GAME_TIME_SECONDS, MAX_SHOTS_TOTAL, MIN_TIME_SINCE_LAST_SHOT
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """Параметры раунда, которые можно менять без правки констант."""
+
+    name: str = "default"
+    description: str = "Обычная игра, как на автомате"
+
+    # Длительность раунда и его завершение
+    game_time: float = GAME_TIME_SECONDS
+    endless: bool = False  # Раунд не завершается ни победой, ни по времени
+
+    # Появление объектов
+    spawn_density: float = 1.0  # Во сколько раз чаще появляются животные и препятствия
+    initial_per_lane: int = 0  # Сколько объектов расставить на каждой дорожке при старте
+    # Диапазоны интервалов появления по дорожкам вместо констант: {"rhino": (13000, 19500), ...}, мс
+    spawn_intervals: dict = field(default_factory=dict)
+
+    # Стрельба
+    max_shots: int | None = MAX_SHOTS_TOTAL  # None — без ограничения
+    min_time_between_shots: float = MIN_TIME_SINCE_LAST_SHOT
+    auto_fire: bool = False  # Стрелять автоматически, как только можно
+
+    def to_dict(self) -> dict:
+        """Поля сценария для сохранения в JSON."""
+        return asdict(self)
+
+
+DEFAULT_SCENARIO = Scenario()
+
+# Встроенные профили
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        DEFAULT_SCENARIO,
+        Scenario(
+            name="debug",
+            description="Короткий раунд с частой стрельбой (бывшие отладочные константы)",
+            game_time=20,
+            max_shots=160,
+            min_time_between_shots=0.1,
+        ),
+        Scenario(
+            name="dense",
+            description="Животные и препятствия появляются в 10 раз чаще",
+            spawn_density=10.0,
+        ),
+        Scenario(
+            name="unlimited_ammo",
+            description="Бесконечные патроны и автоматическая стрельба",
+            max_shots=None,
+            min_time_between_shots=0.1,
+            auto_fire=True,
+        ),
+        Scenario(
+            name="stress",
+            description="Тысяча объектов на каждой дорожке, частое появление и автоматическая стрельба",
+            endless=True,
+            spawn_density=10.0,
+            initial_per_lane=1000,
+            max_shots=None,
+            min_time_between_shots=0.05,
+            auto_fire=True,
+        ),
+    )
+}
+
+
+def load_scenario(name_or_path: str | Path) -> Scenario:
+    """
+    Загружает сценарий по имени встроенного профиля или из JSON-файла.
+
+    Args:
+        name_or_path: Имя из SCENARIOS или путь к JSON с полями Scenario
+
+    Returns:
+        Сценарий
+    """
+    if str(name_or_path) in SCENARIOS:
+        return SCENARIOS[str(name_or_path)]
+
+    path = Path(name_or_path)
+    if not path.exists():
+        known = ", ".join(SCENARIOS)
+        raise ValueError(f"Неизвестный сценарий '{name_or_path}' (встроенные: {known})")
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    known_fields = {field.name for field in fields(Scenario)}
+    unknown = set(data) - known_fields
+    if unknown:
+        raise ValueError(f"Неизвестные поля сценария {path}: {', '.join(sorted(unknown))}")
+
+    data.setdefault("name", path.stem)
+    return Scenario(**data)
@@ -0,0 +1,63 @@
+"""
+Расписание появлений всех дорожек на раунд.
+
+Интервалы появления — независимые случайные величины, а длительность раунда
+известна заранее, поэтому на старте раунда всё расписание строится сразу:
+по отсортированному списку моментов появления на дорожку. Создатели идут по
+своим спискам курсором и не тянут случайные числа на кадре появления.
+Расписание можно посмотреть инструментами или сохранить рядом с записью раунда:
+    session.spawn_timeline.to_dict()
+"""
+
+from bisect import bisect_right
+
+
+class SpawnTimeline:
+    """
+    Моменты появлений по дорожкам.
+
+    Особенности:
+    - lanes[имя дорожки] — тот же список, по которому идёт создатель (spawn_times)
+    - Моменты — время по часам планировщика раунда в секундах, по возрастанию
+      (объекты, созданные на старте раунда, в расписание не входят)
+    - Каждая дорожка расписана до первого момента позже horizon; бесконечные
+      раунды создатели дописывают сами, когда расписание кончается
+    """
+
+    def __init__(self, horizon: float):
+        """
+        Args:
+            horizon: До какого момента расписаны дорожки (секунды)
+        """
+        self.horizon = horizon
+        self.lanes: dict[str, list[float]] = {}
+
+    @classmethod
+    def plan(cls, spawners: dict, horizon: float) -> "SpawnTimeline":
+        """
+        Расписывает появления всех дорожек до horizon.
+
+        Args:
+            spawners: Создатели по имени дорожки
+            horizon: Момент по часам планировщика (обычно длительность раунда)
+
+        Returns:
+            Расписание, списки которого разделяют с создателями
+        """
+        timeline = cls(horizon)
+        for name, spawner in spawners.items():
+            timeline.lanes[name] = spawner.plan_until(horizon)
+        return timeline
+
+    def spawns_before(self, time: float) -> dict[str, int]:
+        """
+        Число запланированных появлений до момента time по дорожкам.
+
+        Args:
+            time: Момент по часам планировщика (секунды)
+        """
+        return {name: bisect_right(times, time) for name, times in self.lanes.items()}
+
+    def to_dict(self) -> dict:
+        """Расписание для сохранения в JSON."""
+        return {"horizon": self.horizon, "lanes": {name: list(times) for name, times in self.lanes.items()}}
@@ -0,0 +1,90 @@
+"""
+Кэш звуков на всё время работы процесса.
+
+Короткие эффекты (выстрел, попадание) декодируются в память один раз.
+Длинные звуки (стартовая мелодия, галоп) не декодируются целиком, а читаются
+с диска потоком: плеер держит только небольшой буфер, а сам источник
+открывается один раз и переиспользуется при каждом показе сцены.
+Переходы между сценами не декодируют OGG заново, а память не растёт
+от цикла к циклу демонстрационного режима.
+"""
+
+from pathlib import Path
+
+import arcade
+from pyglet import media
+
+
+class SoundCache:
+    """
+    Звуки, загруженные один раз за процесс.
+
+    Особенности:
+    - effect(path) — короткий звук, декодированный в память (можно играть одновременно)
+    - play_stream(path) — длинный звук потоком с диска, по одному воспроизведению на файл
+    - stop_stream(path) — останавливает поток и освобождает плеер
+    - Файл, который не удалось загрузить, не загружается повторно
+    """
+
+    def __init__(self):
+        self.effects: dict[Path, arcade.Sound | None] = {}  # Декодированные эффекты
+        self.streams: dict[Path, arcade.Sound | None] = {}  # Открытые потоковые источники
+        self.players: dict[Path, media.Player] = {}  # Текущие воспроизведения потоков
+        self.decodes = 0  # Сколько раз файлы загружались с диска
+
+    def _load(self, cache: dict, path: Path, streaming: bool) -> arcade.Sound | None:
+        """Загружает звук один раз (неудачная загрузка тоже запоминается)."""
+        if path not in cache:
+            self.decodes += 1
+            try:
+                cache[path] = arcade.load_sound(path, streaming=streaming)
+            except Exception as e:
+                print(f"❌ Ошибка загрузки звука {path.name}: {e}")
+                cache[path] = None
+        return cache[path]
+
+    def effect(self, path: Path) -> arcade.Sound | None:
+        """
+        Короткий звук, декодированный в память.
+
+        Args:
+            path: Путь к файлу звука
+
+        Returns:
+            Звук или None, если файл не удалось загрузить
+        """
+        return self._load(self.effects, path, streaming=False)
+
+    def play_stream(self, path: Path, loop: bool = False) -> media.Player | None:
+        """
+        Проигрывает длинный звук потоком с диска с начала.
+
+        Предыдущее воспроизведение этого файла останавливается:
+        потоковый источник играет только в одном плеере.
+
+        Args:
+            path: Путь к файлу звука
+            loop: Повторять по кругу
+
+        Returns:
+            Плеер или None, если файл не удалось загрузить
+        """
+        sound = self._load(self.streams, path, streaming=True)
+        if sound is None:
+            return None
+
+        self.stop_stream(path)
+        sound.source.seek(0.0)
+        player = sound.play(loop=loop)
+        self.players[path] = player
+        return player
+
+    def stop_stream(self, path: Path):
+        """Останавливает поток и освобождает его плеер (источник остаётся открытым)."""
+        player = self.players.pop(path, None)
+        if player is not None:
+            arcade.stop_sound(player)
+
+
+# Кэш звуков на весь процесс
+sound_cache = SoundCache()
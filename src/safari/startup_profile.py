@@ -0,0 +1,91 @@
+"""
+Профилирование запуска игры (safari --startup-profile).
+
+Замеряет фазы запуска: импорт arcade и модулей игры, загрузку шрифтов,
+текстур, звуков и анимаций, создание окна, первый кадр и готовность ресурсов.
+Модуль не импортирует arcade, чтобы его можно было подключить до замеров.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StartupProfile:
+    """
+    Таблица фаз запуска.
+
+    Особенности:
+    - phase(name) — контекстный менеджер, замеряет длительность фазы
+    - mark(name) — отметка момента (первый кадр, готовность ресурсов)
+    - Фазы из фонового потока загрузки помечаются именем потока
+    - Выключенный профиль ничего не записывает
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.started_at = time.perf_counter()
+        self.phases: list[tuple[str, str, float, float]] = []  # (имя, поток, начало, конец)
+        self.marks: dict[str, float] = {}
+        self.reported = False
+
+    def enable(self):
+        """Включает запись фаз; время отсчитывается от момента включения."""
+        self.enabled = True
+        self.started_at = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Замеряет фазу запуска.
+
+        Args:
+            name: Название фазы
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, threading.current_thread().name, start, time.perf_counter()))
+
+    def mark(self, name: str):
+        """
+        Отмечает момент запуска (повторные отметки с тем же именем игнорируются).
+
+        Args:
+            name: Название события
+        """
+        if self.enabled and name not in self.marks:
+            self.marks[name] = time.perf_counter()
+
+    def report(self) -> str:
+        """
+        Формирует таблицу фаз.
+
+        Returns:
+            Текст отчёта (время в миллисекундах от начала запуска)
+        """
+        lines = [f"{'Фаза':<32} {'Поток':<16} {'Начало, мс':>11} {'Длит., мс':>10}"]
+        for name, thread, start, end in self.phases:
+            offset = (start - self.started_at) * 1000
+            lines.append(f"{name:<32} {thread:<16} {offset:>11.1f} {(end - start) * 1000:>10.1f}")
+        for name, moment in sorted(self.marks.items(), key=lambda item: item[1]):
+            lines.append(f"{name:<32} {'':<16} {(moment - self.started_at) * 1000:>11.1f} {'':>10}")
+        return "\n".join(lines)
+
+    def print_report(self):
+        """Печатает отчёт один раз (если профиль включён)."""
+        if not self.enabled or self.reported:
+            return
+
+        self.reported = True
+        print("⏱️ Профиль запуска:")
+        print(self.report())
+
+
+# Общий профиль запуска приложения
+startup_profile = StartupProfile()
@@ -0,0 +1,186 @@
+"""
+Атлас текстур: сборка при подготовке ресурсов и загрузка при старте.
+
+Все спрайты из resources/images упаковываются в одно изображение атласа и манифест
+с прямоугольниками областей. При старте игра читает и декодирует один файл
+вместо нескольких десятков, а все текстуры вырезаются из него в памяти.
+Полноэкранные слои (фон, блик, рамка) в атлас не входят: они загружаются
+отдельно один раз и переиспользуются всеми view.
+
+Пересобрать атлас после изменения картинок:
+    uv run -m src.safari.texture_atlas
+"""
+
+import json
+from pathlib import Path
+
+import arcade
+from PIL import Image
+
+from .constants import (
+    ATLAS_EXCLUDED_IMAGES,
+    ATLAS_IMAGE_PATH,
+    ATLAS_MANIFEST_PATH,
+    ATLAS_MAX_SIDE,
+    ATLAS_PADDING,
+    ATLAS_WIDTH,
+    IMAGES_PATH,
+)
+
+
+def pack_regions(sizes: dict[str, tuple[int, int]], width: int = ATLAS_WIDTH, padding: int = ATLAS_PADDING):
+    """
+    Раскладывает прямоугольники по полкам (shelf packing).
+
+    Картинки сортируются по убыванию высоты и ставятся слева направо;
+    не поместившаяся картинка начинает новую полку.
+
+    Args:
+        sizes: Имя области -> (ширина, высота)
+        width: Ширина атласа в пикселях
+        padding: Отступ между областями в пикселях
+
+    Returns:
+        (области имя -> (x, y, ширина, высота), высота атласа)
+    """
+    regions = {}
+    x = y = shelf_height = 0
+
+    for name, (w, h) in sorted(sizes.items(), key=lambda item: (-item[1][1], -item[1][0], item[0])):
+        if w > width:
+            raise ValueError(f"Картинка {name} шире атласа ({w} > {width})")
+        if x + w > width:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+
+        regions[name] = (x, y, w, h)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+
+    return regions, y + shelf_height
+
+
+def atlas_sources(images_path: Path = IMAGES_PATH) -> dict[str, Path]:
+    """
+    Картинки, которые входят в атлас.
+
+    Args:
+        images_path: Папка с исходными PNG
+
+    Returns:
+        Относительный путь картинки -> путь к файлу
+    """
+    sources = {}
+    for path in sorted(images_path.rglob("*.png")):
+        name = path.relative_to(images_path).as_posix()
+        if name in ATLAS_EXCLUDED_IMAGES:
+            continue
+        with Image.open(path) as image:
+            if max(image.size) > ATLAS_MAX_SIDE:
+                continue
+        sources[name] = path
+    return sources
+
+
+def build_atlas(
+    images_path: Path = IMAGES_PATH,
+    image_path: Path = ATLAS_IMAGE_PATH,
+    manifest_path: Path = ATLAS_MANIFEST_PATH,
+) -> dict:
+    """
+    Собирает изображение атласа и манифест областей.
+
+    Args:
+        images_path: Папка с исходными PNG
+        image_path: Куда записать изображение атласа
+        manifest_path: Куда записать манифест
+
+    Returns:
+        Манифест (размер атласа и области по относительным путям картинок)
+    """
+    images = {name: Image.open(path).convert("RGBA") for name, path in atlas_sources(images_path).items()}
+
+    regions, height = pack_regions({name: image.size for name, image in images.items()})
+
+    atlas = Image.new("RGBA", (ATLAS_WIDTH, height), (0, 0, 0, 0))
+    for name, (x, y, _, _) in regions.items():
+        atlas.paste(images[name], (x, y))
+
+    image_path.parent.mkdir(parents=True, exist_ok=True)
+    atlas.save(image_path, optimize=True)
+
+    manifest = {
+        "image": image_path.name,
+        "size": [ATLAS_WIDTH, height],
+        "regions": {name: list(region) for name, region in sorted(regions.items())},
+    }
+    manifest_path.write_text(_dump_manifest(manifest), encoding="utf-8")
+    return manifest
+
+
+def _dump_manifest(manifest: dict) -> str:
+    """JSON манифеста в формате хука pretty-format-json (отступ 2, ключи по алфавиту)."""
+    return json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+
+
+class TextureAtlas:
+    """
+    Загруженный атлас текстур.
+
+    Особенности:
+    - Изображение атласа читается и декодируется один раз
+    - Текстура области создаётся при первом запросе и кэшируется
+    - Хитбоксы считаются по пикселям области, как у arcade.load_texture
+    """
+
+    def __init__(self, image: Image.Image, regions: dict[str, list[int]]):
+        """
+        Args:
+            image: Изображение атласа
+            regions: Имя области -> [x, y, ширина, высота]
+        """
+        self.image = image
+        self.regions = regions
+        self._textures: dict[str, arcade.Texture] = {}
+
+    @classmethod
+    def load(cls, image_path: Path = ATLAS_IMAGE_PATH, manifest_path: Path = ATLAS_MANIFEST_PATH):
+        """
+        Загружает атлас с диска.
+
+        Returns:
+            TextureAtlas или None, если атлас ещё не собран
+        """
+        if not image_path.exists() or not manifest_path.exists():
+            return None
+
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        image = Image.open(image_path).convert("RGBA")
+        return cls(image, manifest["regions"])
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.regions
+
+    def get_texture(self, name: str) -> arcade.Texture:
+        """
+        Возвращает текстуру области.
+
+        Args:
+            name: Относительный путь картинки внутри resources/images
+
+        Returns:
+            Текстура, вырезанная из атласа
+        """
+        texture = self._textures.get(name)
+        if texture is None:
+            x, y, w, h = self.regions[name]
+            texture = arcade.Texture(self.image.crop((x, y, x + w, y + h)), hash=f"atlas:{name}")
+            self._textures[name] = texture
+        return texture
+
+
+if __name__ == "__main__":
+    result = build_atlas()
+    width, height = result["size"]
+    print(f"🧩 Атлас собран ({width}x{height}, картинок: {len(result['regions'])}) -> {ATLAS_IMAGE_PATH}")
@@ -1,33 +1,29 @@
 """
 Менеджер индикаторов убитых животных.
-Управляет отображением лампочек: газели, бизоны, носорог.
+Управляет отображением лампочек счётчиков дорожек-целей: газели, бизоны, носорог.
 """
 
 import arcade
 
-from ..constants import (
-    BIZON_INDICATOR_POSITIONS,
-    GAZELLE_INDICATOR_POSITIONS,
-    RHINO_INDICATOR_POSITIONS,
-)
+from ..events import AnimalKilled
 from ..resource_manager import Textures
+from ..simulation.lanes import LANES, Lane, score_lanes
 
 
 class AnimalIndicatorManager:
     """
     Управляет индикаторами убитых животных.
-    Каждое убийство активирует следующую лампочку в соответствующей группе.
+    Группы лампочек строятся по таблице дорожек: одна группа на счётчик score_key.
+    Каждое убийство активирует следующую лампочку в соответствующей группе (по событию AnimalKilled).
     """
 
-    def __init__(self):
-        self.gazelle_indicators: list[arcade.Sprite] = []  # Список спрайтов газелей
-        self.bizon_indicators: list[arcade.Sprite] = []  # Список спрайтов бизонов
-        self.rhino_indicators: list[arcade.Sprite] = []  # Список спрайтов носорога
+    def __init__(self, lanes: tuple[Lane, ...] = LANES):
+        # Группы по счётчикам в порядке таблицы дорожек
+        self.lanes: dict[str, Lane] = {key: lane for key, lane in score_lanes(lanes).items() if lane.indicator_textures}
+        self.indicators: dict[str, list[arcade.Sprite]] = {key: [] for key in self.lanes}
 
-        # SpriteLists для удобной отрисовки
-        self.gazelle_sprite_list: arcade.SpriteList = arcade.SpriteList()
-        self.bizon_sprite_list: arcade.SpriteList = arcade.SpriteList()
-        self.rhino_sprite_list: arcade.SpriteList = arcade.SpriteList()
+        # SpriteList для удобной отрисовки всех групп
+        self.sprite_list: arcade.SpriteList = arcade.SpriteList()
 
         self._initialized = False
 
@@ -37,29 +33,10 @@ class AnimalIndicatorManager:
             return
 
         success = True
-
-        # Создание индикаторов газелей
-        success &= self._create_indicators(
-            self.gazelle_indicators,
-            self.gazelle_sprite_list,
-            Textures.gazelle_indicators,
-            GAZELLE_INDICATOR_POSITIONS,
-            "Газель",
-        )
-
-        # Создание индикаторов бизонов
-        success &= self._create_indicators(
-            self.bizon_indicators, self.bizon_sprite_list, Textures.bizon_indicators, BIZON_INDICATOR_POSITIONS, "Бизон"
-        )
-
-        # Создание индикаторов носорога
-        success &= self._create_single_indicator(
-            self.rhino_indicators,
-            self.rhino_sprite_list,
-            Textures.rhino_indicators,
-            RHINO_INDICATOR_POSITIONS,
-            "Носорог",
-        )
+        for key, lane in self.lanes.items():
+            textures = getattr(Textures, lane.indicator_textures or "", None) or []
+            name = lane.label or key
+            success &= self._create_indicators(self.indicators[key], textures, lane.indicator_positions, name)
 
         if success:
             print("✅ Индикаторы животных успешно созданы")
@@ -68,7 +45,7 @@ class AnimalIndicatorManager:
 
         self._initialized = True
 
-    def _create_indicators(self, indicator_list, sprite_list, textures, positions, name):
+    def _create_indicators(self, indicator_list, textures, positions, name):
         """Вспомогательный метод для создания группы индикаторов."""
         if not textures or len(textures) != len(positions):
             print(f"❌ Не хватает текстур для {name}: {len(textures)} вместо {len(positions)}")
@@ -82,46 +59,38 @@ class AnimalIndicatorManager:
                 sprite.center_y = y
                 sprite.visible = False
                 indicator_list.append(sprite)
-                sprite_list.append(sprite)
+                self.sprite_list.append(sprite)
             except Exception as e:
                 print(f"❌ Ошибка создания индикатора {name} #{i + 1}: {e}")
                 return False
         return True
 
-    def _create_single_indicator(self, indicator_list, sprite_list, textures, positions, name):
-        """Создание одного индикатора (например, носорог)."""
-        if not textures or len(positions) == 0:
-            print(f"❌ Нет текстур или позиций для {name}")
-            return False
-
-        try:
-            sprite = arcade.Sprite()
-            sprite.texture = textures[0]  # Только одна текстура
-            sprite.center_x = positions[0][0]
-            sprite.center_y = positions[0][1]
-            sprite.visible = False
-            indicator_list.append(sprite)
-            sprite_list.append(sprite)
-            return True
-        except Exception as e:
-            print(f"❌ Ошибка создания индикатора {name}: {e}")
-            return False
-
-    def update(self, gazelle_kills: int, bizon_kills: int, rhino_kills: int):
+    def update(self, kills: dict[str, int]):
         """
         Обновляет состояние индикаторов на основе количества убийств.
         Активирует нужное количество лампочек.
+
+        Args:
+            kills: Убийства по счётчикам (ScoreManager.kills)
         """
         if not self._initialized:
             self.setup()
 
-        self._update_group(self.gazelle_indicators, gazelle_kills, 8)
-        self._update_group(self.bizon_indicators, bizon_kills, 4)
-        self._update_group(self.rhino_indicators, rhino_kills, 1)
+        for key, indicators in self.indicators.items():
+            self._update_group(indicators, kills.get(key, 0))
+
+    def on_animal_killed(self, event: AnimalKilled):
+        """Включает одну лампочку, соответствующую новому убийству."""
+        if not self._initialized:
+            self.setup()
+
+        indicators = self.indicators.get(event.animal_type, [])
+        if 0 < event.kills <= len(indicators):
+            indicators[event.kills - 1].visible = True
 
-    def _update_group(self, indicators, kills, max_count):
+    def _update_group(self, indicators, kills):
         """Обновляет видимость индикаторов в группе."""
-        count = min(max(kills, 0), max_count)
+        count = min(max(kills, 0), len(indicators))
         for i, ind in enumerate(indicators):
             ind.visible = i < count
 
@@ -130,16 +99,14 @@ class AnimalIndicatorManager:
         if not self._initialized:
             return
 
-        self.gazelle_sprite_list.draw()
-        self.bizon_sprite_list.draw()
-        self.rhino_sprite_list.draw()
+        self.sprite_list.draw()
 
     def reset(self):
         """Сбрасывает все индикаторы."""
         if not self._initialized:
             return
 
-        for group in [self.gazelle_indicators, self.bizon_indicators, self.rhino_indicators]:
+        for group in self.indicators.values():
             for ind in group:
                 ind.visible = False
         print("🔄 Индикаторы животных сброшены")
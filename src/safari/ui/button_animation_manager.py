@@ -7,22 +7,30 @@ import arcade
 
 from ..constants import BUTTON_POSITION, BUTTON_PRESS_DURATION
 from ..resource_manager import Textures
+from ..scheduler import ScheduledCall, Scheduler
 
 
 class ButtonAnimationManager:
     """
     Управляет анимацией нажатия кнопки выстрела.
+    Кнопка отпускается вызовом в планировщике, а не таймером, уменьшаемым на каждом кадре.
     """
 
-    def __init__(self):
+    def __init__(self, scheduler: Scheduler | None = None):
+        """
+        Args:
+            scheduler: Планировщик, по часам которого отпускается кнопка (None — свой, его двигает update)
+        """
         # Спрайт нажатой кнопки
         self.button_sprite = None
 
         # SpriteList для отрисовки
         self.sprite_list = arcade.SpriteList()
 
-        # Таймер анимации
-        self.press_timer = 0.0
+        # Отпускание кнопки
+        self.owns_scheduler = scheduler is None
+        self.scheduler = scheduler or Scheduler()
+        self.release_call: ScheduledCall | None = None
         self.is_pressed = False
 
         # Флаг инициализации
@@ -59,20 +67,22 @@ class ButtonAnimationManager:
             return
 
         self.is_pressed = True
-        self.press_timer = BUTTON_PRESS_DURATION
         self.button_sprite.visible = True
+        # Повторное нажатие продлевает анимацию
+        self.scheduler.cancel(self.release_call)
+        self.release_call = self.scheduler.schedule(BUTTON_PRESS_DURATION, self.release)
 
-    def update(self, delta_time: float):
-        """Обновляет таймер анимации."""
-        if not self.is_pressed:
-            return
-
-        self.press_timer -= delta_time
+    def release(self):
+        """Отпускает кнопку."""
+        self.is_pressed = False
+        self.release_call = None
+        if self.button_sprite:
+            self.button_sprite.visible = False
 
-        if self.press_timer <= 0:
-            self.is_pressed = False
-            if self.button_sprite:
-                self.button_sprite.visible = False
+    def update(self, delta_time: float):
+        """Сдвигает часы собственного планировщика (общий двигает его владелец)."""
+        if self.owns_scheduler:
+            self.scheduler.advance(delta_time)
 
     def draw(self):
         """Отрисовывает нажатую кнопку (если она видима)."""
@@ -81,7 +91,8 @@ class ButtonAnimationManager:
 
     def reset(self):
         """Сбрасывает анимацию."""
+        self.scheduler.cancel(self.release_call)
+        self.release_call = None
         self.is_pressed = False
-        self.press_timer = 0.0
         if self.button_sprite:
             self.button_sprite.visible = False
@@ -0,0 +1,87 @@
+"""
+Корпус автомата: ТВ-экран, блик и рамка, общие для всех сцен.
+
+Корпус создаётся один раз в SafariGame и живёт всё время работы игры,
+поэтому переходы между сценами не создают заново спрайты и списки спрайтов
+и не выгружают повторно полноэкранные текстуры. Сцена рисует свой
+контент между draw_under() и draw_over() или поверх draw_backdrop().
+"""
+
+import arcade
+
+from ..constants import GLARE_EFFECT, SCREEN_HEIGHT, SCREEN_WIDTH, SLOT_MACHINE_FRAME, TV_BACKGROUND
+from ..resource_manager import get_texture
+from .rules_window import RulesPanel
+from .static_layer_cache import StaticLayerCache
+
+# Затемнение фона под окном правил и текстом экрана завершения игры
+DIM_COLOR = (0, 0, 0, 180)
+
+
+class Cabinet:
+    """
+    Общие слои корпуса автомата.
+
+    Особенности:
+    - draw_under() — ТВ-экран под контентом сцены (игра)
+    - draw_over() — блик и рамка поверх контента одним проходом из кэша
+    - draw_backdrop(dimmed) — экран, блик и рамка (и затемнение) одним проходом,
+      для сцен, чей контент целиком лежит поверх рамки (правила, итог игры)
+    - rules_panel — окно правил с текстурой, одно на все экраны правил
+    """
+
+    def __init__(self):
+        center = {"center_x": SCREEN_WIDTH / 2, "center_y": SCREEN_HEIGHT / 2}
+
+        self.background_sprites = arcade.SpriteList()  # ТВ-экран
+        self.background_sprites.append(arcade.Sprite(get_texture(TV_BACKGROUND), **center))
+
+        self.effect_sprites = arcade.SpriteList()  # Блик
+        self.effect_sprites.append(arcade.Sprite(get_texture(GLARE_EFFECT), **center))
+
+        self.slot_machine_sprite = arcade.SpriteList()  # Рамка автомата
+        self.slot_machine_sprite.append(arcade.Sprite(get_texture(SLOT_MACHINE_FRAME), **center))
+
+        self.dim_sprites = arcade.SpriteList()  # Затемнение фона
+        self.dim_sprites.append(arcade.SpriteSolidColor(SCREEN_WIDTH, SCREEN_HEIGHT, color=DIM_COLOR, **center))
+
+        chrome = [self.background_sprites, self.effect_sprites, self.slot_machine_sprite]
+        self.overlay = StaticLayerCache("cabinet_overlay", [self.effect_sprites, self.slot_machine_sprite])
+        self.backdrop = StaticLayerCache("cabinet_backdrop", chrome)
+        self.dimmed_backdrop = StaticLayerCache("cabinet_dimmed_backdrop", [*chrome, self.dim_sprites])
+
+        self._rules_panel: RulesPanel | None = None  # Создаётся при первом показе правил
+
+    @property
+    def rules_panel(self) -> RulesPanel:
+        """Окно правил, собранное в текстуру (создаётся один раз и переиспользуется)."""
+        if self._rules_panel is None:
+            self._rules_panel = RulesPanel(SCREEN_WIDTH, SCREEN_HEIGHT)
+        return self._rules_panel
+
+    def draw_under(self):
+        """Рисует ТВ-экран под контентом сцены."""
+        self.background_sprites.draw()
+
+    def draw_over(self):
+        """Рисует блик и рамку поверх контента сцены."""
+        self.overlay.draw()
+
+    def draw_backdrop(self, dimmed: bool = False):
+        """
+        Рисует весь корпус как фон сцены.
+
+        Args:
+            dimmed: Затемнить корпус (под окном правил и текстом экрана завершения игры)
+        """
+        if dimmed:
+            self.dimmed_backdrop.draw()
+        else:
+            self.backdrop.draw()
+
+    def invalidate(self):
+        """Перерисовывает кэши корпуса при следующей отрисовке."""
+        for cache in (self.overlay, self.backdrop, self.dimmed_backdrop):
+            cache.invalidate()
+        if self._rules_panel is not None:
+            self._rules_panel.invalidate()
@@ -0,0 +1,73 @@
+"""
+Оверлей профиля кадра.
+Показывает p50/p95/p99 каждой стадии кадра поверх игры (клавиша F3).
+"""
+
+import arcade
+
+from ..constants import FRAME_PROFILE_POSITION, FRAME_PROFILE_REFRESH
+from ..frame_profiler import FrameProfiler
+
+
+class FrameProfileOverlay:
+    """
+    Таблица перцентилей стадий кадра поверх игры.
+
+    Текст пересобирается раз в FRAME_PROFILE_REFRESH секунд, а не на каждом
+    кадре: перцентили и раскладка текста дороже самих замеров.
+    """
+
+    def __init__(self, profiler: FrameProfiler):
+        """
+        Args:
+            profiler: Профиль кадра, из которого берутся перцентили
+        """
+        self.profiler = profiler
+        self.visible = False
+        self.time_since_refresh = FRAME_PROFILE_REFRESH
+
+        x, y = FRAME_PROFILE_POSITION
+        self.text = arcade.Text(
+            "",
+            x,
+            y,
+            arcade.color.LIME_GREEN,
+            font_size=11,
+            font_name=("Courier New", "DejaVu Sans Mono", "monospace"),
+            width=420,
+            multiline=True,
+            anchor_y="top",
+        )
+
+    def toggle(self) -> bool:
+        """Показывает или прячет оверлей вместе с замерами."""
+        self.visible = self.profiler.toggle()
+        self.time_since_refresh = FRAME_PROFILE_REFRESH
+        print(f"⏱️ Профиль кадра {'включён' if self.visible else 'выключен'}")
+        return self.visible
+
+    def update(self, delta_time: float):
+        """Пересобирает текст, если пора."""
+        if not self.visible:
+            return
+
+        self.time_since_refresh += delta_time
+        if self.time_since_refresh < FRAME_PROFILE_REFRESH:
+            return
+        self.time_since_refresh = 0.0
+        self.text.text = self.profiler.report()
+
+    def draw(self):
+        """Рисует таблицу на полупрозрачной подложке."""
+        if not self.visible or not self.text.text:
+            return
+
+        left, top = FRAME_PROFILE_POSITION
+        arcade.draw_lrbt_rectangle_filled(
+            left - 8,
+            left + self.text.content_width + 8,
+            top - self.text.content_height - 8,
+            top + 8,
+            (0, 0, 0, 180),
+        )
+        self.text.draw()
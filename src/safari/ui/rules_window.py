@@ -2,41 +2,55 @@
 UI-компонент: модальное окно с правилами игры.
 
 Отображается поверх игровой сцены. Управляет:
-- Затемнением фона
 - Плавным появлением окна (fade-in)
 - Отрисовкой заголовка и текста правил
 
+Окно (фон, рамка и оба текста) один раз рисуется в текстуру, а появление —
+это прозрачность одного спрайта с этой текстурой: на кадре рисуется один
+прямоугольник вместо прямоугольников и многострочного текста.
+Окно с текстурой (RulesPanel) создаётся один раз на процесс и хранится
+в корпусе автомата (SafariGame.cabinet), поэтому каждый новый экран правил
+берёт уже нарисованную текстуру. Затемнение фона тоже рисует корпус.
+
 Не отвечает за переходы — только за визуализацию.
 Переход в игру управляется RulesView.
 """
 
 import arcade
-from arcade import Text
+from arcade import Text, gl
+from arcade.types import Color
 
-from ..constants import AVENTURA_FONT_NAME, SAFARI_FONT_NAME
+from ..constants import AVENTURA_FONT_NAME, SAFARI_FONT_NAME, STATIC_LAYER_CACHE
 
+# Смешивание, которое меняет только прозрачность: окно правил непрозрачно целиком,
+# а текст при отрисовке в текстуру оставляет полупрозрачные края букв
+OPAQUE_ALPHA_BLEND = (gl.ZERO, gl.ONE, gl.ONE, gl.ZERO)
 
-class RulesManager:
-    """Управление окном с правилами игры: затемнение с 0 сек, окно плавно появляется за 2 сек."""
 
-    def __init__(self, width: int, height: int):
-        self.width = width
-        self.height = height
-        self.show_rules = True
-        # Анимация появления окна правил: от 0 до 2 секунд
-        self.elapsed_time = 0.0
-        self.fade_duration = 2.0  # Плавное появление окна правил
-        self.alpha = 0  # Прозрачность окна и текста (0 = скрыто, 255 = видно)
-        self.animation_finished = False
+class RulesPanel:
+    """
+    Окно правил: фон, рамка, заголовок и текст правил, собранные в одну текстуру.
+
+    Особенности:
+    - Создаётся один раз (Cabinet.rules_panel) и переиспользуется всеми экранами правил
+    - Текстура рисуется при первой отрисовке и после invalidate()
+    - STATIC_LAYER_CACHE = False рисует окно напрямую (для сравнения и отладки)
+    """
 
+    def __init__(self, width: int, height: int):
+        """
+        Args:
+            width: Ширина экрана
+            height: Высота экрана
+        """
         # Основные размеры окна
         self.window_width = 800
         self.window_height = 540
-        self.center_x = self.width / 2
-        self.center_y = self.height / 2
+        self.center_x = width / 2
+        self.center_y = height / 2
         self.x = self.center_x - self.window_width / 2
         self.y = self.center_y - self.window_height / 2
-        self.text_color = (166, 36, 31)  # Цвет текста
+        self.text_color = Color(166, 36, 31)  # Цвет текста
 
         # Позиции текста
         title_y = self.y + self.window_height - 60
@@ -84,67 +98,134 @@ class RulesManager:
             font_name=AVENTURA_FONT_NAME,
         )
 
-    def update(self, delta_time: float):
-        """Обновление: окно правил плавно появляется в течение 2 секунд."""
-        if not self.show_rules:
-            return
-
-        self.elapsed_time += delta_time
-        progress = min(self.elapsed_time / self.fade_duration, 1.0)
-        self.alpha = int(255 * progress)
-
-        if progress >= 1.0:
-            self.alpha = 255
-            self.animation_finished = True
-
-        self.title_text.color = (166, 36, 31, self.alpha)
-        self.rules_text.color = (166, 36, 31, self.alpha)
-
-    def on_draw(self):
-        """Отрисовка: затемнение фона сразу, окно правил — с fade-in."""
-        if not self.show_rules:
+        # Окно правил, собранное в одну текстуру (рисуется при первой отрисовке)
+        self.cache_enabled = STATIC_LAYER_CACHE
+        self.rendered = False
+        self.renders = 0  # Сколько раз окно перерисовывалось в текстуру
+        self.texture = arcade.Texture.create_empty("rules_panel", (self.window_width, self.window_height))
+        self.sprite = arcade.Sprite(self.texture, center_x=self.center_x, center_y=self.center_y)
+        self.sprite_list = arcade.SpriteList()
+        self.sprite_list.append(self.sprite)
+
+    def invalidate(self):
+        """Окно перерисуется в текстуру при следующей отрисовке."""
+        self.rendered = False
+
+    def draw(self, alpha: int):
+        """
+        Рисует окно правил (из текстуры, если кэш включён).
+
+        Args:
+            alpha: Прозрачность окна и текста (0 = скрыто, 255 = видно)
+        """
+        if not self.cache_enabled:
+            self._draw_panel(alpha)
             return
 
-        # === 1. Затемнение фона — мгновенно (с 0-й секунды) ===
-        arcade.draw_lrbt_rectangle_filled(
-            left=0,
-            right=self.width,
-            bottom=0,
-            top=self.height,
-            color=(0, 0, 0, 180),  # Полупрозрачный чёрный фон
-        )
-
-        # Если окно ещё не видно — дальше не рисуем
-        if self.alpha == 0:
-            return
-
-        # Используем атрибуты, инициализированные в __init__
-        window_width = self.window_width
-        window_height = self.window_height
+        if not self.rendered:
+            self._render()
+        self.sprite.alpha = alpha
+        self.sprite_list.draw()
+
+    def _render(self):
+        """Рисует окно правил в текстуру."""
+        atlas = self.sprite_list.atlas or arcade.get_window().ctx.default_atlas
+        atlas.add(self.texture)
+        # Проекция в координатах экрана: окно рисуется теми же координатами, что и напрямую
+        projection = (self.x, self.x + self.window_width, self.y, self.y + self.window_height)
+        with atlas.render_into(self.texture, projection=projection) as framebuffer:
+            framebuffer.clear(color=(0, 0, 0, 0), viewport=framebuffer.viewport)
+            self._draw_panel(255)
+            # Края букв смешались с полупрозрачностью — окно снова делаем непрозрачным
+            opaque = arcade.SpriteList()
+            opaque.append(
+                arcade.SpriteSolidColor(
+                    self.window_width, self.window_height, self.center_x, self.center_y, color=(0, 0, 0, 255)
+                )
+            )
+            opaque.draw(blend_function=OPAQUE_ALPHA_BLEND)
+        self.rendered = True
+        self.renders += 1
+
+    def _draw_panel(self, alpha: int):
+        """
+        Рисует фон, рамку и тексты окна правил.
+
+        Args:
+            alpha: Прозрачность окна и текста (0 = скрыто, 255 = видно)
+        """
         x = self.x
         y = self.y
 
         # Цвета с прозрачностью (только для окна правил и текста)
-        bg_color = (221, 165, 45, self.alpha)  # Фон окна
-        border_color = (166, 36, 31, self.alpha)  # Рамка
+        bg_color = (221, 165, 45, alpha)  # Фон окна
+        border_color = (166, 36, 31, alpha)  # Рамка
 
-        # === 2. Окно правил — фон и рамка ===
+        # === 1. Окно правил — фон и рамка ===
         arcade.draw_lrbt_rectangle_filled(
-            left=x, right=x + window_width, bottom=y, top=y + window_height, color=bg_color
+            left=x, right=x + self.window_width, bottom=y, top=y + self.window_height, color=bg_color
         )
         arcade.draw_lrbt_rectangle_outline(
             left=x + 10,
-            right=x + window_width - 10,
+            right=x + self.window_width - 10,
             bottom=y + 10,
-            top=y + window_height - 10,
+            top=y + self.window_height - 10,
             color=border_color,
             border_width=4,
         )
 
-        # === 3. Текст — заголовок и правила ===
+        # === 2. Текст — заголовок и правила ===
+        text_color = self.text_color.replace(a=alpha)
+        if self.title_text.color != text_color:
+            self.title_text.color = text_color
+            self.rules_text.color = text_color
         self.title_text.draw()
         self.rules_text.draw()
 
+
+class RulesManager:
+    """Управление окном с правилами игры: окно плавно появляется за 2 сек."""
+
+    def __init__(self, width: int, height: int, panel: RulesPanel | None = None):
+        """
+        Args:
+            width: Ширина экрана
+            height: Высота экрана
+            panel: Готовое окно правил (Cabinet.rules_panel); None — создать своё
+        """
+        self.width = width
+        self.height = height
+        self.show_rules = True
+        # Анимация появления окна правил: от 0 до 2 секунд
+        self.elapsed_time = 0.0
+        self.fade_duration = 2.0  # Плавное появление окна правил
+        self.alpha = 0  # Прозрачность окна и текста (0 = скрыто, 255 = видно)
+        self.animation_finished = False
+
+        # Окно правил с текстурой — общее для всех экранов правил
+        self.panel = panel or RulesPanel(width, height)
+
+    def update(self, delta_time: float):
+        """Обновление: окно правил плавно появляется в течение 2 секунд."""
+        if not self.show_rules:
+            return
+
+        self.elapsed_time += delta_time
+        progress = min(self.elapsed_time / self.fade_duration, 1.0)
+        self.alpha = int(255 * progress)
+
+        if progress >= 1.0:
+            self.alpha = 255
+            self.animation_finished = True
+
+    def on_draw(self):
+        """Отрисовка: окно правил — с fade-in."""
+        # Если окно скрыто или ещё не видно — не рисуем
+        if not self.show_rules or self.alpha == 0:
+            return
+
+        self.panel.draw(self.alpha)
+
     def hide(self):
         """Скрыть окно с правилами."""
         self.show_rules = False
@@ -6,13 +6,14 @@
 import arcade
 
 from ..constants import SHOT_INDICATOR_POSITIONS
+from ..events import ShotFired
 from ..resource_manager import Textures
 
 
 class ShotIndicatorManager:
     """
     Управляет индикаторами выстрелов.
-    Каждый выстрел деактивирует следующую лампочку.
+    Каждый выстрел деактивирует следующую лампочку (по событию ShotFired).
     """
 
     def __init__(self):
@@ -95,6 +96,18 @@ class ShotIndicatorManager:
         # Обновляем видимость индикаторов
         for i in range(-shots_fired, 0):  # [-1, -2, ..., -shots_fired]
             self.indicators[i].visible = False
+        self.active_indicators = shots_fired
+
+    def on_shot_fired(self, event: ShotFired):
+        """Гасит лампочку только что сделанного выстрела (одну, без прохода по остальным)."""
+        if not self._initialized:
+            self.setup()
+        if not self._initialized or not self.indicators:
+            return
+
+        if 0 < event.shots_fired <= self.max_indicators:
+            self.indicators[-event.shots_fired].visible = False
+        self.active_indicators = min(max(event.shots_fired, 0), self.max_indicators)
 
     def draw(self):
         """Отрисовывает все активные индикаторы."""
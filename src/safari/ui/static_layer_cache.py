@@ -0,0 +1,73 @@
+"""
+Кэш статичных слоёв.
+
+Фон, блик и рамка автомата — полноэкранные полупрозрачные спрайты, которые
+не меняются. Вместо нескольких проходов со смешиванием на каждом кадре
+они один раз рисуются в текстуру атласа, а дальше на кадре рисуется
+только она — один полноэкранный проход вместо нескольких.
+"""
+
+import arcade
+from arcade import gl
+
+from ..constants import SCREEN_HEIGHT, SCREEN_WIDTH, STATIC_LAYER_CACHE
+
+# Смешивание при отрисовке слоёв в кэш: цвет накапливается уже умноженным
+# на прозрачность, а прозрачность складывается правильно (а не как a²)
+COMPOSITE_BLEND = (gl.SRC_ALPHA, gl.ONE_MINUS_SRC_ALPHA, gl.ONE, gl.ONE_MINUS_SRC_ALPHA)
+# Смешивание готового кэша с экраном (цвет в кэше уже умножен на прозрачность)
+PREMULTIPLIED_BLEND = (gl.ONE, gl.ONE_MINUS_SRC_ALPHA)
+
+
+class StaticLayerCache:
+    """
+    Слои, один раз собранные в одну текстуру.
+
+    Особенности:
+    - Слои рисуются в текстуру при первой отрисовке и после invalidate()
+    - На кадре рисуется один спрайт с готовой текстурой
+    - Кэши с одинаковым именем используют одну область атласа
+    - STATIC_LAYER_CACHE = False рисует слои напрямую (для сравнения и отладки)
+    """
+
+    def __init__(self, name: str, layers: list[arcade.SpriteList]):
+        """
+        Args:
+            name: Имя кэша (уникально для набора слоёв)
+            layers: Списки спрайтов в порядке отрисовки снизу вверх
+        """
+        self.name = name
+        self.layers = layers
+        self.enabled = STATIC_LAYER_CACHE
+        self.is_dirty = True
+        self.renders = 0  # Сколько раз слои перерисовывались в кэш
+
+        self.texture = arcade.Texture.create_empty(f"static_layers:{name}", (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.sprite_list = arcade.SpriteList()
+        self.sprite_list.append(arcade.Sprite(self.texture, center_x=SCREEN_WIDTH / 2, center_y=SCREEN_HEIGHT / 2))
+
+    def invalidate(self):
+        """Помечает кэш устаревшим: слои перерисуются при следующей отрисовке."""
+        self.is_dirty = True
+
+    def _render(self):
+        """Рисует слои в текстуру кэша."""
+        atlas = self.sprite_list.atlas or arcade.get_window().ctx.default_atlas
+        atlas.add(self.texture)
+        with atlas.render_into(self.texture) as framebuffer:
+            framebuffer.clear(color=(0, 0, 0, 0), viewport=framebuffer.viewport)
+            for layer in self.layers:
+                layer.draw(blend_function=COMPOSITE_BLEND)
+        self.is_dirty = False
+        self.renders += 1
+
+    def draw(self):
+        """Рисует слои (из кэша, если он включён)."""
+        if not self.enabled:
+            for layer in self.layers:
+                layer.draw()
+            return
+
+        if self.is_dirty:
+            self._render()
+        self.sprite_list.draw(blend_function=PREMULTIPLIED_BLEND)
@@ -6,14 +6,12 @@ import arcade
 
 from ..constants import (
     AVENTURA_FONT_NAME,
-    GLARE_EFFECT,
     INPUT_DELAY_SECONDS,
     SAFARI_FONT_NAME,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
-    SLOT_MACHINE_FRAME,
-    TV_BACKGROUND,
 )
+from ..simulation.lanes import score_lanes
 from .rules_view import RulesView
 
 
@@ -34,12 +32,7 @@ class GameOverView(arcade.View):
             "victory": victory,
         }
 
-        self.input_enabled = False  # Ввод клавиш запрещён до таймаута
-
-        # Слои фона
-        self.background_sprites = arcade.SpriteList()  # ТВ-экран
-        self.effect_sprites = arcade.SpriteList()  # Блик
-        self.slot_machine_sprite = arcade.SpriteList()  # Рамка автомата
+        self.input_enabled = False  # Ввод клавиш запрещён до таймаута (по часам приложения SafariGame.scheduler)
 
         # Текстовые элементы
         self.title_text = None
@@ -50,18 +43,8 @@ class GameOverView(arcade.View):
         self.setup()
 
     def setup(self):
-        """Загрузка всех спрайтов фона и текста."""
+        """Создание текста (фон автомата — общий корпус SafariGame.cabinet)."""
         try:
-            # Фон
-            tv_sprite = arcade.Sprite(TV_BACKGROUND, center_x=SCREEN_WIDTH / 2, center_y=SCREEN_HEIGHT / 2)
-            self.background_sprites.append(tv_sprite)
-
-            glare_sprite = arcade.Sprite(GLARE_EFFECT, center_x=SCREEN_WIDTH / 2, center_y=SCREEN_HEIGHT / 2)
-            self.effect_sprites.append(glare_sprite)
-
-            frame_sprite = arcade.Sprite(SLOT_MACHINE_FRAME, center_x=SCREEN_WIDTH / 2, center_y=SCREEN_HEIGHT / 2)
-            self.slot_machine_sprite.append(frame_sprite)
-
             # Тексты
             if self.score_data["victory"]:
                 title_text = "ПОБЕДА!"
@@ -99,11 +82,10 @@ class GameOverView(arcade.View):
 
             # Статистика
             stats_lines = [
-                f"Носорогов убито: {self.score_data.get('rhino_kills', 0)}",
-                f"Бизонов убито: {self.score_data.get('bizon_kills', 0)}",
-                f"Газелей убито: {self.score_data.get('gazelle_kills', 0)}",
-                f"Выстрелов сделано: {self.score_data.get('shots_fired', 0)}",
+                f"{lane.label or key} убито: {self.score_data.get(f'{key}_kills', 0)}"
+                for key, lane in score_lanes().items()
             ]
+            stats_lines.append(f"Выстрелов сделано: {self.score_data.get('shots_fired', 0)}")
 
             stats_text = "\n".join(stats_lines)
 
@@ -137,31 +119,20 @@ class GameOverView(arcade.View):
             )
 
             # ⏳ Запланировать включение ввода через INPUT_DELAY_SECONDS секунд
-            arcade.schedule_once(self.enable_input, INPUT_DELAY_SECONDS)
+            self.window.scheduler.schedule(INPUT_DELAY_SECONDS, self.enable_input)
 
         except Exception as e:
             print(f"❌ Ошибка в GameOverView.setup(): {e}")
 
-    def enable_input(self, delta_time: float):
+    def enable_input(self):
         """Разрешает ввод после задержки."""
         self.input_enabled = True
 
     def on_draw(self):
         self.clear()
 
-        # Отрисовка фона
-        self.background_sprites.draw()
-        self.effect_sprites.draw()
-        self.slot_machine_sprite.draw()
-
-        # Затемнение фона
-        arcade.draw_lrbt_rectangle_filled(
-            left=0,
-            right=SCREEN_WIDTH,
-            bottom=0,
-            top=SCREEN_HEIGHT,
-            color=(0, 0, 0, 180),
-        )
+        # Корпус автомата с затемнением одним проходом из кэша
+        self.window.cabinet.draw_backdrop(dimmed=True)
 
         # Отрисовка текста
         self.title_text.draw()
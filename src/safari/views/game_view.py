@@ -1,63 +1,69 @@
 import arcade
 
-from ..collision.collision_system import CollisionSystem
 from ..constants import (
     GALLOP_SOUND_PATH,
-    GAME_TIME_SECONDS,
-    GLARE_EFFECT,
-    SCREEN_CENTER,
-    SLOT_MACHINE_FRAME,
+    REPLAY_ARCHIVE_PATH,
     TRACK_POSITIONS,
-    TV_BACKGROUND,
 )
-from ..entities.animals.bizon.bizon_spawner import BizonSpawner
-from ..entities.animals.gazelle.gazelle_spawner import GazelleSpawner
-from ..entities.animals.rhino.rhino_spawner import RhinoSpawner
-from ..entities.bullet.bullet_manager import BulletManager
-from ..entities.hunter.hunter import Hunter
-from ..entities.obstacles.barrier_spawner import BarrierSpawner
-from ..entities.obstacles.palm_spawner import PalmSpawner
 from ..entities.track import Track
-from ..score_manager import ScoreManager
+from ..events import AnimalKilled, ShotFired, TimeUp, Victory
+from ..frame_profiler import frame_profiler
+from ..simulation.game_session import GameSession
+from ..simulation.lanes import score_lanes
+from ..simulation.replay import RoundRecording
+from ..simulation.replay_archive import ReplayArchive
+from ..simulation.rng import new_seed
+from ..simulation.scenario import DEFAULT_SCENARIO, Scenario
+from ..sound_cache import sound_cache
 from ..ui.animal_indicator_manager import AnimalIndicatorManager
 from ..ui.button_animation_manager import ButtonAnimationManager
+from ..ui.frame_profile_overlay import FrameProfileOverlay
 from ..ui.shot_indicator_manager import ShotIndicatorManager
 from .game_over_view import GameOverView
 
 
 class GameView(arcade.View):
-    """Сцена: основная игра."""
-
-    def __init__(self):
+    """Сцена: основная игра. Отрисовывает состояние GameSession."""
+
+    def __init__(self, seed: int | None = None, scenario: Scenario = DEFAULT_SCENARIO):
+        """
+        Args:
+            seed: Зерно случайных чисел раунда (None — новое случайное)
+            scenario: Сценарий раунда (плотность появления, боезапас, нагрузка)
+        """
         super().__init__()
 
         # Используем Scene для управления порядком отрисовки
         self.scene = arcade.Scene()
 
         # Звук галопа
-        self.gallop_sound = None
         self.gallop_player = None
 
-        # Инициализируем охотника, пули и создателей животных с препятствиями
-        self.palm_spawner = None
-        self.rhino_spawner = None
-        self.bizon_spawner = None
-        self.gazelle_spawner = None
-        self.barrier_spawner = None
-        self.hunter_sprite: Hunter | None = None
-        self.bullet_manager = None
+        # Зерно раунда: одинаковое зерно даёт одинаковый график появления объектов
+        self.seed = new_seed() if seed is None else seed
+        print(f"🎲 Зерно раунда: {self.seed}")
+
+        # Игровая логика раунда (без окна)
+        self.session = GameSession(
+            game_time=scenario.game_time,
+            seed=self.seed,
+            endless=scenario.endless,
+            scenario=scenario,
+        )
+        # Запись ввода раунда для детерминированного воспроизведения (safari --record-replays)
+        self.recording = None
+        if self.window.record_replays:
+            self.recording = RoundRecording(seed=self.seed, scenario=scenario.to_dict())
+        if scenario is not DEFAULT_SCENARIO:
+            print(f"🧪 Сценарий: {scenario.name} — {scenario.description}")
 
         self.shot_indicators = None
         self.animal_indicators = None
         # Менеджер анимации кнопки
         self.button_animation = None
-        # Менеджер очков
-        self.score_manager = None
-        # Таймер игры
-        self.game_timer = None
-
-        # Сначала создаем систему столкновений
-        self.collision_system = CollisionSystem()
+        # Профиль кадра по стадиям (F3); замеры остаются включёнными между раундами
+        self.profile_overlay = FrameProfileOverlay(frame_profiler)
+        self.profile_overlay.visible = frame_profiler.enabled
 
         # Потом настраиваем игру
         self.setup()
@@ -65,229 +71,152 @@ class GameView(arcade.View):
 
     def start(self):
         """Запускает основные процессы игры."""
-        if self.rhino_spawner:
-            self.rhino_spawner.start()
-        if self.bizon_spawner:
-            self.bizon_spawner.start()
-        if self.gazelle_spawner:
-            self.gazelle_spawner.start()
-        if self.barrier_spawner:
-            self.barrier_spawner._spawn_barrier()
+        self.session.start()
 
     def setup(self):
-        """Загрузка фона игры и инициализация дорожек."""
+        """Инициализация дорожек и игровой логики (корпус автомата рисует SafariGame.cabinet)."""
         try:
-            # 1. ТВ-экран (фон)
-            tv_sprite = arcade.Sprite(TV_BACKGROUND, center_x=SCREEN_CENTER[0], center_y=SCREEN_CENTER[1])
-            self.scene.add_sprite_list("Background")
-            self.scene.get_sprite_list("Background").append(tv_sprite)
-
-            # 2. Дорожки
+            # 1. Дорожки
             self.scene.add_sprite_list("Tracks")
             for i, (x, y) in enumerate(TRACK_POSITIONS):
                 track = Track(track_index=i + 1, x=x, y=y)
                 self.scene["Tracks"].append(track)
 
-            # 3. Барьеры на пятой дорожке
-            self.scene.add_sprite_list("BarrierObstacles")
-            self.barrier_spawner = BarrierSpawner(self.scene["BarrierObstacles"])
-
-            # 4. Носороги на первой дорожке
-            self.scene.add_sprite_list("RhinoAnimals")
-            self.rhino_spawner = RhinoSpawner(self.scene["RhinoAnimals"])
-
-            # 5. Бизоны на второй дорожке
-            self.scene.add_sprite_list("BizonAnimals")
-            self.bizon_spawner = BizonSpawner(self.scene["BizonAnimals"])
-
-            # 6. Газели на третьей дорожке
-            self.scene.add_sprite_list("GazelleAnimals")
-            self.gazelle_spawner = GazelleSpawner(self.scene["GazelleAnimals"])
+            # 2. Игровая логика: создатели, охотник, пули, счёт и столкновения
+            self.session.setup()
+            for name, sprite_list in self.session.layers.items():
+                self.scene.add_sprite_list(name, sprite_list=sprite_list)
 
-            # 7. Пальмы на четвертой дорожке
-            self.scene.add_sprite_list("PalmObstacles")
-            self.palm_spawner = PalmSpawner(self.scene["PalmObstacles"])
-
-            # 8. Создаем и добавляем охотника
-            self.hunter_sprite: arcade.TextureAnimationSprite = Hunter()
-
-            self.scene.add_sprite_list("Hunter", sprite_list=arcade.SpriteList())
-            self.scene["Hunter"].append(self.hunter_sprite)
-
-            # 9. Инициализация менеджера пуль
-            self.bullet_manager = BulletManager()
-            self.bullet_manager.setup(self.hunter_sprite)
-            self.scene.add_sprite_list("Bullets", sprite_list=self.bullet_manager.sprite_list)
-            self.bullet_manager.enable_shooting()  # Разрешаем стрельбу
-
-            # 10. Блик (поверх дорожек)
-            glare_sprite = arcade.Sprite(GLARE_EFFECT, center_x=SCREEN_CENTER[0], center_y=SCREEN_CENTER[1])
-            self.scene.add_sprite_list("Effects")
-            self.scene["Effects"].append(glare_sprite)
-
-            # 11. Рамка автомата (самый верхний слой)
-            frame_sprite = arcade.Sprite(SLOT_MACHINE_FRAME, center_x=SCREEN_CENTER[0], center_y=SCREEN_CENTER[1])
-            self.scene.add_sprite_list("Frame")
-            self.scene["Frame"].append(frame_sprite)
-
-            # 12. Индикаторы выстрелов
+            # 3. Индикаторы выстрелов
             self.shot_indicators = ShotIndicatorManager()
             self.shot_indicators.setup()
 
-            # 13. Инициализация менеджера очков
-            self.score_manager = ScoreManager()
-
-            # 14. Анимация кнопки
-            self.button_animation = ButtonAnimationManager()
+            # 4. Анимация кнопки
+            self.button_animation = ButtonAnimationManager(self.session.scheduler)
             self.button_animation.setup()
 
-            # 15. Загрузка звука галопа
-            try:
-                self.gallop_sound = arcade.Sound(GALLOP_SOUND_PATH)
-                self.gallop_player = self.gallop_sound.play(loop=True)
-            except Exception as e:
-                print(f"❌ Ошибка загрузки звука галопа: {e}")
-
-            # 16. Настраиваем систему столкновений
-            if self.collision_system:
-                self.collision_system.setup(
-                    bullet_manager=self.bullet_manager,
-                    rhino_spawner=self.rhino_spawner,
-                    bizon_spawner=self.bizon_spawner,
-                    gazelle_spawner=self.gazelle_spawner,
-                    palm_spawner=self.palm_spawner,
-                    score_manager=self.score_manager,
-                )
-            else:
-                print("⚠️ collision_system не инициализирован!")
-
-            # 17. Индикаторы убитых животных
-            self.animal_indicators = AnimalIndicatorManager()
+            # 5. Звук галопа (потоком с диска, источник открыт один раз за процесс)
+            self.gallop_player = sound_cache.play_stream(GALLOP_SOUND_PATH, loop=True)
+
+            # 6. Индикаторы убитых животных
+            self.animal_indicators = AnimalIndicatorManager(self.session.lanes)
             self.animal_indicators.setup()
 
-            # Запускаем таймер на время игры GAME_TIME_SECONDS
-            self.game_timer = arcade.schedule_once(self.on_time_up, GAME_TIME_SECONDS)
+            # 7. Индикаторы и сцена меняются только по событиям раунда
+            events = self.session.events
+            events.subscribe(ShotFired, self.shot_indicators.on_shot_fired)
+            events.subscribe(AnimalKilled, self.animal_indicators.on_animal_killed)
+            events.subscribe(Victory, self._on_victory)
+            events.subscribe(TimeUp, self._on_time_up)
 
         except Exception as e:
             print(f"❌ Ошибка загрузки фона в GameView: {e}")
 
     def on_update(self, delta_time: float):
         """Обновление анимаций."""
+        frame_profiler.begin()
+        if self.recording:
+            self.recording.add_frame(delta_time)
+
         # 1. Обновляем дорожки
         self.scene["Tracks"].update()
         for track in self.scene["Tracks"]:
             track.on_update(delta_time)
+        frame_profiler.lap("tracks")
 
-        # 2. Обновляем создателей
-        if self.palm_spawner:
-            self.palm_spawner.update(delta_time)
-        if self.rhino_spawner:
-            self.rhino_spawner.update(delta_time)
-        if self.bizon_spawner:
-            self.bizon_spawner.update(delta_time)
-        if self.gazelle_spawner:
-            self.gazelle_spawner.update(delta_time)
-        if self.barrier_spawner:
-            self.barrier_spawner.update(delta_time)
-
-        # 3. Обновляем охотника
-        if self.hunter_sprite and "BarrierObstacles" in self.scene:
-            self.hunter_sprite.check_for_obstacles(self.scene["BarrierObstacles"])
-
-        if self.hunter_sprite:
-            self.hunter_sprite.on_update(delta_time)
-
-        # 4. Обновляем пули
-        if self.bullet_manager:
-            self.shot_indicators.update(self.bullet_manager.shots_fired)
-            self.bullet_manager.update(delta_time)
-
-        # 5. Обновляем анимацию кнопки
-        if self.button_animation:
-            self.button_animation.update(delta_time)
-
-        # 6. Проверяем столкновения пуль с объектами
-        if self.collision_system:
-            self.collision_system.update()
-
-        # 7. Проверяем победу
-        if self.score_manager and self.score_manager.is_victory():
-            print(
-                "🎉 ПОБЕДА! Все цели поражены!"
-                f"Носорогов: {self.score_manager.rhino_kills}, "
-                f"Бизонов: {self.score_manager.bizon_kills}, "
-                f"Газелей: {self.score_manager.gazelle_kills}"
-            )
-
-            # Завершаем игру и переходим на экран победы
-            self._end_game_with_victory()
+        # 2. Обновляем игровую логику (создатели, охотник, пули и столкновения замеряются внутри сессии);
+        #    по часам сессии срабатывают и появления объектов, и отпускание кнопки
+        self.session.update(delta_time)
+        frame_profiler.lap("round_state")
+
+        # 3. Раунд завершился победой или по времени — переходим на экран завершения
+        if self.session.is_over:
+            self._end_game(self.session.victory)
             return  # Прекращаем обновление игры
 
-        # 8. Обновляем индикаторы животных
-        if self.animal_indicators and self.score_manager:
-            self.animal_indicators.update(
-                self.score_manager.gazelle_kills, self.score_manager.bizon_kills, self.score_manager.rhino_kills
-            )
-
-    def on_time_up(self, _delta_time: float):
-        """Вызывается, когда заканчивается время."""
-        if self.score_manager and not self.score_manager.is_victory():
-            print("⏰ Время вышло! Победа не достигнута.")
-            self._end_game_with_defeat()
-            return
+        frame_profiler.total("update")
+
+        self.profile_overlay.update(delta_time)
+
+    def _on_victory(self, event: Victory):
+        """Все цели поражены."""
+        lanes = score_lanes(self.session.lanes)
+        kills = ", ".join(f"{lane.label or key}: {event.score[f'{key}_kills']}" for key, lane in lanes.items())
+        print(f"🎉 ПОБЕДА! Все цели поражены! {kills}")
+
+    def _on_time_up(self, event: TimeUp):
+        """Время раунда вышло."""
+        print("⏰ Время вышло! Победа не достигнута.")
 
     def _end_game(self, victory: bool):
         print("🔄 Переход на экран завершения игры...")
 
-        if self.game_timer:
-            arcade.unschedule(self.game_timer)
-            self.game_timer = None
-
         if self.gallop_player:
-            self.gallop_player.pause()
+            sound_cache.stop_stream(GALLOP_SOUND_PATH)
+            self.gallop_player = None
 
         # Останавливаем всех создателей
-        for spawner in [
-            self.rhino_spawner,
-            self.bizon_spawner,
-            self.gazelle_spawner,
-            self.barrier_spawner,
-            self.palm_spawner,
-        ]:
-            if spawner:
-                spawner.stop_spawning()
+        self.session.finish(victory)
+
+        if frame_profiler.enabled:
+            print(f"⏱️ Профиль кадра за раунд:\n{frame_profiler.report()}")
+        self._save_recording(self.session.get_result())
 
         game_over_view = GameOverView(
-            score_data=self.score_manager.get_score_data(),
-            shots_fired=getattr(self.bullet_manager, "shots_fired", 0),
+            score_data=self.session.score_manager.get_score_data(),
+            shots_fired=self.session.bullet_manager.shots_fired,
             victory=victory,
         )
         self.window.show_view(game_over_view)
 
-    def _end_game_with_defeat(self):
-        self._end_game(victory=False)
-
-    def _end_game_with_victory(self):
-        self._end_game(victory=True)
+    def _save_recording(self, result: dict | None = None):
+        """Дописывает запись ввода раунда в архив (result=None — раунд прерван)."""
+        if not self.recording:
+            return
+        self.recording.result = result
+        try:
+            number = ReplayArchive().append(self.recording)
+            print(f"💾 Запись раунда: #{number} в архиве {REPLAY_ARCHIVE_PATH}")
+        except Exception as e:
+            print(f"❌ Ошибка сохранения записи раунда: {e}")
+        self.recording = None
 
     def on_draw(self):
+        frame_profiler.begin()
         self.clear()
 
-        # Отрисовка в порядке добавления слоёв: Background → Tracks → Effects → Frame
+        # ТВ-экран корпуса → Tracks → животные и препятствия → блик и рамка корпуса
+        cabinet = self.window.cabinet
+        cabinet.draw_under()
         self.scene.draw()
+        frame_profiler.lap("draw.scene")
+        cabinet.draw_over()
+        frame_profiler.lap("draw.overlay")
         self.shot_indicators.draw()  # Рисуем индикаторы выстрелов поверх всего
+        frame_profiler.lap("draw.shot_indicators")
         self.animal_indicators.draw()  # Рисуем индикаторы животных поверх всего
+        frame_profiler.lap("draw.animal_indicators")
         self.button_animation.draw()  # Кнопка стрельбы на автомате поверх всего
+        frame_profiler.lap("draw.button")
+        frame_profiler.total("draw")
+
+        self.profile_overlay.draw()  # Профиль кадра (F3) поверх всего
 
     def on_key_press(self, key, _):
         if key == arcade.key.ESCAPE:
             if self.gallop_player:
-                self.gallop_player.pause()
+                sound_cache.stop_stream(GALLOP_SOUND_PATH)
+            self._save_recording()
             arcade.exit()
 
-        if key == arcade.key.SPACE and self.bullet_manager:
+        if key == arcade.key.F3:
+            self.profile_overlay.toggle()
+
+        if key == arcade.key.SPACE:
+            if self.recording:
+                self.recording.add_press()
             # Пытаемся сделать выстрел и проверяем результат
-            shot_successful = self.bullet_manager.fire()
+            shot_successful = self.session.fire()
 
             # Запускаем анимацию кнопки только если выстрел успешен
             if shot_successful and self.button_animation:
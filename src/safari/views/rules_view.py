@@ -4,87 +4,120 @@
 Отображает фон автомата и поверх — модальное окно с правилами.
 Запускает стартовый звук и позволяет игроку:
 - Пропустить анимацию по нажатию Пробел
-- Перейти к игре
+- Перейти к игре (после окончания фоновой загрузки ресурсов)
 - Выйти по ESC
 
+Если фоновая загрузка не удалась, ошибка выводится на экран вместо правил,
+а переход в игру не выполняется.
+
 После перехода — звук останавливается.
 """
 
 import arcade
 
-from ..constants import (
-    GLARE_EFFECT,
-    SCREEN_HEIGHT,
-    SCREEN_WIDTH,
-    SLOT_MACHINE_FRAME,
-    START_SOUND_PATH,
-    TV_BACKGROUND,
-)
+from ..constants import AVENTURA_FONT_NAME, SCREEN_HEIGHT, SCREEN_WIDTH, START_SOUND_PATH, TEXT_COLOR
+from ..resource_loader import ResourceLoader
+from ..sound_cache import sound_cache
+from ..startup_profile import startup_profile
 from ..ui.rules_window import RulesManager
 
 
 class RulesView(arcade.View):
     """Сцена: окно с правилами игры с анимацией появления и стартовым звуком."""
 
-    def __init__(self):
+    def __init__(self, loader: ResourceLoader | None = None):
+        """
+        Args:
+            loader: Фоновая загрузка ресурсов (None — ресурсы уже загружены)
+        """
         super().__init__()
 
-        # Слои фона
-        self.background_sprites = arcade.SpriteList()  # ТВ-экран
-        self.effect_sprites = arcade.SpriteList()  # Блик
-        self.slot_machine_sprite = arcade.SpriteList()  # Рамка автомата
+        # Фоновая загрузка ресурсов
+        self.loader = loader
+        self.start_requested = False  # Пробел нажат до окончания загрузки
+        self.first_frame_drawn = False
+        self.error_text: arcade.Text | None = None  # Сообщение об ошибке загрузки ресурсов
 
-        # UI: окно правил
-        self.rules_manager = RulesManager(SCREEN_WIDTH, SCREEN_HEIGHT)
+        # UI: окно правил (текстура окна — общая, из корпуса автомата)
+        self.rules_manager = RulesManager(SCREEN_WIDTH, SCREEN_HEIGHT, self.window.cabinet.rules_panel)
 
         # Звук
         self.start_sound_player = None
 
-        # Загружаем спрайты и запускаем звук
+        # Запускаем звук (фон автомата — общий корпус SafariGame.cabinet)
         self.setup()
 
     def setup(self):
-        """Загрузка всех спрайтов фона."""
+        """Запуск стартового звука."""
         try:
-            tv_sprite = arcade.Sprite(TV_BACKGROUND, center_x=SCREEN_WIDTH / 2, center_y=SCREEN_HEIGHT / 2)
-            self.background_sprites.append(tv_sprite)
-
-            glare_sprite = arcade.Sprite(GLARE_EFFECT, center_x=SCREEN_WIDTH / 2, center_y=SCREEN_HEIGHT / 2)
-            self.effect_sprites.append(glare_sprite)
-
-            frame_sprite = arcade.Sprite(SLOT_MACHINE_FRAME, center_x=SCREEN_WIDTH / 2, center_y=SCREEN_HEIGHT / 2)
-            self.slot_machine_sprite.append(frame_sprite)
-
-            # Запускаем стартовый звук
             self.play_start_sound()
         except Exception as e:
-            print(f"❌ Ошибка загрузки спрайтов в RulesView: {e}")
+            print(f"❌ Ошибка запуска RulesView: {e}")
 
     def play_start_sound(self):
-        """Проигрываем стартовый звук."""
+        """Проигрываем стартовый звук (потоком с диска, без повторного декодирования)."""
         try:
             if START_SOUND_PATH.exists():
-                sound = arcade.load_sound(START_SOUND_PATH)
-                self.start_sound_player = arcade.play_sound(sound)
+                self.start_sound_player = sound_cache.play_stream(START_SOUND_PATH)
             else:
                 print(f"⚠️ Файл звука не найден: {START_SOUND_PATH}")
         except Exception as e:
             print(f"❌ Ошибка воспроизведения звука: {e}")
 
+    @property
+    def resources_ready(self) -> bool:
+        """Все ресурсы игры загружены."""
+        return self.loader is None or self.loader.is_done
+
     def on_update(self, delta_time: float):
         self.rules_manager.update(delta_time)
 
+        # Догружаем ресурсы понемногу за кадр (после ошибки загрузка не продолжается)
+        if not self.loader or self.error_text:
+            return
+        try:
+            loaded = self.loader.update()
+        except Exception as e:
+            self.show_load_error(e)
+            return
+        if loaded and self.start_requested:
+            self.start_game()
+
+    def show_load_error(self, error: Exception):
+        """Показывает ошибку фоновой загрузки вместо правил (игра без ресурсов не запускается)."""
+        print(f"❌ Ошибка загрузки ресурсов: {error}")
+        self.rules_manager.hide()
+        self.error_text = arcade.Text(
+            f'НЕ УДАЛОСЬ ЗАГРУЗИТЬ РЕСУРСЫ ИГРЫ:\n{error}\n\nВЫХОД ИЗ ИГРЫ - КЛАВИША "ESC".',
+            SCREEN_WIDTH / 2,
+            SCREEN_HEIGHT / 2,
+            TEXT_COLOR,
+            14,
+            anchor_x="center",
+            anchor_y="center",
+            multiline=True,
+            width=SCREEN_WIDTH - 200,
+            align="center",
+            font_name=AVENTURA_FONT_NAME,
+        )
+
     def on_draw(self):
         self.clear()
 
-        # Отрисовка в порядке слоёв
-        self.background_sprites.draw()
-        self.effect_sprites.draw()
-        self.slot_machine_sprite.draw()
+        # Корпус автомата с затемнением под окном правил одним проходом из кэша
+        self.window.cabinet.draw_backdrop(dimmed=self.rules_manager.show_rules or self.error_text is not None)
 
         # Правила поверх всего
         self.rules_manager.on_draw()
 
+        # Ошибка загрузки ресурсов вместо правил
+        if self.error_text:
+            self.error_text.draw()
+
+        if not self.first_frame_drawn:
+            self.first_frame_drawn = True
+            startup_profile.mark("Первый кадр")
+
     def on_key_press(self, key, _):
         """Обработка нажатия клавиш."""
         if key == arcade.key.ESCAPE:
@@ -92,19 +125,33 @@ class RulesView(arcade.View):
             return True
 
         if key == arcade.key.SPACE:
-            # Пропускаем анимацию — мгновенно устанавливаем состояние
-            self.rules_manager.hide()
-            self.rules_manager.alpha = 255  # чтобы не ждать fade-in
+            if self.error_text:
+                # Без ресурсов игра не запускается — остаётся только выход
+                return True
 
-            # Останавливаем звук
-            if self.start_sound_player:
-                arcade.stop_sound(self.start_sound_player)
-                self.start_sound_player = None
+            if not self.resources_ready:
+                # Переход в игру произойдёт, как только ресурсы загрузятся
+                self.start_requested = True
+                print("⏳ Ресурсы ещё загружаются...")
+                return True
 
-            # Переход в игру
-            from .game_view import GameView
-
-            self.window.show_view(GameView())
+            self.start_game()
             return True
 
         return False
+
+    def start_game(self):
+        """Переход в игру."""
+        # Пропускаем анимацию — мгновенно устанавливаем состояние
+        self.rules_manager.hide()
+        self.rules_manager.alpha = 255  # чтобы не ждать fade-in
+
+        # Останавливаем звук
+        if self.start_sound_player:
+            sound_cache.stop_stream(START_SOUND_PATH)
+            self.start_sound_player = None
+
+        # Переход в игру
+        from .game_view import GameView
+
+        self.window.show_view(GameView(scenario=self.window.scenario))
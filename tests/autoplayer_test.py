@@ -0,0 +1,53 @@
+"""
+Tests for the autoplayer bot and batch runner
+"""
+
+import pytest
+
+from src.safari.simulation.autoplayer import BotPolicy, run_batch, summarize
+from src.safari.simulation.scenario import Scenario
+
+SHORT_ROUND = Scenario(name="short", game_time=8)
+
+
+def test_batch_is_deterministic_across_processes():
+    """Rounds played in a process pool match the same seeds played in-process"""
+    in_process = run_batch("aiming", rounds=2, first_seed=3, workers=1, scenario=SHORT_ROUND)
+    pooled = run_batch("aiming", rounds=2, first_seed=3, workers=2, scenario=SHORT_ROUND)
+
+    assert pooled == in_process
+    assert [result["seed"] for result in pooled] == [3, 4]
+
+
+def test_aiming_bot_wastes_fewer_shots_than_eager_bot():
+    """The aiming policy only fires when a needed animal is on the bullet path"""
+    eager = summarize(run_batch("eager", rounds=2, workers=1, scenario=SHORT_ROUND))
+    aiming = summarize(run_batch("aiming", rounds=2, workers=1, scenario=SHORT_ROUND))
+
+    assert aiming["shots_mean"] < eager["shots_mean"]
+
+
+def test_summarize_reports_victory_time_distribution():
+    """Win rate and victory-time percentiles are computed over won rounds only"""
+    results = [
+        {"victory": True, "elapsed_time": 40.0, "shots_fired": 14},
+        {"victory": True, "elapsed_time": 60.0, "shots_fired": 16},
+        {"victory": False, "elapsed_time": 120.0, "shots_fired": 16},
+        {"victory": False, "elapsed_time": 120.0, "shots_fired": 16},
+    ]
+    summary = summarize(results)
+
+    assert summary["win_rate"] == 0.5
+    assert summary["shots_median"] == 16
+    assert summary["victory_time_p10"] == 40.0
+    assert summary["victory_time_p90"] == 60.0
+
+
+def test_policy_without_should_fire_cannot_be_created():
+    """BotPolicy is abstract: a policy has to decide when to fire"""
+
+    class Idle(BotPolicy):
+        name = "idle"
+
+    with pytest.raises(TypeError):
+        Idle()
@@ -0,0 +1,61 @@
+"""
+Tests for the Monte Carlo difficulty tuner
+"""
+
+from dataclasses import replace
+
+import pytest
+
+from src.safari.constants import RHINO_SPAWN_INTERVAL_MAX, RHINO_SPAWN_INTERVAL_MIN
+from src.safari.resource_manager import setup_resources
+from src.safari.simulation.difficulty_tuner import grid_points, main, parse_grid, point_scenario, wilson_interval
+from src.safari.simulation.game_session import GameSession
+
+
+def test_grid_points_cover_every_combination():
+    """The sweep visits the Cartesian product of the lane scales"""
+    points = grid_points({"rhino": (0.5, 1.0), "palm": (1.0, 2.0, 3.0)})
+
+    assert len(points) == 6
+    assert {"rhino": 0.5, "palm": 3.0} in points
+
+
+def test_point_scenario_scales_spawn_intervals():
+    """A grid point scales the lane's spawn-interval constants inside the session"""
+    setup_resources(headless=True)
+    scenario = point_scenario({"rhino": 0.5})
+    session = GameSession(seed=1, scenario=scenario)
+    session.setup()
+
+    assert session.rhino_spawner.min_interval_ms == RHINO_SPAWN_INTERVAL_MIN * 0.5
+    assert session.rhino_spawner.max_interval_ms == RHINO_SPAWN_INTERVAL_MAX * 0.5
+    assert session.rhino_spawner.spawn_interval >= RHINO_SPAWN_INTERVAL_MIN * 0.5 / 1000
+
+
+def test_spawn_density_applies_to_tuned_intervals():
+    """A scenario combining spawn_density and spawn_intervals divides the tuned range by the density"""
+    setup_resources(headless=True)
+    scenario = replace(point_scenario({"rhino": 0.5}), spawn_density=4.0)
+    session = GameSession(seed=1, scenario=scenario)
+    session.setup()
+
+    assert session.rhino_spawner.min_interval_ms == RHINO_SPAWN_INTERVAL_MIN * 0.5 / 4
+    assert session.rhino_spawner.max_interval_ms == RHINO_SPAWN_INTERVAL_MAX * 0.5 / 4
+    assert session.rhino_spawner.spawn_interval <= RHINO_SPAWN_INTERVAL_MAX * 0.5 / 4 / 1000
+
+
+def test_wilson_interval_and_grid_parsing():
+    """The confidence interval brackets the observed rate; unknown lanes are rejected"""
+    low, high = wilson_interval(10, 100)
+    assert low < 0.1 < high
+    assert wilson_interval(0, 50)[0] == 0.0
+
+    assert parse_grid(["gazelle=0.5,1"]) == {"gazelle": (0.5, 1.0)}
+    with pytest.raises(ValueError):
+        parse_grid(["hunter=1,2"])
+
+
+def test_unknown_policy_is_rejected_before_the_sweep():
+    """--policy only accepts registered autoplayer policies"""
+    with pytest.raises(SystemExit):
+        main(["--policy", "sniper", "--rounds", "1"])
@@ -0,0 +1,31 @@
+"""
+Tests for the reusable entity pool
+"""
+
+from src.safari.entities.entity_pool import EntityPool
+
+
+class _Entity:
+    def __init__(self, value: int = 0):
+        self.value = value
+
+    def reset(self, value: int = 0):
+        self.value = value
+
+
+def test_released_entities_are_reset_and_reused():
+    """A released entity is handed out again after reset() instead of being created"""
+    pool = EntityPool(_Entity, name="entity")
+
+    first = pool.acquire(1)
+    second = pool.acquire(2)
+    pool.release(first)
+    reused = pool.acquire(3)
+
+    assert reused is first
+    assert reused.value == 3
+    assert second.value == 2
+
+    stats = pool.get_stats()
+    assert (stats["hits"], stats["misses"], stats["high_water"]) == (1, 2, 2)
+    assert (stats["in_use"], stats["free"]) == (2, 0)
@@ -0,0 +1,73 @@
+"""
+Tests for round events published through the session event bus
+"""
+
+import pytest
+
+from src.safari.events import AnimalKilled, EventBus, ShotFired, TimeUp, Victory
+from src.safari.resource_manager import setup_resources
+from src.safari.simulation.autoplayer import DELTA_TIME, AimingPolicy
+from src.safari.simulation.game_session import GameSession
+from src.safari.ui.shot_indicator_manager import ShotIndicatorManager
+
+
+@pytest.fixture(scope="module", autouse=True)
+def resources():
+    """Load textures and animations once, without a window"""
+    setup_resources(headless=True)
+
+
+def test_bus_dispatches_by_event_type():
+    """Handlers receive only the event types they subscribed to, until unsubscribed"""
+    bus = EventBus()
+    shots = []
+    bus.subscribe(ShotFired, shots.append)
+
+    bus.publish(ShotFired(1))
+    bus.publish(TimeUp(120.0))
+    bus.unsubscribe(ShotFired, shots.append)
+    bus.publish(ShotFired(2))
+
+    assert shots == [ShotFired(1)]
+
+
+def test_round_publishes_events_only_on_state_changes():
+    """A won round reports every shot and kill once and announces victory exactly once"""
+    session = GameSession(seed=3)
+    events = []
+    for event_type in (ShotFired, AnimalKilled, Victory, TimeUp):
+        session.events.subscribe(event_type, events.append)
+    session.setup()
+    session.start()
+
+    policy = AimingPolicy()
+    policy.reset(session)
+    while not session.is_over:
+        if policy.should_fire(session):
+            session.fire()
+        session.update(DELTA_TIME)
+
+    result = session.get_result()
+    assert result["victory"]
+    assert [event.shots_fired for event in events if isinstance(event, ShotFired)] == list(
+        range(1, result["shots_fired"] + 1)
+    )
+    kills = [event for event in events if isinstance(event, AnimalKilled)]
+    for animal_type in ("rhino", "bizon", "gazelle"):
+        counts = [event.kills for event in kills if event.animal_type == animal_type]
+        assert counts == list(range(1, result[f"{animal_type}_kills"] + 1))
+    assert [type(event) for event in events].count(Victory) == 1
+    assert not any(isinstance(event, TimeUp) for event in events)
+
+
+def test_shot_indicator_turns_off_only_the_lamp_of_the_new_shot():
+    """ShotFired hides exactly one lamp: the one for that shot number"""
+    indicators = ShotIndicatorManager()
+    indicators.setup()
+    indicators.indicators[-1].visible = True  # A lamp that the handler must not touch again
+
+    indicators.on_shot_fired(ShotFired(2))
+
+    assert [lamp.visible for lamp in indicators.indicators[-2:]] == [False, True]
+    assert all(lamp.visible for lamp in indicators.indicators[:-2])
+    assert indicators.active_indicators == 2
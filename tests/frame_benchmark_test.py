@@ -0,0 +1,37 @@
+"""
+Tests for the frame-update benchmark suite
+"""
+
+import json
+
+from src.safari.benchmarks.frame_update import STAGES, compare_with_baseline, dump_report, run_benchmarks
+
+
+def test_benchmark_report_covers_every_stage():
+    """A tiny run produces a machine-readable result for each stage and entity count"""
+    report = run_benchmarks(counts=(2, 5), frames=2, repeats=1)
+
+    assert set(report["results"]) == {"2", "5"}
+    for stages in report["results"].values():
+        assert set(stages) == set(STAGES)
+        for result in stages.values():
+            assert 0 <= result["median_us"] <= result["p95_us"]
+
+
+def test_regression_is_reported_only_above_tolerance():
+    """Only stages slower than the baseline by more than the tolerance are reported"""
+    baseline = {"results": {"10": {"collisions": {"median_us": 100.0}}}}
+    slower = {"results": {"10": {"collisions": {"median_us": 160.0}, "hunter": {"median_us": 5.0}}}}
+    noisy = {"results": {"10": {"collisions": {"median_us": 140.0}}}}
+
+    assert len(compare_with_baseline(slower, baseline, tolerance=0.5)) == 1
+    assert compare_with_baseline(noisy, baseline, tolerance=0.5) == []
+
+
+def test_report_is_written_in_pretty_format_json_style():
+    """The baseline file is already in the format the pretty-format-json hook produces"""
+    report = {"results": {"10": {"frame": {"p95_us": 2.0, "median_us": 1.0}}}, "machine": "x86_64"}
+    text = dump_report(report)
+
+    assert text == json.dumps(json.loads(text), indent=2, ensure_ascii=True, sort_keys=True) + "\n"
+    assert text.index('"machine"') < text.index('"results"')
@@ -0,0 +1,56 @@
+"""
+Tests for the per-stage frame profiler
+"""
+
+import pytest
+
+from src.safari.frame_profiler import FrameProfiler, FrameTimeRing, frame_profiler
+from src.safari.resource_manager import setup_resources
+from src.safari.simulation.game_session import GameSession
+
+
+def test_ring_keeps_only_the_latest_samples():
+    """The ring buffer overwrites the oldest samples and computes percentiles over the filled part"""
+    ring = FrameTimeRing(size=4)
+    assert ring.percentiles() == (0.0, 0.0, 0.0)
+
+    for seconds in (1.0, 1.0, 0.001, 0.002, 0.003, 0.004):
+        ring.push(seconds)
+
+    assert ring.count == 4
+    p50, p95, p99 = ring.percentiles()
+    assert p50 == pytest.approx(2.5)
+    assert p95 <= p99 <= 4.0
+
+
+def test_disabled_profiler_records_nothing():
+    """Laps are ignored until the profiler is enabled"""
+    profiler = FrameProfiler(window=8)
+    profiler.begin()
+    profiler.lap("stage")
+    profiler.total("frame")
+    assert profiler.stages == {}
+
+    profiler.enable()
+    profiler.begin()
+    profiler.lap("stage")
+    profiler.total("frame")
+    assert list(profiler.summary()) == ["stage", "frame"]
+
+
+def test_session_stages_are_profiled():
+    """GameSession.update reports its stages to the shared profiler"""
+    setup_resources(headless=True)
+    session = GameSession(seed=3)
+    session.setup()
+    session.start()
+
+    frame_profiler.enable()
+    try:
+        for _ in range(10):
+            frame_profiler.begin()
+            session.update(1 / 60)
+        assert {"spawners", "hunter", "bullets", "collisions"} <= set(frame_profiler.stages)
+        assert frame_profiler.stages["collisions"].count == 10
+    finally:
+        frame_profiler.enable(False)
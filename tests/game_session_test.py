@@ -0,0 +1,179 @@
+"""
+Tests for the headless GameSession simulation core
+"""
+
+import random
+
+import pytest
+
+from src.safari.constants import GAME_TIME_SECONDS
+from src.safari.resource_manager import setup_resources
+from src.safari.simulation.game_session import GameSession
+
+
+@pytest.fixture(scope="module", autouse=True)
+def resources():
+    """Load textures and animations once, without a window"""
+    setup_resources(headless=True)
+
+
+def test_full_round_without_window():
+    """A full round runs to the time limit without an arcade window"""
+    session = GameSession()
+    session.setup()
+    session.start()
+
+    result = session.run()
+
+    assert session.is_over
+    assert result["victory"] is False
+    assert result["elapsed_time"] >= GAME_TIME_SECONDS
+    assert result["shots_fired"] == 0
+
+
+def test_fire_after_round_is_over_is_ignored():
+    """Shooting is blocked once the round has finished"""
+    session = GameSession(game_time=1)
+    session.setup()
+    session.start()
+    session.run()
+
+    assert session.fire() is False
+    assert session.bullet_manager.shots_fired == 0
+
+
+def _spawn_timeline(seed: int) -> list[tuple[int, ...]]:
+    """Spawn counters of every animal lane sampled once per simulated second"""
+    session = GameSession(game_time=30, seed=seed)
+    session.setup()
+    session.start()
+
+    timeline = []
+    for frame in range(30 * 60):
+        session.update(1 / 60)
+        if frame % 60 == 0:
+            timeline.append(
+                (
+                    session.rhino_spawner.number,
+                    session.bizon_spawner.number,
+                    session.gazelle_spawner.number,
+                    len(session.palm_spawner.active_palms),
+                    len(session.barrier_spawner.active_barriers),
+                )
+            )
+    return timeline
+
+
+def test_same_seed_gives_same_spawn_timeline():
+    """A given seed always reproduces the same spawn timeline"""
+    assert _spawn_timeline(42) == _spawn_timeline(42)
+
+
+def test_lane_streams_are_independent():
+    """Each lane gets its own generator stream derived from the session seed"""
+    session = GameSession(seed=7)
+    session.setup()
+
+    assert session.rhino_spawner.rng is not session.bizon_spawner.rng
+    assert session.bizon_spawner.rng.random() != session.gazelle_spawner.rng.random()
+
+
+def _autofire_round(seed: int, predictive: bool, broadphase: bool = True, jitter: bool = False) -> GameSession:
+    """Round where SPACE is pressed every 1.5 simulated seconds (jitter: frame step varies between 1/90 and 1/30 s)"""
+    session = GameSession(seed=seed, predictive_collisions=predictive)
+    session.collision_system.broadphase = broadphase
+    session.setup()
+    session.start()
+
+    frame_steps = random.Random(seed)  # noqa: S311 # nosec
+    next_shot = 1.5
+    while not session.is_over:
+        session.update(frame_steps.uniform(1 / 90, 1 / 30) if jitter else 1 / 60)
+        if session.elapsed_time >= next_shot:
+            next_shot += 1.5
+            session.fire()
+    return session
+
+
+@pytest.mark.parametrize("jitter", [False, True], ids=["fixed_dt", "jittered_dt"])
+@pytest.mark.parametrize("seed", [1, 4, 7, 12, 31])
+def test_predictive_collisions_match_per_frame_polling(seed, jitter):
+    """Hits scheduled at fire time give the same round as per-frame collision polling"""
+    predictive = _autofire_round(seed, predictive=True, jitter=jitter).get_result()
+    polling = _autofire_round(seed, predictive=False, jitter=jitter).get_result()
+    assert predictive == polling
+
+
+def test_predictive_schedule_adds_windows_only_for_new_targets():
+    """A spawn adds the new target's windows without recomputing bullets already in flight"""
+    session = GameSession(seed=4, predictive_collisions=True)
+    session.setup()
+    session.start()
+    collisions = session.collision_system
+    session.fire()
+    session.update(1 / 60)
+    bullet = session.bullet_manager.sprite_list[-1]
+    version = collisions._bullet_versions[bullet]
+
+    # New gazelle placed on the bullet's path
+    store = session.gazelle_spawner.store
+    session.gazelle_spawner.spawn()
+    newcomer = store.sprites[-1]
+    flight = (newcomer.center_y - bullet.center_y) / bullet.change_y
+    store.x[store.count - 1] = bullet.center_x + (bullet.change_x + store.speed[store.count - 1]) * flight
+    store.sync()
+    session.update(1 / 60)
+
+    assert bullet.is_active
+    assert collisions._bullet_versions[bullet] == version
+    assert collisions._seen_spawns["gazelle"] == session.gazelle_spawner.store.spawned
+    windows = collisions.scheduled_hits + collisions.active_windows
+    assert any(window[6] is newcomer and window[3] == version for window in windows)
+
+
+def test_lane_broadphase_skips_pair_tests_without_changing_round():
+    """Skipping lanes the bullet does not cross saves pair tests and keeps the outcome"""
+    with_broadphase = _autofire_round(4, predictive=False)
+    without_broadphase = _autofire_round(4, predictive=False, broadphase=False)
+
+    assert with_broadphase.get_result() == without_broadphase.get_result()
+    assert with_broadphase.collision_system.pair_tests_saved_total > 0
+    assert without_broadphase.collision_system.pair_tests_saved_total == 0
+
+
+def test_round_reuses_pooled_entities():
+    """Despawned animals, obstacles and bullets come back from the pools"""
+    session = _autofire_round(4, predictive=False)
+    stats = {pool["name"]: pool for pool in session.get_pool_stats()}
+
+    for name in ("gazelle", "palm", "barrier", "bullet"):
+        assert stats[name]["hits"] > 0
+        assert stats[name]["misses"] == stats[name]["high_water"]
+    assert stats["bullet"]["in_use"] == len(session.bullet_manager.sprite_list)
+
+
+def test_every_entity_is_owned_by_exactly_one_sprite_list():
+    """Spawners and the bullet manager share their layer instead of keeping a second list"""
+    session = GameSession(seed=4)
+    session.setup()
+    session.start()
+    for frame in range(1, 1200):
+        session.update(1 / 60)
+        if frame % 90 == 0:
+            session.fire()
+
+    assert session.gazelle_spawner.active_animals is session.layers["GazelleAnimals"]
+    assert session.palm_spawner.active_palms is session.layers["PalmObstacles"]
+    assert session.bullet_manager.active_bullets is session.layers["Bullets"]
+    for sprite_list in session.layers.values():
+        for sprite in sprite_list:
+            assert sprite.sprite_lists == [sprite_list]
+
+
+def test_headless_round_prints_nothing(capsys):
+    """Spawns, kills and shot attempts go to logging, so a round without a window writes nothing to the console"""
+    session = _autofire_round(seed=4, predictive=False)
+    session.fire()
+
+    assert session.score_manager.kills["gazelle"] > 0
+    assert capsys.readouterr() == ("", "")
@@ -0,0 +1,43 @@
+"""
+Tests for the column store of lane entities
+"""
+
+import arcade
+
+from src.safari.entities.lane_store import LaneStore
+
+
+def _sprite(x: float) -> arcade.Sprite:
+    sprite = arcade.Sprite()
+    sprite.center_x = x
+    sprite.center_y = 100
+    return sprite
+
+
+def test_advance_moves_all_entities_and_syncs_sprites():
+    """Movement is applied to every row and copied back to the sprites"""
+    store = LaneStore(capacity=1)
+    sprites = [_sprite(500), _sprite(600), _sprite(700)]
+    for sprite in sprites:
+        store.add(sprite, speed=60, despawn_x=0)
+
+    store.advance(0.5)
+    store.sync()
+
+    assert [sprite.center_x for sprite in sprites] == [470, 570, 670]
+
+
+def test_expired_and_killed_entities_are_removed():
+    """Despawn and kill bookkeeping run as one mask over the lane"""
+    store = LaneStore()
+    left, middle, right = _sprite(10), _sprite(300), _sprite(600)
+    for sprite in (left, middle, right):
+        store.add(sprite, speed=20, despawn_x=5)
+
+    store.kill(middle)
+    store.advance(1.0)
+
+    assert store.dead_sprites() == [middle]
+    assert store.remove(store.expired(remove_dead=True)) == [left, middle]
+    assert store.sprites == [right]
+    assert store.x[: store.count].tolist() == [580]
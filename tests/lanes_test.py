@@ -0,0 +1,95 @@
+"""
+Tests for the declarative lane table
+"""
+
+from dataclasses import replace
+
+import pytest
+
+from src.safari.constants import GAZELLE_Y_OFFSET, TRACK_INDEX_PALM, TRACK_POSITIONS
+from src.safari.resource_manager import setup_resources
+from src.safari.simulation.game_session import GameSession
+from src.safari.simulation.lanes import GAZELLE_LANE, LANES, score_lanes
+from src.safari.simulation.replay_archive import KILL_COLUMNS
+from src.safari.ui.animal_indicator_manager import AnimalIndicatorManager
+
+
+@pytest.fixture(scope="module", autouse=True)
+def resources():
+    """Load textures and animations once, without a window"""
+    setup_resources(headless=True)
+
+
+def _session(lanes=LANES) -> GameSession:
+    session = GameSession(seed=3, endless=True, lanes=lanes)
+    session.setup()
+    session.start()
+    return session
+
+
+def test_default_table_builds_collision_pairs_and_hit_handlers():
+    """Bullets are tested against the colliding lanes in table order, only targets score"""
+    session = _session()
+    collisions = session.collision_system
+
+    assert [target_type for _, target_type in collisions.collision_pairs] == ["rhino", "bizon", "gazelle", "palm"]
+    assert set(collisions.hit_handlers) == {"rhino", "bizon", "gazelle"}
+    assert collisions.removed_on_hit == {"rhino", "bizon", "gazelle"}
+    assert list(session.layers)[:5] == [lane.layer for lane in LANES]
+
+
+def test_single_kill_lane_stops_spawning_after_hit():
+    """A hit on the rhino lane counts the kill and stops new rhinos"""
+    session = _session()
+    rhino = session.rhino_spawner.active_animals[0]
+    bullet = session.bullet_manager.pool.acquire(0, 0)
+
+    session.collision_system._handle_hit(bullet, rhino, "rhino")
+
+    assert session.score_manager.kills["rhino"] == 1
+    assert not session.rhino_spawner.is_active
+    assert session.rhino_spawner.next_spawn is None
+
+
+def test_extra_lane_is_one_table_entry():
+    """A stress lane reuses a spawner on another track, with its own speed, and scores into its key"""
+    extra = replace(GAZELLE_LANE, name="gazelle_2", layer="ExtraGazelleAnimals", track_index=TRACK_INDEX_PALM, speed=90)
+    session = _session((*LANES, extra))
+    spawner = session.lane_spawners["gazelle_2"]
+    gazelle = spawner.active_animals[0]
+
+    assert spawner.active_animals is session.layers["ExtraGazelleAnimals"]
+    assert gazelle.center_y == TRACK_POSITIONS[TRACK_INDEX_PALM][1] + GAZELLE_Y_OFFSET
+    assert spawner.store.speed[0] == 90
+    assert "gazelle_2" in session.collision_system.hit_handlers
+
+    bullet = session.bullet_manager.pool.acquire(0, 0)
+    session.collision_system._handle_hit(bullet, gazelle, "gazelle_2")
+
+    assert session.score_manager.kills["gazelle"] == 1
+    assert set(session.score_manager.get_score_data()) == {"rhino_kills", "bizon_kills", "gazelle_kills"}
+
+
+def test_kill_counters_follow_the_table():
+    """Indicator groups and archive kill columns come from the target lanes; a stress lane shares its key"""
+    extra = replace(GAZELLE_LANE, name="gazelle_2", track_index=TRACK_INDEX_PALM)
+    indicators = AnimalIndicatorManager((*LANES, extra))
+    indicators.setup()
+    indicators.update({"gazelle": 3, "rhino": 1})
+
+    assert list(score_lanes((*LANES, extra))) == ["rhino", "bizon", "gazelle"]
+    assert KILL_COLUMNS == ("rhino_kills", "bizon_kills", "gazelle_kills")
+    assert {key: len(group) for key, group in indicators.indicators.items()} == {"rhino": 1, "bizon": 4, "gazelle": 8}
+    assert [sprite.visible for sprite in indicators.indicators["gazelle"]] == [True] * 3 + [False] * 5
+    assert indicators.indicators["rhino"][0].visible
+
+
+def test_lane_layers_stay_in_step_with_their_stores():
+    """Despawned objects are popped by row, so every layer keeps the store's sprite order"""
+    session = _session()
+    for _ in range(20 * 60):
+        session.update(1 / 60)
+
+    for spawner in session.lane_spawners.values():
+        assert list(spawner.sprite_list) == spawner.store.sprites
+        assert spawner.pool.in_use == len(spawner.sprite_list)
@@ -0,0 +1,58 @@
+"""
+Tests for round recording and deterministic replay
+"""
+
+import random
+
+import pytest
+
+from src.safari.resource_manager import setup_resources
+from src.safari.simulation.game_session import GameSession
+from src.safari.simulation.replay import RoundRecording, replay, verify
+
+
+@pytest.fixture(scope="module", autouse=True)
+def resources():
+    """Load textures and animations once, without a window"""
+    setup_resources(headless=True)
+
+
+def _record_round(seed: int) -> RoundRecording:
+    """Plays a round the way GameView drives it: jittery frame times and SPACE between frames"""
+    player = random.Random(seed)  # noqa: S311 # nosec
+    recording = RoundRecording(seed=seed)
+    session = GameSession(seed=seed)
+    session.setup()
+    session.start()
+
+    while not session.is_over:
+        if player.random() < 0.05:
+            recording.add_press()
+            session.fire()
+        delta_time = player.uniform(1 / 75, 1 / 45)
+        recording.add_frame(delta_time)
+        session.update(delta_time)
+
+    recording.result = session.get_result()
+    return recording
+
+
+def test_replay_reproduces_the_recorded_round(tmp_path):
+    """A saved recording replays to exactly the same score, shots and elapsed time"""
+    recording = _record_round(seed=11)
+    assert recording.presses
+
+    loaded = RoundRecording.load(recording.save(tmp_path / "round.json.gz"))
+    result = replay(loaded)
+
+    assert verify(loaded, result) == []
+    assert result == recording.result
+
+
+def test_verify_reports_mismatches():
+    """A tampered recording is reported as a mismatch"""
+    recording = _record_round(seed=12)
+    recording.presses = []
+
+    mismatches = verify(recording, replay(recording))
+    assert any(mismatch.startswith("shots_fired") for mismatch in mismatches)
@@ -0,0 +1,69 @@
+"""
+Tests for background resource loading
+"""
+
+import pytest
+
+from src.safari.resource_loader import ResourceLoader
+from src.safari.resource_manager import Textures, loaded_textures, register_resources
+
+
+class _RecordingAtlas:
+    """Collects textures instead of uploading them to the GPU"""
+
+    def __init__(self):
+        self.textures = []
+
+    def add(self, texture):
+        self.textures.append(texture)
+
+
+def test_textures_are_decoded_in_background_and_uploaded_in_slices():
+    """Decoding runs on a worker thread, uploads are spread over frames within the budget"""
+    register_resources()
+    loader = ResourceLoader(upload_budget=0.0)
+    atlas = _RecordingAtlas()
+
+    assert not loader.update(atlas)  # Not started yet: nothing to upload
+
+    loader.start()
+    assert loader.wait(timeout=30)
+    assert Textures.rhino_animation is not None
+
+    frames = 0
+    while not loader.update(atlas):
+        frames += 1
+
+    expected = loaded_textures()
+    assert atlas.textures == expected
+    assert frames == len(expected) - 1  # Zero budget: one texture per frame
+    assert loader.uploaded == len(expected)
+
+
+def test_decode_failure_is_raised_and_never_reports_done(monkeypatch):
+    """A worker-thread error surfaces in the main thread instead of starting a round without resources"""
+
+    def broken_load():
+        raise OSError("missing atlas")
+
+    monkeypatch.setattr("src.safari.resource_loader.load_game_resources", broken_load)
+    loader = ResourceLoader(preload_modules=False)
+    loader.start()
+
+    with pytest.raises(OSError, match="missing atlas"):
+        loader.wait(timeout=30)
+    with pytest.raises(OSError, match="missing atlas"):
+        loader.update(_RecordingAtlas())
+    assert not loader.is_done
+
+
+def test_missing_texture_fails_the_load(monkeypatch):
+    """A missing texture is raised by the loader instead of leaving an empty slot in Textures"""
+    register_resources()
+    monkeypatch.setattr("src.safari.resource_manager.BUTTON_PRESSED_SPRITE", ":slot_machine:/images/missing.png")
+    loader = ResourceLoader(preload_modules=False)
+    loader.start()
+
+    with pytest.raises(FileNotFoundError):
+        loader.wait(timeout=30)
+    assert not loader.is_done
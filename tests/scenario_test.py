@@ -0,0 +1,61 @@
+"""
+Tests for launch scenarios
+"""
+
+import json
+
+import pytest
+
+from src.safari.resource_manager import setup_resources
+from src.safari.simulation.game_session import GameSession
+from src.safari.simulation.scenario import SCENARIOS, load_scenario
+
+
+@pytest.fixture(scope="module", autouse=True)
+def resources():
+    """Load textures and animations once, without a window"""
+    setup_resources(headless=True)
+
+
+def _spawned_animals(scenario_name: str, seconds: float = 10) -> int:
+    """Number of animals spawned over the first seconds of a round"""
+    session = GameSession(seed=7, scenario=SCENARIOS[scenario_name], endless=True)
+    session.setup()
+    session.start()
+    for _ in range(int(seconds * 60)):
+        session.update(1 / 60)
+    return sum(spawner.pool.misses + spawner.pool.hits for spawner in session.spawners[:3])
+
+
+def test_load_builtin_and_json_scenarios(tmp_path):
+    """Scenarios load by name or from a JSON file, unknown fields are rejected"""
+    assert load_scenario("dense").spawn_density == 10.0
+
+    path = tmp_path / "custom.json"
+    path.write_text(json.dumps({"spawn_density": 3, "max_shots": None}))
+    scenario = load_scenario(path)
+    assert scenario.name == "custom"
+    assert scenario.spawn_density == 3
+    assert scenario.max_shots is None
+
+    path.write_text(json.dumps({"spawn_rate": 3}))
+    with pytest.raises(ValueError):
+        load_scenario(path)
+    with pytest.raises(ValueError):
+        load_scenario("no_such_scenario")
+
+
+def test_dense_scenario_spawns_more_animals():
+    """The dense scenario spawns animals several times more often than the default one"""
+    assert _spawned_animals("dense") > 3 * _spawned_animals("default")
+
+
+def test_auto_fire_with_unlimited_ammo():
+    """Auto-fire keeps shooting past the regular ammo limit"""
+    session = GameSession(seed=7, scenario=SCENARIOS["unlimited_ammo"], endless=True)
+    session.setup()
+    session.start()
+    for _ in range(60 * 60):
+        session.update(1 / 60)
+
+    assert session.bullet_manager.shots_fired > 100
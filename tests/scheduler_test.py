@@ -0,0 +1,51 @@
+"""
+Tests for the min-heap game scheduler
+"""
+
+import pytest
+
+from src.safari.resource_manager import setup_resources
+from src.safari.scheduler import Scheduler
+from src.safari.simulation.game_session import GameSession
+
+
+@pytest.fixture(scope="module", autouse=True)
+def resources():
+    """Load textures and animations once, without a window"""
+    setup_resources(headless=True)
+
+
+def test_due_calls_fire_in_time_order_and_cancelled_calls_are_skipped():
+    """Only due calls run, earliest first, ties in scheduling order, cancelled ones never"""
+    scheduler = Scheduler()
+    fired = []
+    scheduler.schedule(0.3, fired.append, "late")
+    scheduler.schedule(0.1, fired.append, "first")
+    scheduler.schedule(0.1, fired.append, "second")
+    cancelled = scheduler.schedule(0.2, fired.append, "cancelled")
+    scheduler.cancel(cancelled)
+
+    assert scheduler.advance(0.25) == 2
+    assert fired == ["first", "second"]
+    assert scheduler.pending == 1
+
+    # A call scheduled for an already passed time fires within the same advance
+    scheduler.schedule(0.05, lambda: scheduler.schedule(0.0, fired.append, "chained"))
+    scheduler.advance(0.1)
+    assert fired == ["first", "second", "late", "chained"]
+    assert scheduler.pending == 0
+
+
+def test_session_runs_spawns_and_round_end_on_one_clock():
+    """Spawners share the session scheduler and the round ends when its time-up call fires"""
+    session = GameSession(game_time=5, seed=3)
+    session.setup()
+    session.start()
+
+    assert all(spawner.scheduler is session.scheduler for spawner in session.spawners)
+    # One pending spawn per lane plus the round end
+    assert session.scheduler.pending == len(session.spawners) + 1
+
+    result = session.run()
+    assert result["elapsed_time"] == pytest.approx(5, abs=1 / 60)
+    assert session.scheduler.pending == 0
@@ -0,0 +1,27 @@
+"""
+Tests for the process-wide sound cache
+"""
+
+from src.safari.constants import SHOT_SOUND_PATH, SOUNDS_PATH
+from src.safari.sound_cache import SoundCache
+
+
+def test_effect_is_loaded_once():
+    """Repeated requests for an effect return the same object without reloading the file"""
+    cache = SoundCache()
+
+    first = cache.effect(SHOT_SOUND_PATH)
+    assert cache.effect(SHOT_SOUND_PATH) is first
+    assert cache.decodes == 1
+
+
+def test_missing_stream_is_not_retried():
+    """A stream that failed to open is remembered and does not start a player"""
+    cache = SoundCache()
+    missing = SOUNDS_PATH / "missing.ogg"
+
+    assert cache.play_stream(missing, loop=True) is None
+    assert cache.play_stream(missing, loop=True) is None
+    assert cache.decodes == 1
+    assert cache.players == {}
+    cache.stop_stream(missing)
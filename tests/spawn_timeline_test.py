@@ -0,0 +1,83 @@
+"""
+Tests for the spawn timeline precomputed at round start
+"""
+
+from itertools import pairwise
+
+import arcade
+import pytest
+
+from src.safari.entities.obstacles.palm_spawner import PalmSpawner
+from src.safari.resource_manager import setup_resources
+from src.safari.simulation.game_session import GameSession
+
+
+@pytest.fixture(scope="module", autouse=True)
+def resources():
+    """Load textures and animations once, without a window"""
+    setup_resources(headless=True)
+
+
+def _spawn_times(delta_time: float, seconds: float = 30) -> dict[str, list[float]]:
+    session = GameSession(game_time=seconds, seed=9)
+    session.setup()
+    session.start()
+    for _ in range(int(seconds / delta_time)):
+        session.update(delta_time)
+    return session.spawn_timeline.to_dict()["lanes"]
+
+
+def test_round_start_plans_every_lane_and_spawners_follow_it():
+    """Every lane is planned past the round end and spawns happen exactly at the planned times"""
+    session = GameSession(game_time=20, seed=9)
+    session.setup()
+    session.start()
+    timeline = session.spawn_timeline
+
+    assert set(timeline.lanes) == set(session.lane_spawners)
+    for name, times in timeline.lanes.items():
+        assert times == sorted(times)
+        assert times[-1] > 20
+        assert times is session.lane_spawners[name].spawn_times
+
+    session.run()
+
+    planned = timeline.spawns_before(session.elapsed_time)
+    for name in ("bizon", "gazelle", "palm"):
+        pool = session.lane_spawners[name].pool
+        assert pool.hits + pool.misses == planned[name] + 1  # Plus the one spawned at round start
+
+
+def test_planned_times_do_not_depend_on_frame_step():
+    """The schedule is drawn up front, so a coarser frame step sees the same spawn times"""
+    assert _spawn_times(1 / 60) == _spawn_times(1 / 30)
+
+
+def test_spawner_extends_its_schedule_when_it_runs_out():
+    """A spawner outside a session plans further ahead on its own"""
+    spawner = PalmSpawner(arcade.SpriteList())
+    planned = len(spawner.spawn_times)
+    for _ in range(30 * 60):
+        spawner.update(1 / 60)
+
+    assert spawner.cursor > planned
+    assert len(spawner.spawn_times) > spawner.cursor
+
+
+def test_retuned_lane_is_planned_to_the_round_end():
+    """Changing a lane's interval range mid-round re-plans the remaining spawns up to the round horizon"""
+    session = GameSession(game_time=60, seed=9)
+    session.setup()
+    session.start()
+    spawner = session.gazelle_spawner
+    for _ in range(10 * 60):
+        session.update(1 / 60)
+    consumed = spawner.spawn_times[: spawner.cursor]
+
+    spawner.set_spawn_interval(500, 1000)
+
+    assert spawner.spawn_times[: spawner.cursor] == consumed
+    assert spawner.spawn_times[-1] > 60
+    gaps = [later - earlier for earlier, later in pairwise(spawner.spawn_times[spawner.cursor :])]
+    assert all(0.5 <= gap <= 1.0 for gap in gaps)
+    assert spawner.spawn_times is session.spawn_timeline.lanes["gazelle"]
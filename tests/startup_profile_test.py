@@ -0,0 +1,38 @@
+from src.safari.main import parse_args
+from src.safari.startup_profile import StartupProfile
+
+
+def test_startup_profile_option_is_parsed():
+    assert parse_args(["--startup-profile"]).startup_profile
+    assert not parse_args([]).startup_profile
+
+
+def test_frame_profile_option_is_parsed():
+    assert parse_args(["--frame-profile"]).frame_profile
+    assert not parse_args([]).frame_profile
+
+
+def test_replays_are_recorded_only_on_request():
+    assert parse_args(["--record-replays"]).record_replays
+    assert not parse_args([]).record_replays
+
+
+def test_profile_records_phases_and_marks_only_when_enabled():
+    """Phases are timed only after enable(), marks are kept once"""
+    profile = StartupProfile()
+    with profile.phase("disabled"):
+        pass
+    assert profile.phases == []
+
+    profile.enable()
+    with profile.phase("load_textures"):
+        pass
+    profile.mark("first frame")
+    profile.mark("first frame")
+
+    assert [phase[0] for phase in profile.phases] == ["load_textures"]
+    assert list(profile.marks) == ["first frame"]
+
+    report = profile.report()
+    assert "load_textures" in report
+    assert "first frame" in report
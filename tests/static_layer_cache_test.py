@@ -0,0 +1,52 @@
+"""
+Tests for the static layer cache bookkeeping (rendering itself needs a GL context)
+"""
+
+import arcade
+
+from src.safari.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from src.safari.resource_manager import setup_resources
+from src.safari.ui.cabinet import Cabinet
+from src.safari.ui.rules_window import RulesManager
+from src.safari.ui.static_layer_cache import StaticLayerCache
+
+
+def test_cache_is_a_single_full_screen_sprite_until_invalidated():
+    """The cache draws one full-screen sprite and re-renders only after invalidate()"""
+    layers = [arcade.SpriteList(), arcade.SpriteList()]
+    cache = StaticLayerCache("test_layers", layers)
+
+    assert cache.is_dirty
+    assert len(cache.sprite_list) == 1
+    assert cache.texture.size == (SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    cache.is_dirty = False
+    cache.invalidate()
+    assert cache.is_dirty
+
+
+def test_cabinet_caches_share_the_same_chrome_sprites():
+    """Every cabinet cache is built over the same once-created sprite lists"""
+    setup_resources(headless=True)
+    cabinet = Cabinet()
+
+    chrome = [cabinet.background_sprites, cabinet.effect_sprites, cabinet.slot_machine_sprite]
+    assert cabinet.overlay.layers == chrome[1:]
+    assert cabinet.backdrop.layers == chrome
+    assert cabinet.dimmed_backdrop.layers == [*chrome, cabinet.dim_sprites]
+    assert all(len(layer) == 1 for layer in cabinet.dimmed_backdrop.layers)
+
+
+def test_rules_screens_share_the_cabinet_rules_panel():
+    """Every rules screen reuses the one panel texture kept on the cabinet"""
+    setup_resources(headless=True)
+    cabinet = Cabinet()
+    panel = cabinet.rules_panel
+
+    first = RulesManager(SCREEN_WIDTH, SCREEN_HEIGHT, cabinet.rules_panel)
+    second = RulesManager(SCREEN_WIDTH, SCREEN_HEIGHT, cabinet.rules_panel)
+    assert first.panel is second.panel is panel
+
+    panel.rendered = True
+    cabinet.invalidate()
+    assert not panel.rendered
@@ -0,0 +1,45 @@
+import arcade
+from PIL import Image
+
+from src.safari.constants import IMAGES_PATH, IMAGES_PREFIX, RHINO_1_SPRITE
+from src.safari.texture_atlas import TextureAtlas, atlas_sources, pack_regions
+
+
+def test_packed_regions_do_not_overlap():
+    """Shelf packing keeps every region inside the atlas and apart from the others"""
+    sizes = {f"image_{i}": (30 + i * 7 % 50, 10 + i * 13 % 40) for i in range(40)}
+    regions, height = pack_regions(sizes, width=256, padding=2)
+
+    boxes = list(regions.values())
+    for i, (x, y, w, h) in enumerate(boxes):
+        assert x >= 0 and x + w <= 256 and y >= 0 and y + h <= height
+        for x2, y2, w2, h2 in boxes[i + 1 :]:
+            assert x + w <= x2 or x2 + w2 <= x or y + h <= y2 or y2 + h2 <= y
+
+
+def test_committed_atlas_matches_source_images():
+    """The atlas in resources/atlas is rebuilt whenever an image changes (make atlas)"""
+    atlas = TextureAtlas.load()
+    assert atlas is not None
+
+    sources = atlas_sources()
+    assert set(atlas.regions) == set(sources)
+    assert "animals/rhino/run_1.png" in sources
+    assert "ui/bg_back.png" not in sources
+
+    for name, path in sources.items():
+        x, y, w, h = atlas.regions[name]
+        region = atlas.image.crop((x, y, x + w, y + h))
+        assert region.tobytes() == Image.open(path).convert("RGBA").tobytes(), name
+
+
+def test_atlas_texture_has_same_hit_box_as_file_texture():
+    """Textures cut from the atlas collide exactly like the ones loaded from single files"""
+    arcade.resources.add_resource_handle("slot_machine", IMAGES_PATH.parent)
+    atlas = TextureAtlas.load()
+
+    from_atlas = atlas.get_texture(RHINO_1_SPRITE.removeprefix(IMAGES_PREFIX))
+    from_file = arcade.load_texture(RHINO_1_SPRITE)
+
+    assert from_atlas.size == from_file.size
+    assert from_atlas.hit_box_points == from_file.hit_box_points